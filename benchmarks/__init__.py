@@ -0,0 +1,6 @@
+"""
+timing and memory benchmarks of the lfsr_library hot paths
+run from the repository root with python -m benchmarks, see python -m benchmarks --help
+"""
+from .cases import CASES
+from .runner import run_suite, save_baseline, load_baseline, compare
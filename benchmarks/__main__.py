@@ -0,0 +1,37 @@
+"""
+python -m benchmarks [cases ...] [--quick] [--repeat N] [--save PATH] [--compare PATH] [--tolerance T]
+exits with status 1 when a comparison finds a regression
+"""
+import argparse
+import sys
+from .cases import CASES
+from .runner import REPEAT, TOLERANCE, run_suite, save_baseline, load_baseline, compare
+from .runner import format_results, format_comparison
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='benchmark lfsr_library hot paths')
+    parser.add_argument('cases', nargs='*', help=f"cases to run, all by default: {', '.join(CASES)}")
+    parser.add_argument('--quick', action='store_true', help='smaller sizes, for a fast check')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='timed runs per point, the best is kept')
+    parser.add_argument('--save', metavar='PATH', help='save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a JSON baseline')
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE, help='allowed slowdown or memory growth, as a fraction')
+    args = parser.parse_args(argv)
+
+    results: dict = run_suite(
+        args.cases, quick=args.quick, repeat=args.repeat, progress=lambda name: print(f'running {name}...', file=sys.stderr)
+    )
+    print(format_results(results))
+    if args.save:
+        save_baseline(results, args.save)
+
+    if args.compare:
+        rows: list[dict] = compare(results, load_baseline(args.compare), args.tolerance)
+        print(f'\ncompared with {args.compare}:')
+        print(format_comparison(rows))
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+benchmark cases, each a setup function taking a size and returning the call to time
+setup work (building registers and input streams) is kept out of the timed call
+"""
+import random
+from typing import Callable, NamedTuple
+import numpy as np
+from lfsr_library import Analyser, LFSR, MultiLFSR, ItValidator, NoisySolver, BitStream
+
+SEED: int = 0x2545F491
+DEGREE: int = 31
+TAPS: list[int] = [0, 3]
+BATCH_BITS: int = 10**5 # bits per seed of generate_batch
+BIT_ERROR_RATE: float = 0.01 # noisy_solve
+
+class Case(NamedTuple):
+    setup: Callable # size -> zero-argument callable timed by the runner
+    sizes: tuple[int]
+    quick_sizes: tuple[int]
+    unit: str # 'bits' when size counts stream bits, giving a throughput, 'degree' or 'seeds'
+
+def lfsr_stream(degree: int, nbits: int) -> BitStream:
+    """
+    nbits of a maximal-length LFSR of the catalogue, from a seed fixed by degree
+    """
+    lfsr: LFSR = LFSR.from_catalogue(degree)
+    lfsr.generate_packed(random.Random(degree).getrandbits(degree) | 1, nbits - 1)
+    return lfsr.bitstream
+
+def lfsr_generate(size: int) -> Callable:
+    lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+    return lambda: lfsr.generate(SEED, size - 1)
+
+def lfsr_generate_packed(size: int) -> Callable:
+    lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+    return lambda: lfsr.generate_packed(SEED, size - 1)
+
+def lfsr_generate_batch(size: int) -> Callable:
+    lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+    seeds: list[int] = [SEED + seed for seed in range(size)]
+    return lambda: lfsr.generate_batch(seeds, BATCH_BITS)
+
+def multi_generate(size: int) -> Callable:
+    multilfsr: MultiLFSR = MultiLFSR(degree=16, lfsr_list=[
+        LFSR(degree=16, tap_positions=[0, 2, 3, 5]), LFSR(degree=16, tap_positions=[0, 1, 3, 12])
+    ])
+    return lambda: multilfsr.generate(0xACE1, size)
+
+def lin_solve(size: int) -> Callable:
+    analyser: Analyser = Analyser(stream=lfsr_stream(size, 2*size))
+    return lambda: analyser.lin_solve(degree=size)
+
+def iter_solve(size: int) -> Callable:
+    analyser: Analyser = Analyser(stream=lfsr_stream(20, size))
+    return analyser.iter_solve
+
+def randomness(size: int) -> Callable:
+    analyser: Analyser = Analyser(stream=lfsr_stream(DEGREE, size))
+    return analyser.randomness
+
+def running_probability(size: int) -> Callable:
+    analyser: Analyser = Analyser(stream=str(lfsr_stream(DEGREE, size)))
+    return lambda: analyser.running_probability(max_points=1000)
+
+def itvalidator(size: int) -> Callable:
+    validator: ItValidator = ItValidator(stream=lfsr_stream(20, size))
+    return validator.validate
+
+def noisy_solve(size: int) -> Callable:
+    errors: np.ndarray = np.random.default_rng(SEED).random(size) < BIT_ERROR_RATE
+    stream: BitStream = lfsr_stream(DEGREE, size) ^ BitStream.from_bits(errors.astype(np.uint8))
+    solver: NoisySolver = NoisySolver(stream=stream, sampling_seed=SEED)
+    return solver.solve
+
+CASES: dict[str, Case] = {
+    'lfsr_generate': Case(lfsr_generate, (10**4, 10**5, 10**6), (10**3, 10**4), 'bits'),
+    'lfsr_generate_packed': Case(lfsr_generate_packed, (10**6, 10**7, 10**8), (10**5, 10**6), 'bits'),
+    'lfsr_generate_batch': Case(lfsr_generate_batch, (10, 100, 1000, 10000), (10, 100), 'seeds'),
+    'multi_generate': Case(multi_generate, (10**4, 10**5, 10**6), (10**3, 10**4), 'bits'),
+    'lin_solve': Case(lin_solve, (64, 128, 256, 512, 1024), (64, 128, 256), 'degree'),
+    'iter_solve': Case(iter_solve, (128, 256, 512, 1024), (64, 128, 256), 'bits'),
+    'randomness': Case(randomness, (10**6, 10**7, 10**8), (10**5, 10**6), 'bits'),
+    'running_probability': Case(running_probability, (10**5, 10**6, 10**7), (10**4, 10**5), 'bits'),
+    'itvalidator': Case(itvalidator, (128, 256, 512), (64, 128), 'bits'),
+    'noisy_solve': Case(noisy_solve, (10**5, 10**6, 10**7), (10**4, 10**5), 'bits'),
+}
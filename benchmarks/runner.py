@@ -0,0 +1,165 @@
+"""
+measure cases, fit scaling curves and compare against saved JSON baselines
+"""
+import json
+import math
+import platform
+import time
+import tracemalloc
+import numpy as np
+from .cases import CASES, Case
+
+REPEAT: int = 3 # timed runs per point, the best is kept
+TOLERANCE: float = 0.25 # slowdown or memory growth beyond which a point is a regression
+
+def time_call(run, repeat: int) -> float:
+    """
+    best wall time of repeat calls, in seconds
+    """
+    best: float = math.inf
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(run) -> int:
+    """
+    peak bytes allocated during one call, python objects and numpy buffers alike
+    timed apart from time_call, tracing slows allocation down
+    """
+    tracemalloc.start()
+    try:
+        run()
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def scaling_exponent(sizes: list[int], seconds: list[float]) -> float:
+    """
+    slope of log time against log size, e.g. 1 for linear and 2 for quadratic cost
+    None with fewer than two points
+    """
+    if len(sizes) < 2:
+        return None
+    return float(np.polyfit(np.log(sizes), np.log(np.maximum(seconds, 1e-9)), 1)[0])
+
+def run_case(case: Case, sizes: tuple[int], repeat: int) -> dict:
+    """
+    time, peak memory and throughput at each size, with the scaling exponent over them
+    """
+    points: list[dict] = []
+    for size in sizes:
+        run = case.setup(size)
+        seconds: float = time_call(run, repeat)
+        points += [{
+            'size': size,
+            'seconds': seconds,
+            'peak_bytes': peak_memory(run),
+            'bits_per_second': size / seconds if case.unit == 'bits' and seconds > 0 else None
+        }]
+    return {
+        'unit': case.unit,
+        'points': points,
+        'scaling': scaling_exponent([p['size'] for p in points], [p['seconds'] for p in points])
+    }
+
+def run_suite(names: list[str] = None, quick: bool = False, repeat: int = REPEAT, progress=None) -> dict:
+    """
+    run the named cases, all by default, at their quick sizes if quick
+    progress, if passed, is called with each case name before it runs
+    """
+    names: list[str] = list(CASES) if not names else names
+    unknown: list[str] = [name for name in names if name not in CASES]
+    if unknown:
+        raise KeyError(f"Unknown benchmark cases {unknown}, choose from {list(CASES)}")
+
+    results: dict = {}
+    for name in names:
+        if progress is not None:
+            progress(name)
+        case: Case = CASES[name]
+        results[name] = run_case(case, case.quick_sizes if quick else case.sizes, repeat)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'quick': quick,
+            'repeat': repeat,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'cases': results
+    }
+
+def save_baseline(results: dict, path: str) -> None:
+    with open(path, 'w') as file:
+        json.dump(results, file, indent=2)
+
+def load_baseline(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+def compare(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> list[dict]:
+    """
+    time and peak memory ratios, current over baseline, at each size measured in both
+    a point is a regression when either ratio exceeds 1 + tolerance
+    """
+    rows: list[dict] = []
+    for name, case in results['cases'].items():
+        try:
+            base_points: dict = {p['size']: p for p in baseline['cases'][name]['points']}
+        except KeyError:
+            continue
+        for point in case['points']:
+            try:
+                base: dict = base_points[point['size']]
+            except KeyError:
+                continue
+            time_ratio: float = point['seconds'] / base['seconds'] if base['seconds'] else math.inf
+            memory_ratio: float = point['peak_bytes'] / base['peak_bytes'] if base['peak_bytes'] else 1.0
+            rows += [{
+                'case': name,
+                'size': point['size'],
+                'time_ratio': time_ratio,
+                'memory_ratio': memory_ratio,
+                'regression': time_ratio > 1 + tolerance or memory_ratio > 1 + tolerance
+            }]
+    return rows
+
+def format_bytes(nbytes: int) -> str:
+    for unit in ['B', 'KiB', 'MiB']:
+        if nbytes < 1024:
+            return f'{nbytes:.0f} {unit}'
+        nbytes /= 1024
+    return f'{nbytes:.1f} GiB'
+
+def format_rate(bits_per_second: float) -> str:
+    for unit in ['bit/s', 'kbit/s', 'Mbit/s']:
+        if bits_per_second < 1000:
+            return f'{bits_per_second:.2f} {unit}'
+        bits_per_second /= 1000
+    return f'{bits_per_second:.2f} Gbit/s'
+
+def format_results(results: dict) -> str:
+    lines: list[str] = []
+    for name, case in results['cases'].items():
+        scaling: str = f"{case['scaling']:.2f}" if case['scaling'] is not None else '-'
+        lines += [f"{name} (time ~ {case['unit']}^{scaling})"]
+        for point in case['points']:
+            throughput: str = format_rate(point['bits_per_second']) if point['bits_per_second'] else ''
+            lines += [
+                f"  {case['unit']} {point['size']:>10}: {point['seconds']:10.4f} s"
+                f"  peak {format_bytes(point['peak_bytes']):>10}  {throughput:>14}"
+            ]
+    return '\n'.join(lines)
+
+def format_comparison(rows: list[dict]) -> str:
+    lines: list[str] = []
+    for row in rows:
+        flag: str = '  REGRESSION' if row['regression'] else ''
+        lines += [
+            f"{row['case']} {row['size']:>10}: time x{row['time_ratio']:.2f}, memory x{row['memory_ratio']:.2f}{flag}"
+        ]
+    return '\n'.join(lines)
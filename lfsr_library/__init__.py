@@ -1,3 +1,10 @@
 from .analyser import Analyser
 from .lfsr import LFSR, MultiLFSR
-from .validate import Validator, ItValidator
\ No newline at end of file
+from .validate import Validator, ItValidator
+from .streaming import StreamAnalyser
+from .bitstream import BitStream
+from .combiner import CombinationGenerator, GeffeGenerator, FilterGenerator
+from .combiner import ShrinkingGenerator, StopAndGoGenerator, AlternatingStepGenerator
+from .correlation import CorrelationAttack
+from .noisy import NoisySolver
+from .cache import SolutionCache
@@ -1,21 +1,93 @@
-import matplotlib.pyplot as plt
-import sympy as sp
-from .functions.functions import count_func
+import numpy as np
+from .functions.functions import poly_str, probability_dicts, running_prob
+from .functions import stats
+from .functions.gf2 import BerlekampMassey, gf2_solve
+from .bitstream import BitStream
+from .cache import SolutionCache, stream_digest
+from .instrument import instrumented
 
 class Analyser:
 
     SIG_FIGS: int = 4
+    LINSOLVE_BACKEND: str = 'gf2' # or 'sympy', kept as a reference
+    ALPHA: float = 0.01 # significance level of the statistical tests
+    BLOCK_SIZE: int = 128 # block frequency test
+    SERIAL_LENGTH: int = 2 # serial test pattern length, 2 for pair counts
+    LAGS: tuple[int] = (1, 2, 8, 16) # autocorrelation test
 
     # error messages
     STREAM_ERROR: str = "No bitstream logged. Try generating stream from an LFSR before calling."
     DEGREE_ERROR: str = "Invalid degree for input stream"
     DEGREE_ERROR_SMALL : str = "Degree is too small"
     LINSOLVE_ERROR: str = "Cannot solve for given bitstream and degree"
+    BACKEND_ERROR: str = "Unknown linear algebra backend, use 'gf2' or 'sympy'"
+    SERIAL_ERROR: str = "Serial test pattern length must be at least 2"
+
+    # the stream is held as a string, a BitStream or both, each made from the other on first use
+    _stream: str = None
+    _bitstream: BitStream = None
+    cache: SolutionCache = None # set, or pass cache to lin_solve/iter_solve, to reuse solutions
 
     def __init__(self, **kwargs) -> None:
         for k, v in kwargs.items():
             setattr(self, k, v) 
 
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """
+        analyse a packed capture through a memory map, without reading it into memory
+        offset and length select a window in bits, other kwargs are passed on as attributes
+        """
+        window: dict = {k: kwargs.pop(k) for k in ['offset', 'length'] if k in kwargs}
+        return cls(stream=BitStream.from_file(path, **window), **kwargs)
+
+    @property
+    def stream(self) -> str:
+        """
+        legacy '0'/'1' string form of the stream
+        """
+        if self._stream is None:
+            if self._bitstream is None:
+                raise AttributeError(self.STREAM_ERROR)
+            self._stream = str(self._bitstream)
+        return self._stream
+
+    @stream.setter
+    def stream(self, stream) -> None:
+        """
+        accepts a '0'/'1' string or a BitStream
+        """
+        if isinstance(stream, BitStream):
+            self.bitstream = stream
+        else:
+            self._stream, self._bitstream = stream, None
+
+    @property
+    def bitstream(self) -> BitStream:
+        """
+        packed form of the stream
+        """
+        if self._bitstream is None:
+            if self._stream is None:
+                raise AttributeError(self.STREAM_ERROR)
+            self._bitstream = BitStream.from_str(self._stream)
+        return self._bitstream
+
+    @bitstream.setter
+    def bitstream(self, bitstream: BitStream) -> None:
+        self._stream, self._bitstream = None, bitstream
+
+    @property
+    def packed_stream(self) -> bytes:
+        """
+        stream bits packed LSb first, bit k in bit k % 8 of byte k // 8
+        """
+        return self.bitstream.packed()
+
+    @property
+    def stream_length(self) -> int:
+        return len(self.bitstream)
+
     def generate_num(self, num_range: range) -> None:
         """
         pseudo-random number generator in range num_range
@@ -25,6 +97,11 @@ class Analyser:
         num: int = int(stream, 2)
         self.random_num : int = (num % (num_range.stop - num_range.start)) + num_range.start
 
+    @instrumented(
+        'Analyser.randomness',
+        params=lambda self: {'stream_length': len(self.bitstream)},
+        counts=lambda self: {'bits_analysed': len(self.bitstream)}
+    )
     def randomness(self, **kwargs) -> None:
 
         try:
@@ -32,26 +109,69 @@ class Analyser:
         except KeyError:
             sf: int = self.SIG_FIGS
 
-        try:
-            stream: str = self.stream # error raised here if stream not logged
-
-            stream_length: int = len(stream)
-            zeros_count: int = count_func(stream, '0')
-            ones_count: int = count_func(stream, '1')
-            self.randomness_dict: dict = {
-                '0': f"{100*zeros_count / stream_length:.{sf}f} %",
-                '1': f"{100*ones_count / stream_length:.{sf}f} %"
-            }
-            self.LaplaceSuccession: dict = {
-                '0': f'{100 * (zeros_count + 1) / (stream_length + 2):.{sf}f} %',
-                '1': f'{100 * (ones_count + 1) / (stream_length + 2):.{sf}f} %'
-            }
-        except AttributeError:
-            raise AttributeError(self.STREAM_ERROR)
+        bitstream: BitStream = self.bitstream # error raised here if stream not logged
+        ones_count: int = bitstream.popcount()
+        zeros_count: int = len(bitstream) - ones_count
+        self.randomness_dict, self.LaplaceSuccession = probability_dicts(zeros_count, ones_count, sf)
 
-    def randomness_plot(self, **kwargs) -> None:
+    def bit_array(self) -> np.ndarray:
         """
-        plot probability of bit == 1 against state number
+        the stream as a 0/1 uint8 array
+        """
+        return self.bitstream.bits()
+
+    @instrumented(
+        'Analyser.statistical_tests',
+        params=lambda self: {'stream_length': len(self.bitstream), 'tests': len(self.test_results)},
+        counts=lambda self: {'bits_analysed': len(self.bitstream)}
+    )
+    def statistical_tests(self, **kwargs) -> None:
+        """
+        run the test battery of functions.stats, setting test_results to a dict of StatResult
+        keyed frequency, block_frequency, runs, longest_run, serial, serial_second,
+        autocorrelation_<lag> for each lag, and spectral
+        kwargs: alpha, block_size, serial_length, lags, and tests to run a subset of the keys above
+        """
+        settings: dict = {
+            'alpha': self.ALPHA,
+            'block_size': self.BLOCK_SIZE,
+            'serial_length': self.SERIAL_LENGTH,
+            'lags': self.LAGS,
+            'tests': ['frequency', 'block_frequency', 'runs', 'longest_run', 'serial', 'autocorrelation', 'spectral']
+        }
+        for k in settings:
+            try:
+                settings[k] = kwargs[k]
+            except KeyError:
+                pass
+        alpha: float = settings['alpha']
+        tests: list[str] = settings['tests']
+        if settings['serial_length'] < 2:
+            raise ValueError(self.SERIAL_ERROR)
+
+        bits: np.ndarray = self.bit_array()
+        results: dict = {}
+        if 'frequency' in tests:
+            results['frequency'] = stats.frequency_test(bits, alpha)
+        if 'block_frequency' in tests:
+            results['block_frequency'] = stats.block_frequency_test(bits, settings['block_size'], alpha)
+        if 'runs' in tests:
+            results['runs'] = stats.runs_test(bits, alpha)
+        if 'longest_run' in tests:
+            results['longest_run'] = stats.longest_run_test(bits, alpha)
+        if 'serial' in tests:
+            results['serial'], results['serial_second'] = stats.serial_test(bits, settings['serial_length'], alpha)
+        if 'autocorrelation' in tests:
+            for lag in settings['lags']:
+                results[f'autocorrelation_{lag}'] = stats.autocorrelation_test(bits, lag, alpha)
+        if 'spectral' in tests:
+            results['spectral'] = stats.spectral_test(bits, alpha)
+        self.test_results: dict = results
+
+    def running_probability(self, **kwargs) -> None:
+        """
+        probability of bit == 1 against state number, as arrays running_xdata and running_ydata
+        accepts the window, step and max_points downsampling kwargs of functions.running_prob
         """
         try:
             sf = kwargs['SIG_FIGS']
@@ -59,15 +179,19 @@ class Analyser:
             sf = self.SIG_FIGS
 
         try:
-            stream: str = self.stream
-            xdata: list[int] = [0]
-            ydata: list[float] = [100.0 if stream[0]=='1' else 0.0]
-            for x in range(len((stream[1:]))):
-                data = stream[:x+1]
-                xdata += [int(x+1)]
-                ones_count: int = count_func(data, '1')
-                ones_prob: float = round(100*ones_count / (x+1), sf)
-                ydata += [ones_prob]
+            bits: np.ndarray = self.bit_array()
+        except AttributeError:
+            raise AttributeError(self.STREAM_ERROR)
+        self.running_xdata, self.running_ydata = running_prob(bits, sf, **kwargs)
+
+    def randomness_plot(self, **kwargs) -> None:
+        """
+        plot probability of bit == 1 against state number
+        accepts the downsampling kwargs of running_probability
+        """
+        try:
+            self.running_probability(**kwargs)
+            xdata, ydata = self.running_xdata, self.running_ydata
 
             try:
                 figure_size: tuple[int] = kwargs['figsize']
@@ -75,6 +199,7 @@ class Analyser:
                 figure_size: tuple[int] = (12, 7)
 
             # plotting
+            import matplotlib.pyplot as plt
             plt.figure(figsize=figure_size)
             plt.title('Randomness graph')
             plt.xlabel('State number')
@@ -105,6 +230,7 @@ class Analyser:
             except KeyError:
                 figure_size: tuple[int] = (12, 7)
 
+            import matplotlib.pyplot as plt
             plt.figure(figsize=figure_size)
 
             plt.title('Bit stream plot')
@@ -118,62 +244,123 @@ class Analyser:
         except AttributeError:
             raise AttributeError(self.STREAM_ERROR)
 
+    @instrumented(
+        'Analyser.lin_solve',
+        params=lambda self: {'degree': self.degree, 'stream_length': len(self.bitstream)},
+        counts=lambda self: {'matrices_inverted': int(not self.cache_hit), 'cache_hits': int(self.cache_hit)}
+    )
     def lin_solve(self, **kwargs) -> None:
-        
+        """
+        taps of the given degree from the first 2*degree bits of the stream
+        pass cache, a SolutionCache, to look the system up by the hash of those bits first (gf2 backend)
+        the sympy backend solves and ranks the system independently, as a reference
+        """
         try:
-            stream: str = self.stream
+            bitstream: BitStream = self.bitstream
             try: # if kwargs passed in lin_solve, override with class attr
                 degree: int = kwargs['degree']
-                if 2*degree > len(stream):
+                if 2*degree > len(bitstream):
                     raise ValueError(self.DEGREE_ERROR)
             except KeyError: # if no kwargs passed, check class attr
                 try:
                     degree: int = self.degree
-                    if 2*degree > len(stream):
+                    if 2*degree > len(bitstream):
                         raise ValueError(self.DEGREE_ERROR)
                 except AttributeError: # if no kwargs passed or class attrs logged, use default
-                    degree: int = len(stream) // 2
+                    degree: int = len(bitstream) // 2
 
             if degree <= 3:
                 raise ValueError(self.DEGREE_ERROR_SMALL)
             
             self.degree: int = degree
-            self.input_stream: str = stream[:2*degree]
+            self.input_stream: str = str(bitstream[:2*degree])
             input_stream: str = self.input_stream
 
-            bit_vect: list[int] = [int(bit) for bit in input_stream[degree:]]
-            mtrx_rows: list[list] = []
-            for i in range(degree):
-                mtrx_rows += [
-                    [int(bit) for bit in stream[i:i+degree]]
-                ]
-            mtrx: sp.matrices.dense.MutableDenseMatrix = sp.Matrix(mtrx_rows)
             try:
-                taps: sp.matrices.dense.MutableDenseMatrix = mtrx.inv_mod(2) @ sp.Matrix(bit_vect)
-                taps: sp.matrices.dense.MutableDenseMatrix = taps.__mod__(2)
-                self.solution: list[int] = list(taps)
-                self.tap_positions: list[int] = [i for i, x in enumerate(taps) if x==1]
+                backend: str = kwargs['backend']
+            except KeyError:
+                backend: str = self.LINSOLVE_BACKEND
 
-            except ValueError:
-                raise ValueError(self.LINSOLVE_ERROR)
+            if backend == 'gf2':
+                try:
+                    cache: SolutionCache = kwargs['cache']
+                except KeyError:
+                    cache: SolutionCache = self.cache
+
+                # a longer stream with the same first 2*degree bits has the same key
+                key: str = None if cache is None else f'lin_solve:{degree}:' + stream_digest(bitstream[:2*degree])
+                entry: dict = None if cache is None else cache.get(key)
+                self.cache_hit: bool = entry is not None
+                if entry is None:
+                    # row i holds stream bits i ... i+degree-1 and, in bit degree, the bit they feed
+                    window: int = int(input_stream[::-1], 2)
+                    row_mask: int = (1 << (degree+1)) - 1
+                    rows: list[int] = [(window >> i) & row_mask for i in range(degree)]
+                    solution, rank = gf2_solve(rows, degree)
+                    if cache is not None: # singular systems too
+                        cache.put(key, {'solution': solution, 'rank': rank})
+                else:
+                    solution, rank = entry['solution'], entry['rank']
+                self.rank: int = rank
+                self.singular: bool = solution is None
+
+                if solution is None:
+                    raise ValueError(self.LINSOLVE_ERROR)
+                self.solution: list[int] = solution
+                self.tap_positions: list[int] = [i for i, x in enumerate(solution) if x==1]
+
+            elif backend == 'sympy':
+                import sympy as sp
+                from sympy.polys.matrices import DomainMatrix
+
+                self.cache_hit: bool = False
+                bit_vect: list[int] = [int(bit) for bit in input_stream[degree:]]
+                mtrx_rows: list[list] = []
+                for i in range(degree):
+                    mtrx_rows += [
+                        [int(bit) for bit in input_stream[i:i+degree]]
+                    ]
+                mtrx: sp.matrices.dense.MutableDenseMatrix = sp.Matrix(mtrx_rows)
+                self.rank: int = DomainMatrix.from_Matrix(mtrx).convert_to(sp.GF(2)).rank()
+                self.singular: bool = self.rank < degree
+                if self.singular:
+                    raise ValueError(self.LINSOLVE_ERROR)
+                try:
+                    taps: sp.matrices.dense.MutableDenseMatrix = mtrx.inv_mod(2) @ sp.Matrix(bit_vect)
+                    taps: sp.matrices.dense.MutableDenseMatrix = taps.__mod__(2)
+                    self.solution: list[int] = list(taps)
+                    self.tap_positions: list[int] = [i for i, x in enumerate(taps) if x==1]
+
+                except ValueError:
+                    raise ValueError(self.LINSOLVE_ERROR)
+
+            else:
+                raise ValueError(self.BACKEND_ERROR)
             
         except AttributeError:
             raise AttributeError(self.STREAM_ERROR)
 
-    def iter_solve(self) -> None:
+    @instrumented(
+        'Analyser.iter_solve',
+        params=lambda self: {'stream_length': len(self.bitstream)},
+        counts=lambda self: {
+            'degrees_solved': sum(params['tap_positions'] is not None for params in self.lfsr_solutions.values())
+        }
+    )
+    def iter_solve(self, **kwargs) -> None:
         """
         iteratively solve, checking each valid degrees 
+        pass backend to choose the lin_solve backend, cache to reuse solutions of earlier streams
         """
-        stream: str = self.stream
         lsfr_solutions: dict = {}
-        MAX = len(stream) // 2
+        MAX = len(self.bitstream) // 2
         if MAX <= 3:
             raise ValueError(self.DEGREE_ERROR_SMALL)
         
         for degree in range(3, MAX+1):
             lsfr_solutions[degree] = {}
             try:
-                self.lin_solve(degree=degree)
+                self.lin_solve(degree=degree, **kwargs)
                 lsfr_solutions[degree]['taps'] = self.solution
                 lsfr_solutions[degree]['tap_positions'] = self.tap_positions
             except ValueError:
@@ -181,3 +368,32 @@ class Analyser:
                 lsfr_solutions[degree]['tap_positions'] = None
 
         self.lfsr_solutions: dict = lsfr_solutions
+
+    @instrumented(
+        'Analyser.bm_solve',
+        params=lambda self: {'stream_length': len(self.bitstream), 'degree': self.linear_complexity},
+        counts=lambda self: {'bits_analysed': len(self.bitstream)}
+    )
+    def bm_solve(self) -> None:
+        """
+        shortest LFSR generating the stream by Berlekamp-Massey, in O(n^2) bit operations
+        fills lfsr_solutions in the shape of iter_solve, keyed by the linear complexity
+        """
+        bitstream: BitStream = self.bitstream
+
+        bm: BerlekampMassey = BerlekampMassey()
+        bm.update(bitstream.bits().tobytes())
+
+        degree: int = bm.complexity
+        self.linear_complexity: int = degree
+        self.connection_polynomial: str = poly_str(bm.connection)
+        self.solution: list[int] = bm.tap_vector()
+        self.tap_positions: list[int] = [i for i, x in enumerate(self.solution) if x==1]
+
+        lfsr_solutions: dict = {}
+        if degree > 0: # an all-zero stream has no register to validate
+            lfsr_solutions[degree] = {
+                'taps': self.solution,
+                'tap_positions': self.tap_positions
+            }
+        self.lfsr_solutions: dict = lfsr_solutions
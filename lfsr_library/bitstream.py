@@ -0,0 +1,206 @@
+"""
+packed bit sequences
+
+bit k of a stream is bit (offset + k) % 8 of byte (offset + k) // 8 of its buffer,
+the LSb first order of LFSR.packed_stream, so a stream costs one bit per bit
+and contiguous slices are views sharing the buffer
+"""
+import numpy as np
+
+POPCOUNT: np.ndarray = np.array([bin(v).count('1') for v in range(256)], dtype=np.uint8)
+ITER_CHUNK: int = 1 << 16 # bytes unpacked at a time when iterating
+CHUNK_BYTES: int = 1 << 22 # bytes realigned at a time by popcount, find and write, bounding memory on mapped files
+
+class BitStream:
+
+    # error messages
+    LENGTH_ERROR: str = "Length mismatch, found lengths {} and {}"
+    BUFFER_ERROR: str = "Buffer of {} bytes is too short for {} bits at offset {}"
+
+    def __init__(self, **kwargs) -> None:
+        """
+        buffer: packed bytes, bytearray or uint8 array, shared without copying
+        length: number of bits, by default the whole buffer
+        offset: bit position of the first bit in the buffer, default 0
+        """
+        buffer: np.ndarray = np.frombuffer(kwargs['buffer'], dtype=np.uint8) \
+            if not isinstance(kwargs['buffer'], np.ndarray) else kwargs['buffer']
+        try:
+            offset: int = kwargs['offset']
+        except KeyError:
+            offset: int = 0
+        try:
+            length: int = kwargs['length']
+        except KeyError:
+            length: int = 8*len(buffer) - offset
+
+        if offset + length > 8*len(buffer):
+            raise ValueError(self.BUFFER_ERROR.format(len(buffer), length, offset))
+        self.buffer: np.ndarray = buffer[offset // 8:-(-(offset + length) // 8)]
+        self.offset: int = offset % 8
+        self.length: int = length
+
+    @classmethod
+    def from_str(cls, stream: str):
+        """
+        from the legacy '0'/'1' string, first character first
+        """
+        bits: np.ndarray = np.frombuffer(stream.encode('ascii'), dtype=np.uint8) - ord('0')
+        return cls.from_bits(bits)
+
+    @classmethod
+    def from_bits(cls, bits):
+        """
+        from a 0/1 array or iterable
+        """
+        if isinstance(bits, (bytes, bytearray)):
+            bits: np.ndarray = np.frombuffer(bits, dtype=np.uint8)
+        elif not isinstance(bits, np.ndarray):
+            bits: np.ndarray = np.fromiter(bits, dtype=np.uint8)
+        return cls(buffer=np.packbits(bits, bitorder='little'), length=len(bits))
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """
+        memory-mapped view of a packed file, read only and loaded by the OS as touched
+        offset and length select a window in bits, by default the whole file
+        """
+        buffer: np.ndarray = np.memmap(path, dtype=np.uint8, mode='r')
+        return cls(buffer=buffer, **kwargs)
+
+    def write(self, path: str) -> None:
+        """
+        write the bits packed LSb first, the last byte padded with zeros
+        """
+        write_chunks(path, (chunk.packed() for chunk in self.chunks()), self.length)
+
+    def chunks(self):
+        """
+        consecutive views of CHUNK_BYTES bytes
+        """
+        for start in range(0, self.length, 8*CHUNK_BYTES):
+            yield self[start:start + 8*CHUNK_BYTES]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        preview: str = str(self[:64]) + ('...' if self.length > 64 else '')
+        return f"BitStream({self.length} bits: {preview})"
+
+    def __str__(self) -> str:
+        """
+        legacy '0'/'1' string form
+        """
+        return (self.bits() + ord('0')).tobytes().decode('ascii')
+
+    def __getitem__(self, key):
+        """
+        an int gives a bit, a slice of step 1 a view on the same buffer, other slices a copy
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step != 1:
+                return BitStream.from_bits(self.bits()[key])
+            stop = max(start, stop)
+            return BitStream(buffer=self.buffer, offset=self.offset + start, length=stop - start)
+
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError(key)
+        position: int = self.offset + key
+        return int(self.buffer[position // 8] >> (position % 8)) & 1
+
+    def __iter__(self):
+        for start in range(0, self.length, 8*ITER_CHUNK):
+            yield from self[start:start + 8*ITER_CHUNK].bits().tolist()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, str):
+            other: BitStream = BitStream.from_str(other)
+        if not isinstance(other, BitStream):
+            return NotImplemented
+        return self.length == other.length and self.packed() == other.packed()
+
+    def __xor__(self, other):
+        if len(other) != self.length:
+            raise ValueError(self.LENGTH_ERROR.format(self.length, len(other)))
+        xor: np.ndarray = self.packed_array() ^ other.packed_array()
+        return BitStream(buffer=xor, length=self.length)
+
+    def packed_array(self) -> np.ndarray:
+        """
+        the bits realigned to offset 0 as a uint8 array, unused high bits of the last byte cleared
+        a view of the buffer when already aligned and clean, otherwise a copy
+        """
+        nbytes: int = -(-self.length // 8)
+        if self.offset:
+            padded: np.ndarray = np.append(self.buffer, np.uint8(0))
+            aligned: np.ndarray = ((padded[:-1] >> self.offset) | (padded[1:] << (8 - self.offset)))[:nbytes]
+        else:
+            aligned: np.ndarray = self.buffer[:nbytes]
+        spare: int = 8*nbytes - self.length
+        if spare and aligned[-1] >> (8 - spare):
+            aligned = aligned.copy()
+            aligned[-1] &= 0xFF >> spare
+        return aligned
+
+    def packed(self) -> bytes:
+        """
+        the bits as packed bytes in LSb first order, as LFSR.packed_stream
+        """
+        return self.packed_array().tobytes()
+
+    def bits(self) -> np.ndarray:
+        """
+        0/1 uint8 array, one byte per bit
+        """
+        return np.unpackbits(self.buffer, count=self.offset + self.length, bitorder='little')[self.offset:]
+
+    def to_int(self) -> int:
+        """
+        the bits as an int, bit k of the stream as bit k of the int,
+        e.g. the LFSR seed whose first outputs are these bits
+        """
+        return int.from_bytes(self.packed(), 'little')
+
+    def find(self, bit: int) -> int:
+        """
+        index of the first occurrence of bit, -1 if none, as str.find on the legacy string
+        """
+        if self.length > 8*CHUNK_BYTES:
+            for start, chunk in zip(range(0, self.length, 8*CHUNK_BYTES), self.chunks()):
+                index: int = chunk.find(bit)
+                if index >= 0:
+                    return start + index
+            return -1
+
+        packed: np.ndarray = self.packed_array()
+        if bit == 0:
+            packed = ~packed
+        nonzero: np.ndarray = np.flatnonzero(packed)
+        if len(nonzero) == 0:
+            return -1
+        byte: int = int(packed[nonzero[0]])
+        index: int = 8*int(nonzero[0]) + (byte & -byte).bit_length() - 1
+        return index if index < self.length else -1
+
+    def popcount(self) -> int:
+        """
+        number of ones
+        """
+        return sum(int(POPCOUNT[chunk.packed_array()].sum(dtype=np.int64)) for chunk in self.chunks())
+
+def write_chunks(path: str, chunks, nbits: int) -> None:
+    """
+    write the first nbits of an iterable of packed chunks to a file, one chunk in memory at a time
+    """
+    written: int = 0
+    with open(path, 'wb') as file:
+        for chunk in chunks:
+            if written >= nbits:
+                break
+            take: int = min(8*len(chunk), nbits - written)
+            file.write(BitStream(buffer=chunk, length=take).packed())
+            written += take
@@ -0,0 +1,134 @@
+"""
+cache of tap-recovery results keyed by a fingerprint of the stream they were computed from
+
+lin_solve of degree d reads only the first 2d bits, so its entry is keyed by the hash of that
+packed prefix and d: iter_solve on a longer stream with the same prefix finds the entries of
+every degree already solved. ItValidator entries are keyed by the hash of the whole stream
+
+entries are held as JSON text in memory, in least-recently-used order up to max_entries,
+and optionally in an sqlite file shared between runs, bounded and evicted the same way
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from .bitstream import BitStream
+
+def stream_digest(bitstream: BitStream) -> str:
+    """
+    fingerprint of a stream: sha256 of its length and packed bits
+    """
+    digest = hashlib.sha256(len(bitstream).to_bytes(8, 'little'))
+    for chunk in bitstream.chunks():
+        digest.update(chunk.packed())
+    return digest.hexdigest()
+
+class SolutionCache:
+
+    MAX_ENTRIES: int = 1 << 16 # in memory
+    MAX_DISK_ENTRIES: int = 1 << 20
+
+    def __init__(self, **kwargs) -> None:
+        """
+        max_entries bounds the entries held in memory
+        path names an sqlite file to keep entries across runs, max_disk_entries bounding it
+        """
+        try:
+            self.max_entries: int = kwargs['max_entries']
+        except KeyError:
+            self.max_entries: int = self.MAX_ENTRIES
+        try:
+            self.max_disk_entries: int = kwargs['max_disk_entries']
+        except KeyError:
+            self.max_disk_entries: int = self.MAX_DISK_ENTRIES
+        try:
+            self.path: str = kwargs['path']
+        except KeyError:
+            self.path: str = None
+
+        self.entries: OrderedDict = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.db: sqlite3.Connection = None
+        if self.path is not None:
+            self.db = sqlite3.connect(self.path, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS solutions (key TEXT PRIMARY KEY, value TEXT, used INTEGER)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS solutions_used ON solutions (used)")
+            self.db.commit()
+            # used orders disk entries by last use, and clock is the latest use
+            self.clock, self.disk_entries = self.db.execute("SELECT IFNULL(MAX(used), 0), COUNT(*) FROM solutions").fetchone()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str):
+        """
+        the value stored under key, a fresh copy, or None
+        """
+        with self.lock:
+            try:
+                text: str = self.entries[key]
+                self.entries.move_to_end(key)
+            except KeyError:
+                text: str = self._disk_get(key)
+                if text is None:
+                    self.misses += 1
+                    return None
+                self._memory_put(key, text)
+            self.hits += 1
+            return json.loads(text)
+
+    def put(self, key: str, value) -> None:
+        """
+        store a JSON-serialisable value under key
+        """
+        text: str = json.dumps(value)
+        with self.lock:
+            self._memory_put(key, text)
+            if self.db is not None:
+                self.clock += 1
+                known: tuple = self.db.execute("SELECT 1 FROM solutions WHERE key = ?", (key,)).fetchone()
+                self.db.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)", (key, text, self.clock))
+                self.disk_entries += known is None
+                if self.disk_entries > self.max_disk_entries:
+                    excess: int = self.disk_entries - self.max_disk_entries
+                    self.db.execute(
+                        "DELETE FROM solutions WHERE key IN (SELECT key FROM solutions ORDER BY used LIMIT ?)", (excess,)
+                    )
+                    self.disk_entries -= excess
+                self.db.commit()
+
+    def clear(self) -> None:
+        """
+        drop every entry, on disk too
+        """
+        with self.lock:
+            self.entries.clear()
+            if self.db is not None:
+                self.db.execute("DELETE FROM solutions")
+                self.db.commit()
+                self.disk_entries = 0
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+    def _memory_put(self, key: str, text: str) -> None:
+        self.entries[key] = text
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _disk_get(self, key: str) -> str:
+        if self.db is None:
+            return None
+        row: tuple = self.db.execute("SELECT value FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.clock += 1
+        self.db.execute("UPDATE solutions SET used = ? WHERE key = ?", (self.clock, key))
+        self.db.commit()
+        return row[0]
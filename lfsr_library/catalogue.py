@@ -0,0 +1,182 @@
+"""
+catalogue of maximal-length tap positions
+
+data/catalogue.bin holds a header and then one fixed-size record per degree from 2,
+so a lookup is a single read at a computed offset of a lazily opened memory map.
+a record gives the middle exponents of the primitive trinomial X^n + X^k + 1 with least k
+and of the primitive pentanomial X^n + X^a + X^b + X^c + 1 with least (a, b, c), 0 when none exists.
+
+rebuild with: python -m lfsr_library.catalogue [max_degree]
+"""
+import mmap
+import os
+import struct
+import sys
+import warnings
+from functools import lru_cache
+from .functions.gf2 import poly_mod, poly_square, poly_gcd
+from .functions.factor import poly_is_primitive
+
+CATALOGUE_PATH: str = os.path.join(os.path.dirname(__file__), 'data', 'catalogue.bin')
+MAGIC: bytes = b'LFSRCAT1'
+HEADER: struct.Struct = struct.Struct('<8sH') # magic, max degree
+RECORD: struct.Struct = struct.Struct('<HHHHHH') # degree, flags, k, a, b, c
+MIN_DEGREE: int = 2
+SIEVE_DEGREE: int = 12 # candidates with an irreducible factor up to this degree are rejected early
+
+# record flags
+TRINOMIAL: int = 1
+PENTANOMIAL: int = 2
+TRINOMIAL_CERTIFIED: int = 4 # primitivity proven, not only all available checks passed:
+PENTANOMIAL_CERTIFIED: int = 8 # uncertified entries are degrees where 2^n - 1 is not completely factored
+
+# error messages
+DEGREE_ERROR: str = "Degree {} is outside the catalogue, which covers {} to {}"
+WEIGHT_ERROR: str = "No primitive polynomial of weight {} in the catalogue for degree {}"
+UNCERTIFIED_WARNING: str = (
+    "Catalogue taps {} for degree {} pass every check but are not proven primitive, as 2^{} - 1 "
+    "is not completely factored; pass allow_uncertified=True to accept them without this warning"
+)
+
+@lru_cache(maxsize=1)
+def _table() -> mmap.mmap:
+    with open(CATALOGUE_PATH, 'rb') as file:
+        table: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, _ = HEADER.unpack_from(table, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{CATALOGUE_PATH} is not an LFSR catalogue")
+    return table
+
+def max_degree() -> int:
+    return HEADER.unpack_from(_table(), 0)[1]
+
+def lookup(degree: int) -> dict:
+    """
+    catalogue record for degree, tap positions given as for LFSR
+    """
+    top: int = max_degree()
+    if not MIN_DEGREE <= degree <= top:
+        raise ValueError(DEGREE_ERROR.format(degree, MIN_DEGREE, top))
+    offset: int = HEADER.size + (degree - MIN_DEGREE) * RECORD.size
+    _, flags, k, a, b, c = RECORD.unpack_from(_table(), offset)
+    return {
+        'trinomial': [0, k] if flags & TRINOMIAL else None,
+        'pentanomial': [0, c, b, a] if flags & PENTANOMIAL else None,
+        'trinomial_certified': bool(flags & TRINOMIAL_CERTIFIED),
+        'pentanomial_certified': bool(flags & PENTANOMIAL_CERTIFIED)
+    }
+
+def catalogue_taps(degree: int, **kwargs) -> list[int]:
+    """
+    tap positions of a maximal-length LFSR of the given degree
+    pass weight=3 or weight=5 for a trinomial or pentanomial, by default the least weight available
+    primitivity is proven only where 2^degree - 1 is completely factored, every degree up to 672:
+    an uncertified entry gives a warning unless allow_uncertified=True
+    """
+    record: dict = lookup(degree)
+    try:
+        weight: int = kwargs['weight']
+    except KeyError:
+        weight: int = 3 if record['trinomial'] else 5
+
+    taps = record['trinomial'] if weight == 3 else record['pentanomial'] if weight == 5 else None
+    if taps is None:
+        raise ValueError(WEIGHT_ERROR.format(weight, degree))
+
+    try:
+        allow_uncertified: bool = kwargs['allow_uncertified']
+    except KeyError:
+        allow_uncertified: bool = False
+    certified: bool = record['trinomial_certified'] if weight == 3 else record['pentanomial_certified']
+    if not certified and not allow_uncertified:
+        warnings.warn(UNCERTIFIED_WARNING.format(taps, degree, degree), stacklevel=2)
+    return taps
+
+def _no_small_factor(f: int, degree: int) -> bool:
+    """
+    gcd(X^(2^i) - X, f) = 1 for i up to SIEVE_DEGREE: no irreducible factor of degree <= SIEVE_DEGREE
+    """
+    h: int = 0b10
+    for _ in range(min(SIEVE_DEGREE, degree // 2)):
+        h = poly_mod(poly_square(h), f)
+        if poly_gcd(f, h ^ 0b10) != 1:
+            return False
+    return True
+
+def _primitive(f: int, degree: int):
+    """
+    True if certified primitive, None if all checks pass without a complete factorisation of 2^n - 1
+    """
+    if not _no_small_factor(f, degree):
+        return False
+    try:
+        return poly_is_primitive(f)
+    except ValueError:
+        return None
+
+def find_trinomial(degree: int) -> tuple:
+    """
+    least k with X^n + X^k + 1 primitive, and whether that is certified; (0, False) if none
+    """
+    for k in range(1, degree):
+        if degree % 2 == 0 and k % 2 == 0: # a square
+            continue
+        primitive = _primitive((1 << degree) | (1 << k) | 1, degree)
+        if primitive is not False:
+            return k, primitive is True
+    return 0, False
+
+def find_pentanomial(degree: int) -> tuple:
+    """
+    least (a, b, c) with X^n + X^a + X^b + X^c + 1 primitive, and whether that is certified
+    """
+    for a in range(3, degree):
+        for b in range(2, a):
+            for c in range(1, b):
+                poly: int = (1 << degree) | (1 << a) | (1 << b) | (1 << c) | 1
+                primitive = _primitive(poly, degree)
+                if primitive is not False:
+                    return (a, b, c), primitive is True
+    return (0, 0, 0), False
+
+def build_catalogue(top: int, **kwargs) -> None:
+    """
+    search every degree from MIN_DEGREE to top and write the catalogue
+    """
+    try:
+        path: str = kwargs['path']
+    except KeyError:
+        path: str = CATALOGUE_PATH
+
+    records: bytes = b''
+    for degree in range(MIN_DEGREE, top + 1):
+        k, k_certified = find_trinomial(degree)
+        (a, b, c), abc_certified = find_pentanomial(degree)
+        flags: int = (
+            (TRINOMIAL if k else 0) | (TRINOMIAL_CERTIFIED if k_certified else 0)
+            | (PENTANOMIAL if a else 0) | (PENTANOMIAL_CERTIFIED if abc_certified else 0)
+        )
+        records += RECORD.pack(degree, flags, k, a, b, c)
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, top) + records)
+    _table.cache_clear()
+
+def verify_catalogue() -> list[int]:
+    """
+    recheck every certified entry, returning the degrees that fail
+    """
+    failures: list[int] = []
+    for degree in range(MIN_DEGREE, max_degree() + 1):
+        record: dict = lookup(degree)
+        for name in ['trinomial', 'pentanomial']:
+            if record[f'{name}_certified']:
+                poly: int = 1 << degree
+                for position in record[name]:
+                    poly |= 1 << position
+                if not poly_is_primitive(poly):
+                    failures += [degree]
+    return failures
+
+if __name__ == '__main__':
+    build_catalogue(int(sys.argv[1]) if len(sys.argv) > 1 else 1024)
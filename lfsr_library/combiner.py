@@ -0,0 +1,293 @@
+"""
+keystream generators built on LFSRs: nonlinear combination and filter generators,
+and the irregularly clocked shrinking, stop-and-go and alternating step generators
+
+registers run through LFSR.iter_chunks, so each is stepped a block at a time by the packed engine,
+and their outputs are combined on packed arrays or, under irregular clocking, selected by numpy indexing
+a register clocked j times shows output bit j, bit 0 of its state, as in LFSR.generate
+"""
+import numpy as np
+from .analyser import Analyser
+from .lfsr import LFSR
+from .bitstream import BitStream, write_chunks
+from .functions.engine import pack_bits
+from .functions.boolean import truth_table_array, truth_table_to_anf, check_anf, eval_anf
+from .instrument import instrumented
+
+class KeystreamGenerator(Analyser):
+    """
+    base of the generators: subclasses provide iter_chunks(seeds, chunk_bytes)
+    """
+
+    CHUNK_BYTES: int = 1 << 16 # bytes per chunk, bounding memory
+
+    # error messages
+    REGISTERS_ERROR: str = "{} takes {} LFSRs"
+    SEEDS_ERROR: str = "Pass one seed per LFSR"
+    FUNCTION_ERROR: str = "Pass the combining function as truth_table or anf"
+
+    def __init__(self, **kwargs) -> None:
+        self.lfsr_list: list[LFSR] = kwargs['lfsr_list']
+
+    def _function(self, kwargs: dict, n: int) -> list[tuple[int]]:
+        """
+        the combining function of n inputs as an ANF, from the truth_table or anf kwarg
+        """
+        if 'anf' in kwargs:
+            return check_anf(kwargs['anf'], n)
+        if 'truth_table' in kwargs:
+            return truth_table_to_anf(truth_table_array(kwargs['truth_table'], n))
+        raise KeyError(self.FUNCTION_ERROR)
+
+    def _check_registers(self, count: int) -> None:
+        if len(self.lfsr_list) != count:
+            raise ValueError(self.REGISTERS_ERROR.format(type(self).__name__, count))
+
+    def _sources(self, seeds: list) -> list:
+        if len(seeds) != len(self.lfsr_list):
+            raise ValueError(self.SEEDS_ERROR)
+        return [BitSource(lfsr, seed) for lfsr, seed in zip(self.lfsr_list, seeds)]
+
+    @instrumented(
+        'KeystreamGenerator.generate',
+        params=lambda self: {'generator': type(self).__name__, 'registers': len(self.lfsr_list)},
+        counts=lambda self: {'bits_generated': len(self.bitstream)}
+    )
+    def generate(self, seeds: list, nbits: int) -> None:
+        """
+        the first nbits of keystream from seeds, one per LFSR, as self.bitstream packed LSb first
+        """
+        self.seeds: list = seeds
+        chunk_bytes: int = max(1, min(self.CHUNK_BYTES, -(-nbits // 8)))
+        buffer: bytearray = bytearray()
+        for chunk in self.iter_chunks(seeds, chunk_bytes):
+            buffer += chunk
+            if 8*len(buffer) >= nbits:
+                break
+        self.bitstream: BitStream = BitStream(buffer=pack_bits(buffer, nbits), length=nbits)
+
+    def write_packed(self, path: str, seeds: list, nbits: int, **kwargs) -> None:
+        """
+        write nbits of keystream to a file, packed LSb first, one chunk in memory at a time
+        """
+        try:
+            chunk_bytes: int = kwargs['chunk_bytes']
+        except KeyError:
+            chunk_bytes: int = self.CHUNK_BYTES
+        write_chunks(path, self.iter_chunks(seeds, chunk_bytes), nbits)
+
+class BitSource:
+    """
+    output bits of an LFSR from a seed, taken as 0/1 uint8 arrays of any length
+    """
+
+    def __init__(self, lfsr: LFSR, seed) -> None:
+        self.chunks = lfsr.iter_chunks(seed, KeystreamGenerator.CHUNK_BYTES)
+        self.pending: np.ndarray = np.empty(0, dtype=np.uint8)
+
+    def take(self, n: int) -> np.ndarray:
+        pieces: list[np.ndarray] = [self.pending]
+        available: int = len(self.pending)
+        while available < n:
+            bits: np.ndarray = np.unpackbits(np.frombuffer(next(self.chunks), dtype=np.uint8), bitorder='little')
+            pieces += [bits]
+            available += len(bits)
+        bits: np.ndarray = np.concatenate(pieces) if len(pieces) > 1 else self.pending
+        self.pending = bits[n:]
+        return bits[:n]
+
+def pack_pieces(pieces, chunk_bytes: int):
+    """
+    regroup 0/1 arrays of any lengths into packed chunks of chunk_bytes bytes
+    """
+    nbits: int = 8*chunk_bytes
+    pending: list[np.ndarray] = []
+    available: int = 0
+    for piece in pieces:
+        pending += [piece]
+        available += len(piece)
+        if available >= nbits:
+            bits: np.ndarray = np.concatenate(pending)
+            usable: int = len(bits) - len(bits) % nbits
+            for start in range(0, usable, nbits):
+                yield np.packbits(bits[start:start + nbits], bitorder='little').tobytes()
+            pending = [bits[usable:]]
+            available = len(pending[0])
+
+class CombinationGenerator(KeystreamGenerator):
+    """
+    output bit k is f(x_0, ..., x_{n-1}) of bit k of each register's output
+    f is given as truth_table (2^n values, or an int with bit v the value f(v)) or as anf,
+    a list of monomials each a tuple of register indices, see functions.boolean
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.anf: list[tuple[int]] = self._function(kwargs, len(self.lfsr_list))
+
+    def iter_chunks(self, seeds: list, chunk_bytes: int = None):
+        """
+        endless keystream packed into chunks of chunk_bytes bytes, f applied to whole packed chunks
+        """
+        if len(seeds) != len(self.lfsr_list):
+            raise ValueError(self.SEEDS_ERROR)
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        streams: list = [lfsr.iter_chunks(seed, chunk_bytes) for lfsr, seed in zip(self.lfsr_list, seeds)]
+        for chunks in zip(*streams):
+            inputs: list[np.ndarray] = [np.frombuffer(chunk, dtype=np.uint8) for chunk in chunks]
+            yield eval_anf(self.anf, inputs).tobytes()
+
+class GeffeGenerator(CombinationGenerator):
+    """
+    three registers, the middle one choosing the first when 1 and the last when 0:
+    f = x_0 x_1 + x_1 x_2 + x_2
+    """
+
+    ANF: list[tuple[int]] = [(0, 1), (1, 2), (2,)]
+
+    def __init__(self, **kwargs) -> None:
+        KeystreamGenerator.__init__(self, **kwargs)
+        self._check_registers(3)
+        self.anf: list[tuple[int]] = self.ANF
+
+class FilterGenerator(KeystreamGenerator):
+    """
+    one register, output bit k being f of its state bits at positions, i.e. of output bits k + p
+    f of len(positions) inputs is given as truth_table or anf, as for CombinationGenerator
+    """
+
+    # error messages
+    POSITIONS_ERROR: str = "Filter positions must lie in 0 ... degree-1"
+
+    def __init__(self, **kwargs) -> None:
+        self.lfsr: LFSR = kwargs['lfsr']
+        super().__init__(lfsr_list=[self.lfsr])
+        self.positions: list[int] = kwargs['positions']
+        if any(not 0 <= p < self.lfsr.degree for p in self.positions):
+            raise ValueError(self.POSITIONS_ERROR)
+        self.anf: list[tuple[int]] = self._function(kwargs, len(self.positions))
+
+    def iter_chunks(self, seeds: list, chunk_bytes: int = None):
+        """
+        endless keystream packed into chunks of chunk_bytes bytes
+        each input is a shifted view of the register output, read across the next chunk
+        """
+        if len(seeds) != 1:
+            raise ValueError(self.SEEDS_ERROR)
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        source_bytes: int = max(chunk_bytes, -(-self.lfsr.degree // 8)) # lookahead within one chunk
+        chunks = self.lfsr.iter_chunks(seeds[0], source_bytes)
+        current: bytes = next(chunks)
+        nbits: int = 8*source_bytes
+        filtered = self._filtered(chunks, current, nbits)
+        yield from filtered if source_bytes == chunk_bytes else pack_pieces(
+            (np.unpackbits(np.frombuffer(chunk, dtype=np.uint8), bitorder='little') for chunk in filtered), chunk_bytes
+        )
+
+    def _filtered(self, chunks, current: bytes, nbits: int):
+        for following in chunks:
+            window: BitStream = BitStream(buffer=current + following)
+            inputs: list[np.ndarray] = [window[p:p + nbits].packed_array() for p in self.positions]
+            yield eval_anf(self.anf, inputs).tobytes()
+            current = following
+
+class ShrinkingGenerator(KeystreamGenerator):
+    """
+    lfsr_list = [data, selector], clocked together: the data bit is output when the selector bit is 1
+    """
+
+    # error messages
+    SELECTOR_ERROR: str = "Selector register outputs only zeros, so no bit is ever output"
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._check_registers(2)
+
+    def iter_chunks(self, seeds: list, chunk_bytes: int = None):
+        """
+        endless keystream packed into chunks of chunk_bytes bytes
+        raises ValueError for a selector seed of 0, or once the selector has output no 1 for more
+        than 2^degree steps, the longest its output can stay 0 without being stuck at zero
+        """
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        selector_seed = seeds[1] if len(seeds) == 2 else None
+        if (int(selector_seed, 2) if isinstance(selector_seed, str) else selector_seed) == 0:
+            raise ValueError(self.SELECTOR_ERROR)
+        data, selector = self._sources(seeds)
+        step: int = 8*chunk_bytes
+        limit: int = 1 << self.lfsr_list[1].degree
+
+        def pieces():
+            idle: int = 0 # selector steps since the last 1
+            while True:
+                selected: np.ndarray = selector.take(step) == 1
+                kept: np.ndarray = data.take(step)[selected]
+                idle = step - 1 - int(np.flatnonzero(selected)[-1]) if len(kept) else idle + step
+                if idle > limit:
+                    raise ValueError(self.SELECTOR_ERROR)
+                yield kept
+        yield from pack_pieces(pieces(), chunk_bytes)
+
+class StopAndGoGenerator(KeystreamGenerator):
+    """
+    lfsr_list = [control, data]: at step k the data register is clocked when control bit k is 1,
+    and output bit k is the data output after that step
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._check_registers(2)
+
+    def iter_chunks(self, seeds: list, chunk_bytes: int = None):
+        """
+        endless keystream packed into chunks of chunk_bytes bytes
+        """
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        control, data = self._sources(seeds)
+        step: int = 8*chunk_bytes
+
+        def pieces():
+            shown: np.ndarray = data.take(1) # output of the data register before any clocking
+            while True:
+                clocks: np.ndarray = control.take(step)
+                counts: np.ndarray = np.cumsum(clocks, dtype=np.int64)
+                window: np.ndarray = np.concatenate([shown, data.take(int(counts[-1]))])
+                yield window[counts]
+                shown = window[-1:]
+        yield from pack_pieces(pieces(), chunk_bytes)
+
+class AlternatingStepGenerator(KeystreamGenerator):
+    """
+    lfsr_list = [control, a, b]: at step k register a is clocked when control bit k is 1, else b,
+    and output bit k is the XOR of the outputs of a and b after that step
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._check_registers(3)
+
+    def iter_chunks(self, seeds: list, chunk_bytes: int = None):
+        """
+        endless keystream packed into chunks of chunk_bytes bytes
+        """
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        control, a, b = self._sources(seeds)
+        step: int = 8*chunk_bytes
+
+        def pieces():
+            shown_a: np.ndarray = a.take(1)
+            shown_b: np.ndarray = b.take(1)
+            while True:
+                clocks: np.ndarray = control.take(step)
+                counts_a: np.ndarray = np.cumsum(clocks, dtype=np.int64)
+                counts_b: np.ndarray = np.arange(1, step + 1) - counts_a
+                window_a: np.ndarray = np.concatenate([shown_a, a.take(int(counts_a[-1]))])
+                window_b: np.ndarray = np.concatenate([shown_b, b.take(int(counts_b[-1]))])
+                yield window_a[counts_a] ^ window_b[counts_b]
+                shown_a, shown_b = window_a[-1:], window_b[-1:]
+        yield from pack_pieces(pieces(), chunk_bytes)
@@ -0,0 +1,151 @@
+"""
+correlation attack on the registers of a keystream generator
+
+output bit k of an LFSR from seed s is the parity of s & r_k, for the rows r_k of its output map,
+so the correlation of the observed stream z with the output of every seed at once,
+C(s) = sum over k of (-1)^(z_k + <r_k, s>), is the Walsh-Hadamard transform of the array F
+with F[r] = sum over the k with r_k = r of (-1)^z_k
+
+seeds are split on their high bits: for each value h of these, the transform over the low bits
+of F weighted by (-1)^<high bits of r_k, h> scores the 2^low seeds with those high bits,
+so memory is 2^SPLIT_BITS entries and the blocks are shared out to a process pool
+"""
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .lfsr import LFSR
+from .bitstream import BitStream
+from .functions.boolean import parity, walsh_hadamard
+from .instrument import instrumented
+
+def output_rows(lfsr: LFSR, nbits: int) -> np.ndarray:
+    """
+    rows r_0 ... r_{nbits-1} of the output map of a Fibonacci register as a uint64 array,
+    bit j of r_k being output bit k from the unit seed e_j
+    """
+    degree: int = lfsr.degree
+    fibonacci: LFSR = lfsr.to_fibonacci() if lfsr.config == 'galois' else lfsr
+    units: np.ndarray = fibonacci.generate_batch([1 << j for j in range(degree)], nbits)
+    rows: np.ndarray = np.zeros(nbits, dtype=np.uint64)
+    for j in range(degree):
+        bits: np.ndarray = np.unpackbits(units[j], count=nbits, bitorder='little')
+        rows |= bits.astype(np.uint64) << np.uint64(j)
+    return rows
+
+_worker_rows: np.ndarray = None # rows and signs of the register under attack, sent once to each worker process
+_worker_signs: np.ndarray = None
+
+def _init_worker(rows: np.ndarray, signs: np.ndarray) -> None:
+    global _worker_rows, _worker_signs
+    _worker_rows, _worker_signs = rows, signs
+
+def _score_blocks(high_values: list[int], low_bits: int, top: int, rows: np.ndarray = None, signs: np.ndarray = None) -> list[tuple]:
+    """
+    the top (|correlation|, correlation, seed) of the seeds whose high bits are in high_values,
+    against the given rows and signs or else those of this worker process
+    """
+    rows: np.ndarray = rows if rows is not None else _worker_rows
+    signs: np.ndarray = signs if signs is not None else _worker_signs
+    low: np.ndarray = (rows & np.uint64((1 << low_bits) - 1)).astype(np.int64)
+    high: np.ndarray = rows >> np.uint64(low_bits)
+
+    best: list[tuple] = []
+    for h in high_values:
+        weights: np.ndarray = signs if h == 0 else signs * (1.0 - 2.0*parity(high & np.uint64(h)))
+        spectrum: np.ndarray = walsh_hadamard(np.bincount(low, weights=weights, minlength=1 << low_bits))
+        if h == 0:
+            spectrum[0] = 0 # the all-zero seed is no register state
+        keep: int = min(top, len(spectrum))
+        indices: np.ndarray = np.argpartition(-np.abs(spectrum), keep - 1)[:keep]
+        best += [(abs(int(spectrum[i])), int(spectrum[i]), (h << low_bits) | int(i)) for i in indices]
+    return heapq.nlargest(top, best)
+
+class CorrelationAttack:
+    """
+    rank the seeds of each register in lfsr_list by the correlation of its output with the stream
+    a register of a combination generator is recovered on its own when the combining function
+    correlates with its output, see functions.boolean.input_correlations
+    """
+
+    WORKERS: int = 1 # score in this process
+    TOP: int = 5 # seeds kept per register
+    SPLIT_BITS: int = 20 # seed bits scored per transform, 2^SPLIT_BITS entries in memory per worker
+    MAX_DEGREE: int = 40
+
+    # error messages
+    DEGREE_ERROR: str = "Correlation attack supports degrees up to {}"
+    LENGTH_ERROR: str = "Stream of {} bits is shorter than the degree {}"
+
+    def __init__(self, **kwargs) -> None:
+        """
+        stream may be a '0'/'1' string or a BitStream, lfsr_list the candidate registers, i.e. tap sets
+        pass workers > 1 to score blocks of seeds in a process pool, top for the seeds kept per register
+        """
+        self.stream = kwargs['stream']
+        self.bitstream: BitStream = self.stream if isinstance(self.stream, BitStream) else BitStream.from_str(self.stream)
+        self.lfsr_list: list[LFSR] = kwargs['lfsr_list']
+        try:
+            self.workers: int = kwargs['workers']
+        except KeyError:
+            self.workers: int = self.WORKERS
+        try:
+            self.top: int = kwargs['top']
+        except KeyError:
+            self.top: int = self.TOP
+        try:
+            self.split_bits: int = kwargs['split_bits']
+        except KeyError:
+            self.split_bits: int = self.SPLIT_BITS
+
+        for lfsr in self.lfsr_list:
+            if lfsr.degree > self.MAX_DEGREE:
+                raise ValueError(self.DEGREE_ERROR.format(self.MAX_DEGREE))
+            if lfsr.degree > len(self.bitstream):
+                raise ValueError(self.LENGTH_ERROR.format(len(self.bitstream), lfsr.degree))
+
+    @instrumented(
+        'CorrelationAttack.attack',
+        params=lambda self: {'stream_length': len(self.bitstream), 'registers': len(self.lfsr_list), 'workers': self.workers},
+        counts=lambda self: {'seeds_scored': sum(2**lfsr.degree - 1 for lfsr in self.lfsr_list)}
+    )
+    def attack(self) -> None:
+        """
+        sets results, a list of dicts ranked by |correlation| over all registers, with the register's
+        degree and tap_positions, the seed (a Galois state in Galois configuration), the correlation in [-1, 1],
+        agreement, the fraction of stream bits matched by the register output, and z_score,
+        the correlation in standard deviations of that of a random seed
+        a negative correlation means the register output matches the complemented stream
+        """
+        length: int = len(self.bitstream)
+        signs: np.ndarray = 1.0 - 2.0*self.bitstream.bits()
+
+        results: list[dict] = []
+        for lfsr in self.lfsr_list:
+            rows: np.ndarray = output_rows(lfsr, length)
+            low_bits: int = min(lfsr.degree, self.split_bits)
+            high_values: list[int] = list(range(1 << (lfsr.degree - low_bits)))
+
+            if self.workers <= 1 or len(high_values) == 1:
+                best: list[tuple] = _score_blocks(high_values, low_bits, self.top, rows, signs)
+            else:
+                batches: list[list[int]] = [high_values[i::self.workers] for i in range(self.workers)]
+                with ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_init_worker, initargs=(rows, signs)
+                ) as pool:
+                    futures: list = [pool.submit(_score_blocks, batch, low_bits, self.top) for batch in batches]
+                    best: list[tuple] = heapq.nlargest(
+                        self.top, (entry for future in futures for entry in future.result())
+                    )
+
+            for _, correlation, seed in best:
+                results += [{
+                    'degree': lfsr.degree,
+                    'tap_positions': lfsr.tap_positions,
+                    'seed': lfsr.to_galois_state(seed) if lfsr.config == 'galois' else seed,
+                    'correlation': correlation / length,
+                    'agreement': (1 + correlation / length) / 2,
+                    'z_score': correlation / length**0.5
+                }]
+
+        self.length: int = length
+        self.results: list[dict] = sorted(results, key=lambda result: -abs(result['correlation']))
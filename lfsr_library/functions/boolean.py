@@ -0,0 +1,104 @@
+"""
+Boolean functions of n inputs, as truth tables and in algebraic normal form (ANF)
+
+a truth table lists f(v) for v = 0 ... 2^n - 1, bit i of v being input i
+an ANF is a list of monomials, each a tuple of input indices, () the constant 1,
+f being the XOR of the ANDs of its monomials, e.g. [(0, 1), (1, 2), (2,)] for the Geffe function
+"""
+import numpy as np
+
+TABLE_ERROR: str = "Truth table needs 2^n entries of 0 or 1"
+ANF_ERROR: str = "Monomial inputs must lie in 0 ... n-1"
+
+def truth_table_array(table, n: int = None) -> np.ndarray:
+    """
+    0/1 uint8 array of a truth table given as a sequence, or as an int with bit v the value f(v)
+    """
+    if isinstance(table, int):
+        table: list[int] = [(table >> v) & 1 for v in range(1 << n)]
+    table: np.ndarray = np.asarray(table, dtype=np.uint8)
+    size: int = len(table)
+    if size == 0 or size & (size - 1) or np.any(table > 1) or (n is not None and size != 1 << n):
+        raise ValueError(TABLE_ERROR)
+    return table
+
+def truth_table_to_anf(table) -> list[tuple[int]]:
+    """
+    ANF of a truth table, by the binary Moebius transform
+    """
+    coefficients: np.ndarray = truth_table_array(table).copy()
+    n: int = len(coefficients).bit_length() - 1
+    for i in range(n):
+        step: int = 1 << i
+        blocks: np.ndarray = coefficients.reshape(-1, 2*step)
+        blocks[:, step:] ^= blocks[:, :step]
+    return [tuple(i for i in range(n) if (v >> i) & 1) for v in np.flatnonzero(coefficients)]
+
+def anf_to_truth_table(anf: list[tuple[int]], n: int) -> np.ndarray:
+    """
+    truth table of an ANF in n inputs
+    """
+    check_anf(anf, n)
+    values: np.ndarray = np.arange(1 << n)
+    table: np.ndarray = np.zeros(1 << n, dtype=np.uint8)
+    for monomial in anf:
+        mask: int = sum(1 << i for i in set(monomial))
+        table ^= ((values & mask) == mask).astype(np.uint8)
+    return table
+
+def check_anf(anf: list[tuple[int]], n: int) -> list[tuple[int]]:
+    if any(not 0 <= i < n for monomial in anf for i in monomial):
+        raise ValueError(ANF_ERROR)
+    return [tuple(monomial) for monomial in anf]
+
+def eval_anf(anf: list[tuple[int]], inputs: list[np.ndarray]) -> np.ndarray:
+    """
+    f applied bitwise to equally shaped packed arrays, one per input
+    bits past the end of the inputs are not cleared, as the constant monomial sets them
+    """
+    out: np.ndarray = np.zeros_like(inputs[0])
+    for monomial in anf:
+        if not monomial:
+            out ^= np.invert(np.zeros_like(out))
+            continue
+        term: np.ndarray = inputs[monomial[0]].copy()
+        for i in monomial[1:]:
+            term &= inputs[i]
+        out ^= term
+    return out
+
+def parity(values: np.ndarray) -> np.ndarray:
+    """
+    parity of each entry of an unsigned integer array, as 0/1 of the same dtype
+    """
+    values: np.ndarray = values.copy()
+    shift: int = 8 * values.dtype.itemsize // 2
+    while shift:
+        values ^= values >> values.dtype.type(shift)
+        shift //= 2
+    return values & values.dtype.type(1)
+
+def walsh_hadamard(values: np.ndarray) -> np.ndarray:
+    """
+    Walsh-Hadamard transform in place, entry s becoming the sum over r of values[r] (-1)^<r, s>,
+    for an array of 2^n entries, in n passes over the array
+    """
+    size: int = len(values)
+    step: int = 1
+    while step < size:
+        blocks: np.ndarray = values.reshape(-1, 2, step)
+        low: np.ndarray = blocks[:, 0, :].copy()
+        blocks[:, 0, :] += blocks[:, 1, :]
+        np.subtract(low, blocks[:, 1, :], out=blocks[:, 1, :])
+        step *= 2
+    return values
+
+def input_correlations(table) -> np.ndarray:
+    """
+    correlation of a Boolean function with each of its inputs, in [-1, 1],
+    from its Walsh spectrum at the unit vectors; nonzero entries mark the inputs open to a correlation attack
+    """
+    table: np.ndarray = truth_table_array(table)
+    n: int = len(table).bit_length() - 1
+    spectrum: np.ndarray = walsh_hadamard(1 - 2*table.astype(np.int64))
+    return np.array([spectrum[1 << i] / len(table) for i in range(n)])
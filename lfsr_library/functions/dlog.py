@@ -0,0 +1,156 @@
+"""
+discrete logarithms of X modulo a polynomial over GF(2)
+
+modulo an irreducible f of degree n, X generates a cyclic group whose order e divides 2^n - 1,
+so log_X q is found by Pohlig-Hellman: one baby-step giant-step search per prime p | e, digit by
+digit of its power, in O(sqrt(p)) products, the results joined by the Chinese remainder theorem
+modulo a power g^e the order of X is ord(g) 2^t, 2^t the least power of 2 >= e, and the log modulo g
+is lifted by trying its 2^t candidates; the logs modulo the factors g^e of f are joined the same way
+a factor X^k of f only allows the powers X^n with n < k, checked directly, or n >= k
+
+baby-step tables depend only on f and p, and are cached for repeated queries
+"""
+from functools import lru_cache
+from math import gcd, isqrt
+from .gf2 import poly_deg, poly_mul, poly_mod, poly_mulmod, poly_powmod
+from .factor import mersenne_primes, irreducible_order, poly_factor
+
+MAX_BABY_STEPS: int = 1 << 22 # largest cached table, so prime factors of the order up to 2^44
+
+# error messages
+BABY_STEPS_ERROR: str = "Prime factor {} of the order needs more than MAX_BABY_STEPS baby steps"
+
+def _order_factors(f: int) -> list[tuple[int]]:
+    """
+    (p, k) for each prime power p^k exactly dividing the order of X modulo the irreducible f
+    """
+    order: int = irreducible_order(f)
+    factors: list[tuple[int]] = []
+    for p in mersenne_primes(poly_deg(f)):
+        k: int = 0
+        while order % p == 0:
+            order //= p
+            k += 1
+        if k:
+            factors += [(p, k)]
+    return factors
+
+@lru_cache(maxsize=64)
+def baby_steps(f: int, p: int) -> tuple:
+    """
+    for gamma = X^(e/p), of order p: the table gamma^j -> j for j < m = ceil(sqrt p),
+    and the giant step gamma^-m
+    """
+    m: int = isqrt(p - 1) + 1
+    if m > MAX_BABY_STEPS:
+        raise ValueError(BABY_STEPS_ERROR.format(p))
+    gamma: int = poly_powmod(0b10, irreducible_order(f) // p, f)
+    table: dict = {}
+    power: int = 1
+    for j in range(m):
+        table.setdefault(power, j)
+        power = poly_mulmod(power, gamma, f)
+    return table, poly_powmod(gamma, p - m % p, f)
+
+def _prime_log(f: int, p: int, target: int) -> int:
+    """
+    j < p with gamma^j = target, for target in the subgroup of order p
+    """
+    table, giant = baby_steps(f, p)
+    m: int = isqrt(p - 1) + 1
+    y: int = target
+    for i in range(m):
+        try:
+            return i*m + table[y]
+        except KeyError:
+            y = poly_mulmod(y, giant, f)
+    raise ValueError("target outside the subgroup of order p")
+
+def irreducible_log(q: int, f: int) -> int:
+    """
+    least n >= 0 with X^n = q modulo the irreducible f, None if q is not a power of X
+    """
+    q: int = poly_mod(q, f)
+    order: int = irreducible_order(f)
+    if q == 0 or poly_powmod(q, order, f) != 1:
+        return None
+
+    residues: list[tuple[int]] = []
+    for p, k in _order_factors(f):
+        modulus: int = p**k
+        cofactor: int = order // modulus
+        g: int = poly_powmod(0b10, cofactor, f) # order p^k
+        h: int = poly_powmod(q, cofactor, f)
+        x: int = 0
+        for i in range(k):
+            # (g^-x h)^(p^(k-1-i)) lies in the subgroup of order p, as gamma^digit
+            reduced: int = poly_mulmod(poly_powmod(g, modulus - x, f), h, f)
+            digit: int = _prime_log(f, p, poly_powmod(reduced, p**(k - 1 - i), f))
+            x += digit * p**i
+        residues += [(x, modulus)]
+    return crt(residues)[0]
+
+def crt(residues: list[tuple[int]]) -> tuple:
+    """
+    (x, lcm) with x = a mod n for each (a, n), moduli not necessarily coprime
+    x is None when the congruences are inconsistent
+    """
+    x: int = 0
+    modulus: int = 1
+    for a, n in residues:
+        g: int = gcd(modulus, n)
+        if (a - x) % g:
+            return None, modulus
+        step: int = (a - x) // g * pow(modulus // g, -1, n // g) % (n // g) if n // g > 1 else 0
+        x += step * modulus
+        modulus = modulus // g * n
+        x %= modulus
+    return x, modulus
+
+def power_log(q: int, g: int, e: int) -> tuple:
+    """
+    (n, order) with n least such that X^n = q modulo g^e, for the irreducible g != X, and order
+    that of X modulo g^e; n is None when q is not a power of X
+    """
+    modulus: int = 1
+    for _ in range(e):
+        modulus = poly_mul(modulus, g)
+    g_order: int = irreducible_order(g)
+    lifts: int = 1 << (e - 1).bit_length()
+    base: int = irreducible_log(q, g) # n = base modulo ord(g)
+    if base is None:
+        return None, g_order * lifts
+
+    q: int = poly_mod(q, modulus)
+    power: int = poly_powmod(0b10, base, modulus)
+    step: int = poly_powmod(0b10, g_order, modulus)
+    for j in range(lifts):
+        if power == q:
+            return base + j*g_order, g_order * lifts
+        power = poly_mulmod(power, step, modulus)
+    return None, g_order * lifts
+
+def poly_log(q: int, f: int) -> int:
+    """
+    least n >= 0 with X^n = q modulo f, None if there is none
+    """
+    q: int = poly_mod(q, f)
+    k: int = (f & -f).bit_length() - 1 # f = X^k h with h(0) = 1
+    for n in range(k):
+        if poly_mod(1 << n, f) == q:
+            return n
+    if q & ((1 << k) - 1): # X^n = 0 modulo X^k for n >= k
+        return None
+
+    residues: list[tuple[int]] = []
+    for g, e in poly_factor(f >> k):
+        n, order = power_log(q, g, e)
+        if n is None:
+            return None
+        residues += [(n, order)]
+    n, order = crt(residues)
+    if n is None:
+        return None
+    if n < k:
+        n += -(-(k - n) // order) * order
+    return n
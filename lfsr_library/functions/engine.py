@@ -0,0 +1,189 @@
+"""
+word-parallel generation engine
+
+states are ints numbered LSb as in LFSR, so bit i of state k is output bit k+i.
+the engine advances a state by `width` steps at once: the block map sends a state
+to the window of its next (width + degree) sequence bits, low width bits being the
+output and high degree bits the state after width steps. the block map is linear
+over GF(2), so it is evaluated as an XOR of byte-indexed table lookups.
+"""
+from functools import lru_cache
+import numpy as np
+from .gf2 import mat_pow
+
+MIN_WIDTH: int = 256 # output bits per block for small registers
+
+def block_width(degree: int) -> int:
+    """
+    bits emitted per block, a multiple of 8 no smaller than degree
+    """
+    return max(MIN_WIDTH, 8 * -(-degree // 8))
+
+def lfsr_images(degree: int, mask: int, width: int) -> list[int]:
+    """
+    block map images of each basis state e_0, ..., e_{degree-1}
+    mask has bit p set for each tap position p
+    """
+    dmask: int = (1 << degree) - 1
+    top: int = width + degree - 1
+
+    # window generated from e_{degree-1}, stepped bit by bit
+    window: int = 1 << (degree - 1)
+    state: int = window
+    for k in range(degree, width + degree):
+        new_bit: int = (state & mask).bit_count() & 1
+        state = (state >> 1) | (new_bit << (degree - 1))
+        window |= new_bit << k
+
+    # e_{i-1} = T(e_i) ^ [i tapped] e_{degree-1}, and Y(T s) is Y(s) shifted down one bit
+    images: list[int] = [0] * degree
+    images[degree - 1] = window
+    last: int = window
+    for i in range(degree - 1, 0, -1):
+        state = (last >> width) & dmask
+        new_bit = (state & mask).bit_count() & 1
+        shifted: int = (last >> 1) | (new_bit << top)
+        if (mask >> i) & 1:
+            shifted ^= window
+        images[i - 1] = shifted
+        last = shifted
+
+    return images
+
+def linear_images(columns: tuple[int], width: int) -> list[int]:
+    """
+    block map images of each basis state for any one-step linear map M, given by its columns
+    output bit j of a state s is bit 0 of M^j s, i.e. the parity of s & r_j
+    for the row r_j = e_0 M^j, whose bit i is the parity of r_{j-1} & M e_i
+    """
+    degree: int = len(columns)
+    images: list[int] = [0] * degree
+    row: int = 1
+    for j in range(width):
+        bits: int = row
+        i: int = 0
+        while bits:
+            if bits & 1:
+                images[i] |= 1 << j
+            bits >>= 1
+            i += 1
+        row = sum(((row & column).bit_count() & 1) << i for i, column in enumerate(columns))
+
+    for i, column in enumerate(mat_pow(list(columns), width)):
+        images[i] |= column << width
+    return images
+
+def block_tables(images: list[int]) -> tuple[list[int]]:
+    """
+    one 256-entry table per state byte, table[c][v] = image of (v << 8c)
+    """
+    tables: list[list[int]] = []
+    for c in range(0, len(images), 8):
+        chunk: list[int] = images[c:c+8]
+        table: list[int] = [0] * 256
+        for v in range(1, 256):
+            low: int = v & -v
+            pos: int = low.bit_length() - 1
+            image: int = chunk[pos] if pos < len(chunk) else 0
+            table[v] = table[v ^ low] ^ image
+        tables += [table]
+    return tuple(tables)
+
+@lru_cache(maxsize=64)
+def lfsr_tables(degree: int, mask: int) -> tuple:
+    """
+    cached (width, tables) for a Fibonacci LFSR
+    """
+    width: int = block_width(degree)
+    return width, block_tables(lfsr_images(degree, mask, width))
+
+@lru_cache(maxsize=64)
+def linear_tables(columns: tuple[int]) -> tuple:
+    """
+    cached (width, tables) for a linear map given by its columns
+    """
+    width: int = block_width(len(columns))
+    return width, block_tables(linear_images(columns, width))
+
+def run_blocks(tables: tuple, width: int, state: int, nblocks: int) -> tuple:
+    """
+    step state through nblocks blocks
+    returns the output packed LSb first into a bytearray and the final state
+    """
+    nchunks: int = len(tables)
+    nbytes: int = width // 8
+    wmask: int = (1 << width) - 1
+    out: bytearray = bytearray()
+    for _ in range(nblocks):
+        y: int = 0
+        for table, byte in zip(tables, state.to_bytes(nchunks, 'little')):
+            y ^= table[byte]
+        out += (y & wmask).to_bytes(nbytes, 'little')
+        state = y >> width
+    return out, state
+
+def iter_blocks(tables: tuple, width: int, state: int, chunk_bytes: int):
+    """
+    endless run_blocks output regrouped into chunks of chunk_bytes bytes,
+    holding less than one chunk plus one block at a time
+    """
+    nblocks: int = -(-8*chunk_bytes // width)
+    pending: bytearray = bytearray()
+    while True:
+        while len(pending) < chunk_bytes:
+            buffer, state = run_blocks(tables, width, state, nblocks)
+            pending += buffer
+        chunk: bytes = bytes(pending[:chunk_bytes])
+        del pending[:chunk_bytes]
+        yield chunk
+
+@lru_cache(maxsize=16)
+def batch_tables(degree: int, mask: int) -> tuple:
+    """
+    cached (width, tables) for stepping many Fibonacci LFSR states at once
+    width is a multiple of 64 and tables a uint64 array, tables[c, v] the image of (v << 8c)
+    as little-endian words, so that a lookup per state byte serves a whole batch
+    """
+    width: int = 64 * -(-block_width(degree) // 64)
+    nwords: int = -(-(width + degree) // 64)
+    tables: list[bytes] = [
+        b''.join(image.to_bytes(8*nwords, 'little') for image in table)
+        for table in block_tables(lfsr_images(degree, mask, width))
+    ]
+    return width, np.frombuffer(b''.join(tables), dtype='<u8').reshape(len(tables), 256, nwords)
+
+def run_batch(tables: np.ndarray, width: int, states: np.ndarray, nblocks: int) -> tuple:
+    """
+    step a batch of states, one row of state bytes each, through nblocks blocks in lockstep
+    returns the outputs packed LSb first, one row per state, and the final states
+    """
+    nchunks: int = tables.shape[0]
+    nbytes: int = width // 8
+    out: np.ndarray = np.empty((len(states), nblocks * nbytes), dtype=np.uint8)
+    for block in range(nblocks):
+        y: np.ndarray = tables[0][states[:, 0]]
+        for c in range(1, nchunks):
+            y ^= tables[c][states[:, c]]
+        window: np.ndarray = y.view(np.uint8)
+        out[:, block*nbytes:(block+1)*nbytes] = window[:, :nbytes]
+        states = window[:, nbytes:nbytes + nchunks]
+    return out, states
+
+def pack_bits(buffer: bytearray, nbits: int) -> bytes:
+    """
+    truncate a packed buffer to nbits, zeroing the unused high bits of the last byte
+    """
+    nbytes: int = -(-nbits // 8)
+    packed: bytearray = buffer[:nbytes]
+    if nbits % 8:
+        packed[-1] &= (1 << (nbits % 8)) - 1
+    return bytes(packed)
+
+def unpack_str(packed: bytes, nbits: int) -> str:
+    """
+    legacy '0'/'1' string of the first nbits of a packed buffer, in stream order
+    """
+    if nbits == 0:
+        return ''
+    value: int = int.from_bytes(packed, 'little') & ((1 << nbits) - 1)
+    return format(value, f'0{nbits}b')[::-1]
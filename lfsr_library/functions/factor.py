@@ -0,0 +1,315 @@
+"""
+factoring over GF(2) and multiplicative orders
+
+the order of X modulo an irreducible polynomial of degree n divides 2^n - 1,
+whose prime factors are read from data/mersenne_factors.txt
+"""
+import os
+from functools import lru_cache
+from math import gcd, isqrt
+from random import getrandbits, randrange
+from .gf2 import poly_deg, poly_square, poly_divmod, poly_mod, poly_powmod, poly_gcd
+
+FACTORS_PATH: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'mersenne_factors.txt')
+RHO_ITERATIONS: int = 1 << 20 # Pollard rho budget for 2^n - 1 beyond the table, enough for small cofactors only
+
+# error messages
+FACTOR_ERROR: str = (
+    "2^{0} - 1 is not completely factored, so the order of X modulo an irreducible factor of degree {0} "
+    "cannot be certified; the factor table is complete for degrees up to 672 and most up to 1024"
+)
+ORDER_ERROR: str = "X has no multiplicative order modulo a polynomial divisible by X"
+
+# integers
+
+def is_probable_prime(n: int) -> bool:
+    """
+    Miller-Rabin with the first 13 prime bases, deterministic below 3.3 * 10^24
+    """
+    bases: tuple[int] = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    if n < 2:
+        return False
+    for q in bases:
+        if n % q == 0:
+            return n == q
+    d: int = n - 1
+    s: int = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in bases:
+        x: int = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _rho(n: int) -> int:
+    """
+    a proper factor of the composite n by Pollard-Brent, or 0 if the budget runs out
+    """
+    if n % 2 == 0:
+        return 2
+    c: int = randrange(1, n)
+    y: int = randrange(0, n)
+    m: int = 128
+    g: int = 1
+    r: int = 1
+    q: int = 1
+    while g == 1 and r < RHO_ITERATIONS:
+        x: int = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k: int = 0
+        while k < r and g == 1:
+            ys: int = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += m
+        r *= 2
+    if g == n:
+        g = 1
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+    return g if g != n else 0
+
+def _factor_int(n: int, primes: set) -> bool:
+    """
+    add the prime factors of n to primes, False if some factor resists
+    """
+    if n == 1:
+        return True
+    if is_probable_prime(n):
+        primes.add(n)
+        return True
+    root: int = isqrt(n)
+    if root * root == n:
+        return _factor_int(root, primes)
+    factor: int = _rho(n)
+    if factor == 0:
+        return False
+    return _factor_int(factor, primes) and _factor_int(n // factor, primes)
+
+@lru_cache(maxsize=1)
+def _mersenne_table() -> dict:
+    table: dict = {}
+    with open(FACTORS_PATH) as file:
+        for line in file:
+            if line.startswith('#'):
+                continue
+            n, entry = line.split(':')
+            primes, _, cofactor = entry.partition('|')
+            table[int(n)] = (
+                tuple(int(q) for q in primes.split(',') if q.strip()),
+                int(cofactor) if cofactor.strip() else 1
+            )
+    return table
+
+@lru_cache(maxsize=None)
+def mersenne_factors(n: int) -> tuple:
+    """
+    distinct primes dividing 2^n - 1 and the product of its factors not yet split into primes, 1 if none
+    beyond the table, the part of 2^n - 1 coprime to 2^d - 1 for smaller d | n is tried by Pollard rho,
+    which only splits it when its factors are small; cofactors in the table are not retried
+    """
+    table: dict = _mersenne_table()
+    primes: set = set()
+    unfactored: int = 1
+    for d in range(1, n + 1):
+        if n % d:
+            continue
+        try:
+            known, cofactor = table[d]
+        except KeyError:
+            cofactor: int = (1 << d) - 1
+            for e in range(1, d):
+                if d % e == 0:
+                    common: int = gcd(cofactor, (1 << e) - 1)
+                    while common > 1:
+                        cofactor //= common
+                        common = gcd(cofactor, common)
+            known: tuple = ()
+            if _factor_int(cofactor, primes):
+                cofactor = 1
+        primes.update(known)
+        unfactored *= cofactor
+    return tuple(sorted(primes)), unfactored
+
+def mersenne_primes(n: int) -> tuple[int]:
+    """
+    distinct primes dividing 2^n - 1, raising FACTOR_ERROR when some factor is unknown
+    """
+    primes, unfactored = mersenne_factors(n)
+    if unfactored != 1:
+        raise ValueError(FACTOR_ERROR.format(n))
+    return primes
+
+# polynomials
+
+def _derivative(f: int) -> int:
+    """
+    formal derivative: the odd-power terms X^k become X^(k-1)
+    """
+    odd: int = int.from_bytes(b'\xaa' * ((f.bit_length() + 7) // 8), 'little')
+    return (f & odd) >> 1
+
+def _sqrt(f: int) -> int:
+    """
+    g with g^2 = f, for f having only even-power terms
+    """
+    g: int = 0
+    i: int = 0
+    while f:
+        g |= (f & 1) << i
+        f >>= 2
+        i += 1
+    return g
+
+def _squarefree(f: int) -> list[tuple[int]]:
+    """
+    (g, e) with each g squarefree and f the product of the g^e
+    """
+    factors: list[tuple[int]] = []
+    if poly_deg(f) < 1:
+        return factors
+    derivative: int = _derivative(f)
+    if derivative == 0:
+        return [(g, 2*e) for g, e in _squarefree(_sqrt(f))]
+
+    c: int = poly_gcd(f, derivative)
+    w: int = poly_divmod(f, c)[0]
+    i: int = 1
+    while w != 1:
+        y: int = poly_gcd(w, c)
+        z: int = poly_divmod(w, y)[0]
+        if z != 1:
+            factors += [(z, i)]
+        i += 1
+        w = y
+        c = poly_divmod(c, y)[0]
+    if c != 1:
+        factors += [(g, 2*e) for g, e in _squarefree(_sqrt(c))]
+    return factors
+
+def _distinct_degree(f: int) -> list[tuple[int]]:
+    """
+    (g, i) with g the product of the irreducible factors of degree i of the squarefree f
+    """
+    factors: list[tuple[int]] = []
+    h: int = 0b10
+    i: int = 0
+    while poly_deg(f) >= 2*(i + 1):
+        i += 1
+        h = poly_mod(poly_square(h), f) # X^(2^i)
+        g: int = poly_gcd(f, h ^ 0b10)
+        if g != 1:
+            factors += [(g, i)]
+            f = poly_divmod(f, g)[0]
+            h = poly_mod(h, f)
+    if poly_deg(f) > 0:
+        factors += [(f, poly_deg(f))]
+    return factors
+
+def _equal_degree(g: int, i: int) -> list[int]:
+    """
+    irreducible factors of g, all of degree i, by Cantor-Zassenhaus:
+    the trace a + a^2 + ... + a^(2^(i-1)) is 0 or 1 modulo each factor, splitting g
+    """
+    if poly_deg(g) == i:
+        return [g]
+    while True:
+        a: int = getrandbits(poly_deg(g))
+        trace: int = a
+        for _ in range(i - 1):
+            a = poly_mod(poly_square(a), g)
+            trace ^= a
+        d: int = poly_gcd(g, trace)
+        if 0 < poly_deg(d) < poly_deg(g):
+            return _equal_degree(d, i) + _equal_degree(poly_divmod(g, d)[0], i)
+
+@lru_cache(maxsize=1024)
+def poly_factor(f: int) -> tuple[tuple[int]]:
+    """
+    irreducible factors of f with multiplicities, as sorted (factor, multiplicity) pairs
+    """
+    factors: dict = {}
+    for g, e in _squarefree(f):
+        for h, i in _distinct_degree(g):
+            for irreducible in _equal_degree(h, i):
+                factors[irreducible] = factors.get(irreducible, 0) + e
+    return tuple(sorted(factors.items()))
+
+@lru_cache(maxsize=1024)
+def poly_is_irreducible(f: int) -> bool:
+    """
+    Rabin's test: X^(2^n) = X mod f, and gcd(X^(2^(n/q)) - X, f) = 1 for each prime q | n
+    """
+    n: int = poly_deg(f)
+    if n < 1:
+        return False
+    if n == 1:
+        return True
+    if f & 1 == 0:
+        return False
+    checks: set = {n // q for q in range(2, n + 1) if n % q == 0 and is_probable_prime(q)}
+    h: int = 0b10
+    for k in range(1, n + 1):
+        h = poly_mod(poly_square(h), f)
+        if k in checks and poly_gcd(f, h ^ 0b10) != 1:
+            return False
+    return h == 0b10
+
+@lru_cache(maxsize=1024)
+def irreducible_order(g: int) -> int:
+    """
+    order of X modulo the irreducible g, a divisor of 2^n - 1
+    """
+    n: int = poly_deg(g)
+    order: int = (1 << n) - 1
+    for q in mersenne_primes(n):
+        while order % q == 0 and poly_powmod(0b10, order // q, g) == 1:
+            order //= q
+    return order
+
+@lru_cache(maxsize=1024)
+def poly_order(f: int) -> int:
+    """
+    least e > 0 with X^e = 1 mod f, for f(0) = 1:
+    the lcm of the orders of its irreducible factors, times 2^t for 2^t >= their largest multiplicity
+    """
+    if f & 1 == 0:
+        raise ValueError(ORDER_ERROR)
+    order: int = 1
+    multiplicity: int = 1
+    for g, e in poly_factor(f):
+        g_order: int = irreducible_order(g)
+        order = order * g_order // gcd(order, g_order)
+        multiplicity = max(multiplicity, e)
+    return order << (multiplicity - 1).bit_length()
+
+@lru_cache(maxsize=1024)
+def poly_is_primitive(f: int) -> bool:
+    """
+    f of degree n is primitive when irreducible with X of order 2^n - 1
+    a negative answer needs no complete factorisation of 2^n - 1, a positive one does
+    """
+    n: int = poly_deg(f)
+    if not poly_is_irreducible(f):
+        return False
+    period: int = (1 << n) - 1
+    primes, unfactored = mersenne_factors(n)
+    if any(poly_powmod(0b10, period // q, f) == 1 for q in primes):
+        return False
+    if unfactored != 1:
+        if poly_powmod(0b10, period // unfactored, f) == 1:
+            return False # the order lies in the factored part
+        raise ValueError(FACTOR_ERROR.format(n))
+    return True
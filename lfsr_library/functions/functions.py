@@ -1,5 +1,9 @@
-import sympy as sp
-from sympy.abc import x
+import re
+from functools import lru_cache
+import numpy as np
+from ..bitstream import BitStream
+
+POLY_CACHE_SIZE: int = 256 # (degree, taps) pairs whose polynomials are kept
 
 def count_state(element, condition):
     yield 1 if element==condition else 0
@@ -10,7 +14,14 @@ def count_func(enumerable, condition) -> int:
         count += next(count_state(element, condition))
     return count
 
-def hamming_len(string1: str, string2: str) -> int:
+def hamming_len(string1, string2) -> int:
+    """
+    number of differing positions of two '0'/'1' strings or two BitStreams
+    """
+    if isinstance(string1, BitStream) and isinstance(string2, BitStream):
+        if len(string1) != len(string2):
+            raise IndexError(f"string lengths mismatch, found lengths {len(string1)} and {len(string2)}")
+        return (string1 ^ string2).popcount()
 
     dist: int = 0
     if len(string1) == len(string2):
@@ -21,16 +32,86 @@ def hamming_len(string1: str, string2: str) -> int:
     else:
         raise IndexError(f"string lengths mismatch, found lengths {len(string1)} and {len(string2)}")
     
-def str_to_sp(polystring):
+def stream_bits(stream: str) -> np.ndarray:
+    """
+    0/1 uint8 array of a '0'/'1' string
+    """
+    return np.frombuffer(stream.encode('ascii'), dtype=np.uint8) - ord('0')
+
+def running_prob(bits: np.ndarray, sf: int, **kwargs) -> tuple[np.ndarray]:
+    """
+    probability (%) of bit == 1 against state number for a 0/1 array, from one cumulative sum
+    point x is the frequency over the first x bits, point 0 the first bit itself
+    kwargs: window replaces each run of window points by their mean,
+    step keeps every step-th point, max_points picks step to keep at most that many
+    """
+    ones_counts: np.ndarray = np.cumsum(bits, dtype=np.int64)
+    xdata: np.ndarray = np.arange(len(bits))
+    ydata: np.ndarray = np.empty(len(bits))
+    ydata[:1] = 100.0 * bits[:1]
+    ydata[1:] = 100 * ones_counts[:-1] / xdata[1:]
+    ydata = np.round(ydata, sf)
+
+    if 'window' in kwargs:
+        starts: np.ndarray = xdata[::kwargs['window']]
+        sizes: np.ndarray = np.diff(np.append(starts, len(xdata)))
+        ydata = np.round(np.add.reduceat(ydata, starts) / sizes, sf) if len(starts) else ydata
+        xdata = starts
+
+    try:
+        step: int = kwargs['step']
+    except KeyError:
+        try:
+            step: int = max(1, -(-len(xdata) // kwargs['max_points']))
+        except KeyError:
+            step: int = 1
+    return xdata[::step], ydata[::step]
+
+def poly_str(poly: int) -> str:
+    """
+    'X^0 + X^2 + ...' form of a polynomial held as an int, bit i the coefficient of X^i
+    """
+    return ' + '.join(f'X^{power}' for power in range(poly.bit_length()) if (poly >> power) & 1)
 
-    sp_construct: list[int] = []
-    for i, char in enumerate(polystring):
-        if char == '^':
-            pwr: int = int(polystring[i+1])
-            sp_construct += [pwr]
+def probability_dicts(zeros_count: int, ones_count: int, sf: int) -> tuple[dict]:
+    """
+    bit frequencies and Laplace succession probabilities as percentage strings
+    """
+    stream_length: int = zeros_count + ones_count
+    randomness_dict: dict = {
+        '0': f"{100*zeros_count / stream_length:.{sf}f} %",
+        '1': f"{100*ones_count / stream_length:.{sf}f} %"
+    }
+    laplace_succession: dict = {
+        '0': f'{100 * (zeros_count + 1) / (stream_length + 2):.{sf}f} %',
+        '1': f'{100 * (ones_count + 1) / (stream_length + 2):.{sf}f} %'
+    }
+    return randomness_dict, laplace_succession
 
-    sp_poly: sp.core.symbol.Symbol = x**0
-    for pwr in sp_construct:
+def taps_to_mask(tap_positions: list[int]) -> int:
+    """
+    feedback mask with bit p set for each tap position p
+    repeated taps cancel, as they do in the feedback XOR
+    """
+    mask: int = 0
+    for position in tap_positions:
+        mask ^= 1 << position
+    return mask
+
+def poly_exponents(polystring: str) -> list[int]:
+    """
+    exponents of an 'X^0 + X^a + ...' string, in order, of any number of digits
+    """
+    return [int(power) for power in re.findall(r'\^(\d+)', polystring)]
+
+def str_to_sp(polystring):
+    """
+    sympy expression of an 'X^0 + X^a + ...' string, sympy imported on first use
+    """
+    from sympy.abc import x
+
+    sp_poly = x**0
+    for pwr in poly_exponents(polystring):
         if pwr == 0:
             pass 
         else:
@@ -38,3 +119,20 @@ def str_to_sp(polystring):
 
     return sp_poly 
 
+@lru_cache(maxsize=POLY_CACHE_SIZE)
+def feedback_polynomial(degree: int, tap_positions: tuple[int]) -> str:
+    """
+    'X^0 + X^a + ... + X^degree' feedback polynomial of an LFSR
+    """
+    polynomial: str = 'X^0'
+    for position in tap_positions:
+        if position != 0:
+            polynomial += f' + X^{position}'
+    return polynomial + f' + X^{degree}'
+
+@lru_cache(maxsize=POLY_CACHE_SIZE)
+def feedback_polynomial_sp(degree: int, tap_positions: tuple[int]):
+    """
+    sympy expression of feedback_polynomial, built once per (degree, taps)
+    """
+    return str_to_sp(feedback_polynomial(degree, tap_positions))
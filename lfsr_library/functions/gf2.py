@@ -0,0 +1,435 @@
+"""
+arithmetic over GF(2)
+
+polynomials are ints with bit i the coefficient of X^i,
+so X^3 + X + 1 is 0b1011
+"""
+from functools import lru_cache
+
+def _spread(nibble: int) -> int:
+    spread: int = 0
+    for i in range(4):
+        spread |= ((nibble >> i) & 1) << (2*i)
+    return spread
+
+# byte translations used to square: bit i of a nibble moves to bit 2i
+_SQUARE_LO: bytes = bytes(_spread(v & 15) for v in range(256))
+_SQUARE_HI: bytes = bytes(_spread(v >> 4) for v in range(256))
+
+def poly_deg(a: int) -> int:
+    """
+    degree of a, -1 for the zero polynomial
+    """
+    return a.bit_length() - 1
+
+def poly_square(a: int) -> int:
+    """
+    a^2, which over GF(2) only spreads the coefficients of a
+    """
+    nbytes: int = (a.bit_length() + 7) // 8
+    data: bytes = a.to_bytes(nbytes, 'little')
+    out: bytearray = bytearray(2*nbytes)
+    out[0::2] = data.translate(_SQUARE_LO)
+    out[1::2] = data.translate(_SQUARE_HI)
+    return int.from_bytes(out, 'little')
+
+def poly_mul(a: int, b: int) -> int:
+    """
+    carry-less product a*b, four bits of a at a time
+    """
+    if a.bit_length() > b.bit_length():
+        a, b = b, a
+    window: list[int] = [0] * 16
+    for v in range(1, 16):
+        low: int = v & -v
+        window[v] = window[v ^ low] ^ (b << (low.bit_length() - 1))
+
+    product: int = 0
+    shift: int = 0
+    while a:
+        product ^= window[a & 15] << shift
+        a >>= 4
+        shift += 4
+    return product
+
+def poly_divmod(a: int, p: int) -> tuple[int]:
+    """
+    quotient and remainder of a by p by long division
+    """
+    if p == 0:
+        raise ZeroDivisionError("polynomial division by zero")
+    dp: int = poly_deg(p)
+    q: int = 0
+    while a.bit_length() - 1 >= dp:
+        shift: int = a.bit_length() - 1 - dp
+        q ^= 1 << shift
+        a ^= p << shift
+    return q, a
+
+@lru_cache(maxsize=8)
+def _reduction_tables(p: int) -> tuple:
+    """
+    table[j][v] = (v << (deg p + 8j)) mod p, one table per byte of a quotient of degree < deg p
+    """
+    dp: int = poly_deg(p)
+    dmask: int = (1 << dp) - 1
+    basis: list[int] = []
+    power: int = p & dmask # X^dp mod p
+    for _ in range(8 * -(-dp // 8)):
+        basis += [power]
+        power <<= 1
+        if power >> dp:
+            power = (power ^ p) & dmask
+
+    tables: list[list[int]] = []
+    for c in range(0, len(basis), 8):
+        table: list[int] = [0] * 256
+        for v in range(1, 256):
+            low: int = v & -v
+            table[v] = table[v ^ low] ^ basis[c + low.bit_length() - 1]
+        tables += [table]
+    return tuple(tables)
+
+@lru_cache(maxsize=256)
+def _sparse_terms(p: int) -> tuple:
+    """
+    powers of the terms of p below its leading one, when folding the quotient back
+    through them is cheaper than the byte tables, else None
+    """
+    dp: int = poly_deg(p)
+    low: int = p ^ (1 << dp)
+    terms: tuple[int] = tuple(i for i in range(low.bit_length()) if (low >> i) & 1)
+    folds: int = -(-dp // (dp - poly_deg(low))) # each fold lowers the degree by dp - deg(low)
+    if folds * (len(terms) + 2) < dp // 8 + 2:
+        return terms
+    return None
+
+def poly_mod(a: int, p: int) -> int:
+    """
+    a mod p, for deg a < 2 deg p by folding through the low terms of a sparse p,
+    or bytewise through cached tables
+    """
+    dp: int = poly_deg(p)
+    if dp < 8:
+        return poly_divmod(a, p)[1]
+    if a.bit_length() > 2*dp:
+        # bring a below X^(2 dp) first
+        excess: int = a >> (2*dp)
+        a ^= poly_mul(poly_divmod(excess << (2*dp), p)[0], p)
+    high: int = a >> dp
+    if not high:
+        return a
+    dmask: int = (1 << dp) - 1
+    terms: tuple = _sparse_terms(p)
+    if terms is not None:
+        while high:
+            a &= dmask
+            for term in terms:
+                a ^= high << term
+            high = a >> dp
+        return a
+
+    tables: tuple = _reduction_tables(p)
+    a &= dmask
+    for table, byte in zip(tables, high.to_bytes(len(tables), 'little')):
+        a ^= table[byte]
+    return a
+
+def poly_mulmod(a: int, b: int, p: int) -> int:
+    return poly_mod(poly_mul(a, b), p)
+
+def poly_gcd(a: int, b: int) -> int:
+    while b:
+        a, b = b, poly_divmod(a, b)[1]
+    return a
+
+def poly_powmod(a: int, e: int, p: int) -> int:
+    """
+    a^e mod p by left-to-right square and multiply
+    multiplication by X reduces to a shift
+    """
+    if e < 0:
+        raise ValueError("negative exponent")
+    dp: int = poly_deg(p)
+    a = poly_mod(a, p)
+    result: int = poly_mod(1, p)
+    for bit in bin(e)[2:]:
+        result = poly_mod(poly_square(result), p)
+        if bit == '1':
+            if a == 2:
+                result <<= 1
+                if result >> dp:
+                    result ^= p
+            else:
+                result = poly_mulmod(result, a, p)
+    return result
+
+def gf2_solve(rows: list[int], ncols: int) -> tuple:
+    """
+    Gauss-Jordan elimination over GF(2) on rows packed as ints
+    bit j of a row is the coefficient of unknown j and bit ncols its right-hand side
+    returns the solution as a list of bits, or None when the system is singular, and the rank
+    """
+    rows = list(rows)
+    nrows: int = len(rows)
+    pivots: list[int] = []
+    rank: int = 0
+    for col in range(ncols):
+        for r in range(rank, nrows):
+            if (rows[r] >> col) & 1:
+                break
+        else:
+            continue
+        rows[rank], rows[r] = rows[r], rows[rank]
+        pivot: int = rows[rank]
+        for i in range(nrows):
+            if i != rank and (rows[i] >> col) & 1:
+                rows[i] ^= pivot
+        pivots += [col]
+        rank += 1
+
+    if rank < ncols:
+        return None, rank
+    solution: list[int] = [0] * ncols
+    for row, col in zip(rows, pivots):
+        solution[col] = (row >> ncols) & 1
+    return solution, rank
+
+def mat_vec(columns: list[int], v: int) -> int:
+    """
+    product of a matrix, given by the images of the basis vectors, with the vector v
+    """
+    product: int = 0
+    i: int = 0
+    while v:
+        if v & 1:
+            product ^= columns[i]
+        v >>= 1
+        i += 1
+    return product
+
+def mat_mul(a: list[int], b: list[int]) -> list[int]:
+    """
+    columns of the product ab
+    """
+    return [mat_vec(a, column) for column in b]
+
+def mat_pow(columns: list[int], e: int) -> list[int]:
+    """
+    columns of the e-th power of a square matrix
+    """
+    result: list[int] = [1 << i for i in range(len(columns))]
+    for bit in bin(e)[2:]:
+        result = mat_mul(result, result)
+        if bit == '1':
+            result = mat_mul(columns, result)
+    return result
+
+def krylov_minpoly(columns: list[int], v: int) -> int:
+    """
+    minimal polynomial of v under the matrix: the least monic m with m(M) v = 0,
+    read off the first linear dependency among v, Mv, M^2 v, ...
+    """
+    basis: dict = {} # leading bit -> (reduced vector, polynomial in M producing it from v)
+    w: int = v
+    k: int = 0
+    while True:
+        r: int = w
+        combination: int = 1 << k
+        while r:
+            top: int = r.bit_length() - 1
+            if top not in basis:
+                break
+            vector, poly = basis[top]
+            r ^= vector
+            combination ^= poly
+        if r == 0:
+            return combination
+        basis[r.bit_length() - 1] = (r, combination)
+        w = mat_vec(columns, w)
+        k += 1
+
+def mat_minpoly(columns: list[int]) -> int:
+    """
+    minimal polynomial of the matrix, the lcm of the minimal polynomials of
+    basis vectors outside the invariant subspace spanned by the earlier ones
+    """
+    span: dict = {} # leading bit -> vector of an echelon basis of the invariant subspace
+    minimal: int = 1
+    for i in range(len(columns)):
+        w: int = 1 << i
+        new: bool = True
+        while True:
+            r: int = w
+            while r and (r.bit_length() - 1) in span:
+                r ^= span[r.bit_length() - 1]
+            if r == 0:
+                break
+            if new:
+                poly: int = krylov_minpoly(columns, w)
+                minimal = poly_divmod(poly_mul(minimal, poly), poly_gcd(minimal, poly))[0]
+                new = False
+            span[r.bit_length() - 1] = r
+            w = mat_vec(columns, w)
+    return minimal
+
+def lfsr_columns(degree: int, mask: int) -> list[int]:
+    """
+    columns of the one-step map of a Fibonacci LFSR with feedback mask
+    """
+    return [
+        (1 << (i-1) if i else 0) | (((mask >> i) & 1) << (degree-1))
+        for i in range(degree)
+    ]
+
+def galois_columns(degree: int, mask: int) -> list[int]:
+    """
+    columns of the one-step map of a Galois LFSR, shifting right and XORing mask when the output bit is 1
+    """
+    return [1 << (i-1) if i else mask for i in range(degree)]
+
+def reflect_mask(mask: int, degree: int) -> int:
+    """
+    bit p moved to bit degree-1-p: a Fibonacci feedback mask with bit 0 set to the Galois mask
+    giving the same output sequence, and back
+    """
+    return int(format(mask, f'0{degree}b')[::-1], 2)
+
+def fibonacci_to_galois(state: int, degree: int, mask: int) -> int:
+    """
+    Galois state with the same future output as a Fibonacci state, for Fibonacci mask with bit 0 set
+    with P(Y) = Y^degree c(1/Y), the reciprocal of the characteristic polynomial, the Galois register
+    holds Y^-k G mod P, and G = (output bits as a polynomial) * P mod Y^degree
+    """
+    reciprocal: int = (reflect_mask(mask, degree) << 1) | 1
+    return poly_mul(state, reciprocal) & ((1 << degree) - 1)
+
+@lru_cache(maxsize=64)
+def _reciprocal_inverse(degree: int, mask: int) -> int:
+    """
+    inverse of the reciprocal polynomial P modulo Y^degree, P(0) = 1 making it a unit
+    """
+    reciprocal: int = (reflect_mask(mask, degree) << 1) | 1
+    inverse: int = 0
+    remainder: int = 1
+    for i in range(degree):
+        if (remainder >> i) & 1:
+            inverse |= 1 << i
+            remainder ^= reciprocal << i
+    return inverse
+
+def galois_to_fibonacci(state: int, degree: int, mask: int) -> int:
+    """
+    inverse of fibonacci_to_galois, for the same Fibonacci mask
+    """
+    return poly_mul(state, _reciprocal_inverse(degree, mask)) & ((1 << degree) - 1)
+
+# byte translations between '0'/'1' characters and 0/1 values
+_ASCII_BITS: bytes = bytes(1 if v == ord('1') else 0 for v in range(256))
+_BITS_ASCII: bytes = b'01' + bytes(254)
+
+def _lfsr_bits(head: bytes, connection: int, complexity: int, count: int) -> bytearray:
+    """
+    the first count bits, one per byte, of the sequence from the first complexity bits head
+    under the connection polynomial, s_j = c_1 s_{j-1} + ... + c_L s_{j-L}
+    """
+    bits: bytearray = bytearray(head[:count])
+    taps: int = connection >> 1 # bit i - 1 is c_i
+    window: int = int(bytes(head).translate(_BITS_ASCII) or b'0', 2) # bit i is s_{j-1-i}
+    wmask: int = (1 << complexity) - 1
+    for _ in range(len(bits), count):
+        bit: int = (taps & window).bit_count() & 1
+        bits.append(bit)
+        window = ((window << 1) | bit) & wmask
+    return bits
+
+class BerlekampMassey:
+    """
+    incremental Berlekamp-Massey over GF(2) on packed ints
+    feed bits with update, in any number of chunks
+    after n bits, connection is the connection polynomial C(X) = 1 + c_1 X + ... + c_L X^L
+    of a shortest LFSR generating them, and complexity its length L
+    the discrepancy only reads the last L+1 bits, so each bit costs O(L/64) word operations
+    only the last 2L + MIN_WINDOW bits and the first L are kept: C generates every bit seen
+    from the first L, so a length change reaching further back regenerates the bits dropped
+    """
+
+    MIN_WINDOW: int = 64
+
+    def __init__(self) -> None:
+        self.connection: int = 1
+        self.complexity: int = 0
+        self.length: int = 0
+        self.profile: list[tuple[int]] = [] # (bits seen, complexity) at each length change
+        self._prev: int = 1 # connection polynomial before the last length change
+        self._prev_index: int = -1
+        self._history: bytearray = bytearray() # the latest bits, one per byte
+        self._history_start: int = 0 # index of the first of them
+        self._head: bytes = b'' # the first complexity bits
+        self._width: int = self.MIN_WINDOW
+        self._window: int = 0 # bit i is s_{n-1-i}, for i < _width
+
+    def update(self, bits) -> None:
+        """
+        bits is a '0'/'1' string or a bytes-like or iterable of 0/1 values
+        """
+        if isinstance(bits, str):
+            bits = bits.encode().translate(_ASCII_BITS)
+        history: bytearray = self._history
+        base: int = self._history_start
+        start: int = len(history)
+        history.extend(bits)
+
+        connection: int = self.connection
+        complexity: int = self.complexity
+        prev: int = self._prev
+        prev_index: int = self._prev_index
+        width: int = self._width
+        window: int = self._window
+        profile: list[tuple[int]] = self.profile
+        wmask: int = (1 << width) - 1
+        for n, bit in enumerate(bytes(history[start:]), base + start):
+            window = ((window << 1) | bit) & wmask
+            if (connection & window).bit_count() & 1:
+                previous: int = connection
+                connection ^= prev << (n - prev_index)
+                if 2*complexity <= n:
+                    if base:
+                        # the new length reaches back to bit complexity - 1: restore the dropped bits,
+                        # generated by the previous connection from the first complexity bits
+                        history[:0] = _lfsr_bits(self._head, previous, complexity, base)
+                        base = 0
+                    complexity = n + 1 - complexity
+                    self._head = bytes(history[:complexity])
+                    prev = previous
+                    prev_index = n
+                    profile += [(n + 1, complexity)]
+                    if complexity >= width:
+                        # widen the window, rereading the bits it dropped
+                        width = 2*complexity + self.MIN_WINDOW
+                        wmask = (1 << width) - 1
+                        recent: bytes = bytes(history[max(0, n + 1 - base - width):n + 1 - base])
+                        window = int(recent.translate(_BITS_ASCII), 2)
+
+        length: int = base + len(history)
+        keep: int = 2*complexity + self.MIN_WINDOW
+        if len(history) > 2*keep: # trim in amortised O(1) per bit
+            del history[:len(history) - keep]
+            base = length - keep
+
+        self.connection = connection
+        self.complexity = complexity
+        self._prev = prev
+        self._prev_index = prev_index
+        self._history_start = base
+        self._width = width
+        self._window = window
+        self.length = length
+
+    def tap_vector(self) -> list[int]:
+        """
+        taps of the shortest LFSR in the numbering of LFSR.tap_positions,
+        position p is tapped when c_{L-p} = 1
+        """
+        L: int = self.complexity
+        return [(self.connection >> (L - p)) & 1 for p in range(L)]
@@ -0,0 +1,211 @@
+"""
+statistical tests of bit sequences, after NIST SP 800-22 and Menezes et al. 5.4.4
+
+each test takes a 0/1 uint8 array and returns StatResult tuples;
+work is done on whole arrays so long streams are assessed at numpy speed
+"""
+from math import erfc, exp, lgamma, log, sqrt
+from typing import NamedTuple
+import numpy as np
+
+EPSILON: float = 1e-15
+PATTERN_CHUNK: int = 1 << 22 # bits per pass when counting overlapping patterns
+SMALL_PATTERN: int = 4 # up to this length patterns are counted by comparison, faster than bincount
+SPECTRAL_BLOCK: int = 1 << 20 # bits per transform in the spectral test
+
+# longest run of ones: (block size, least stream length, class bounds, class probabilities)
+LONGEST_RUN_TABLE: tuple = (
+    (10000, 750000, (10, 16), (0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727)),
+    (128, 6272, (4, 9), (0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124)),
+    (8, 128, (1, 4), (0.2148, 0.3672, 0.2305, 0.1875))
+)
+
+# error messages
+LENGTH_ERROR: str = "Stream of {} bits is too short for the {} test, which needs {}"
+
+class StatResult(NamedTuple):
+    """
+    test statistic, its p-value under the hypothesis of a random stream,
+    and whether that hypothesis survives at significance alpha
+    """
+    statistic: float
+    p_value: float
+    passed: bool
+
+def igamc(a: float, x: float) -> float:
+    """
+    regularised upper incomplete gamma function Q(a, x), chi-squared tail probabilities
+    series below x = a + 1, Lentz's continued fraction above
+    """
+    if x <= 0:
+        return 1.0
+    scale: float = exp(-x + a*log(x) - lgamma(a))
+    if x < a + 1:
+        term: float = 1 / a
+        total: float = term
+        denominator: float = a
+        while abs(term) > abs(total) * EPSILON:
+            denominator += 1
+            term *= x / denominator
+            total += term
+        return max(0.0, 1 - total*scale)
+
+    tiny: float = 1e-300
+    b: float = x + 1 - a
+    c: float = 1 / tiny
+    d: float = 1 / b
+    h: float = d
+    i: int = 0
+    while True:
+        i += 1
+        an: float = -i * (i - a)
+        b += 2
+        d = an*d + b
+        d = d if abs(d) > tiny else tiny
+        c = b + an/c
+        c = c if abs(c) > tiny else tiny
+        d = 1 / d
+        delta: float = d * c
+        h *= delta
+        if abs(delta - 1) < EPSILON:
+            return scale * h
+
+def _result(statistic: float, p_value: float, alpha: float) -> StatResult:
+    return StatResult(float(statistic), float(p_value), bool(p_value >= alpha))
+
+def _check_length(bits: np.ndarray, minimum: int, name: str) -> None:
+    if len(bits) < minimum:
+        raise ValueError(LENGTH_ERROR.format(len(bits), name, minimum))
+
+def frequency_test(bits: np.ndarray, alpha: float) -> StatResult:
+    """
+    monobit: the normalised excess of ones over zeros
+    """
+    _check_length(bits, 1, 'frequency')
+    n: int = len(bits)
+    excess: int = 2*int(np.count_nonzero(bits)) - n
+    statistic: float = abs(excess) / sqrt(n)
+    return _result(statistic, erfc(statistic / sqrt(2)), alpha)
+
+def block_frequency_test(bits: np.ndarray, block_size: int, alpha: float) -> StatResult:
+    """
+    chi-squared of the proportion of ones in each of the n // block_size blocks
+    """
+    _check_length(bits, block_size, 'block frequency')
+    nblocks: int = len(bits) // block_size
+    blocks: np.ndarray = bits[:nblocks*block_size].reshape(nblocks, block_size)
+    proportions: np.ndarray = np.count_nonzero(blocks, axis=1) / block_size
+    statistic: float = 4 * block_size * float(np.sum((proportions - 0.5)**2))
+    return _result(statistic, igamc(nblocks/2, statistic/2), alpha)
+
+def runs_test(bits: np.ndarray, alpha: float) -> StatResult:
+    """
+    number of runs against its expectation given the proportion of ones
+    fails outright when the frequency is too far from 1/2 for the runs count to mean anything
+    """
+    _check_length(bits, 2, 'runs')
+    n: int = len(bits)
+    pi: float = np.count_nonzero(bits) / n
+    runs: int = 1 + int(np.count_nonzero(bits[1:] != bits[:-1]))
+    if abs(pi - 0.5) >= 2 / sqrt(n):
+        return _result(runs, 0.0, alpha)
+    spread: float = 2 * sqrt(2*n) * pi * (1 - pi)
+    return _result(runs, erfc(abs(runs - 2*n*pi*(1 - pi)) / spread), alpha)
+
+def longest_runs(bits: np.ndarray, block_size: int) -> np.ndarray:
+    """
+    longest run of ones in each block: with every block padded by a zero on both sides,
+    the runs are the gaps between consecutive zeros and each block's maximum is one reduceat
+    """
+    nblocks: int = len(bits) // block_size
+    padded: np.ndarray = np.zeros((nblocks, block_size + 2), dtype=np.uint8)
+    padded[:, 1:-1] = bits[:nblocks*block_size].reshape(nblocks, block_size)
+    zeros: np.ndarray = np.flatnonzero(padded.ravel() == 0)
+    gaps: np.ndarray = np.diff(zeros) - 1
+    starts: np.ndarray = np.searchsorted(zeros, np.arange(nblocks) * (block_size + 2))
+    return np.maximum.reduceat(gaps, starts)
+
+def longest_run_test(bits: np.ndarray, alpha: float) -> StatResult:
+    """
+    chi-squared of the longest run of ones per block, binned into the NIST classes
+    the block size grows with the stream as in NIST, all whole blocks are used
+    """
+    n: int = len(bits)
+    _check_length(bits, LONGEST_RUN_TABLE[-1][1], 'longest run')
+    block_size, _, (low, high), probabilities = next(row for row in LONGEST_RUN_TABLE if n >= row[1])
+    longest: np.ndarray = np.clip(longest_runs(bits, block_size), low, high)
+    counts: np.ndarray = np.bincount(longest - low, minlength=high - low + 1)
+    expected: np.ndarray = len(longest) * np.array(probabilities)
+    statistic: float = float(np.sum((counts - expected)**2 / expected))
+    return _result(statistic, igamc((len(probabilities) - 1)/2, statistic/2), alpha)
+
+def pattern_counts(bits: np.ndarray, m: int) -> np.ndarray:
+    """
+    occurrences of each m-bit pattern over the n overlapping windows of the cyclically extended stream
+    """
+    n: int = len(bits)
+    if m == 0:
+        return np.array([n])
+    extended: np.ndarray = np.concatenate([bits, bits[:m-1]])
+    dtype: type = np.uint8 if m <= 8 else np.uint16 if m <= 16 else np.uint32
+    counts: np.ndarray = np.zeros(1 << m, dtype=np.int64)
+    for start in range(0, n, PATTERN_CHUNK):
+        stop: int = min(n, start + PATTERN_CHUNK)
+        values: np.ndarray = np.zeros(stop - start, dtype=dtype)
+        for j in range(m):
+            values = (values << 1) | extended[start+j:stop+j]
+        if m <= SMALL_PATTERN:
+            counts += [np.count_nonzero(values == v) for v in range(1 << m)]
+        else:
+            counts += np.bincount(values, minlength=1 << m)
+    return counts
+
+def serial_test(bits: np.ndarray, m: int, alpha: float) -> tuple[StatResult]:
+    """
+    first and second differences of psi^2 over overlapping patterns of m, m-1 and m-2 bits
+    m = 2 is the two-bit test on pair counts
+    """
+    _check_length(bits, m, 'serial')
+    n: int = len(bits)
+    psi: list[float] = [
+        (1 << k) / n * float(np.sum(pattern_counts(bits, k)**2)) - n if k > 0 else 0.0
+        for k in (m, m - 1, m - 2)
+    ]
+    first: float = psi[0] - psi[1]
+    second: float = psi[0] - 2*psi[1] + psi[2]
+    return (
+        _result(first, igamc(2**(m-2), first/2), alpha),
+        _result(second, igamc(2**(m-3), second/2), alpha)
+    )
+
+def autocorrelation_test(bits: np.ndarray, lag: int, alpha: float) -> StatResult:
+    """
+    number of positions where the stream differs from itself shifted by lag, normalised
+    """
+    _check_length(bits, lag + 1, 'autocorrelation')
+    n: int = len(bits) - lag
+    differences: int = int(np.count_nonzero(bits[:-lag] != bits[lag:]))
+    statistic: float = 2 * (differences - n/2) / sqrt(n)
+    return _result(statistic, erfc(abs(statistic) / sqrt(2)), alpha)
+
+def spectral_test(bits: np.ndarray, alpha: float) -> StatResult:
+    """
+    discrete Fourier transform: too many or too few peaks above the 95% threshold signal periodicity
+    long streams are transformed in blocks of SPECTRAL_BLOCK bits and the peak counts pooled
+    """
+    _check_length(bits, 2, 'spectral')
+    n: int = len(bits)
+    observed: int = 0
+    expected: float = 0.0
+    variance: float = 0.0
+    for start in range(0, n, SPECTRAL_BLOCK):
+        block: np.ndarray = bits[start:start+SPECTRAL_BLOCK]
+        size: int = len(block)
+        if size < 2:
+            break
+        moduli: np.ndarray = np.abs(np.fft.rfft(2.0*block - 1.0)[:size // 2])
+        observed += int(np.count_nonzero(moduli < sqrt(log(20) * size)))
+        expected += 0.95 * (size // 2)
+        variance += size * 0.95 * 0.05 / 4
+    statistic: float = (observed - expected) / sqrt(variance)
+    return _result(statistic, erfc(abs(statistic) / sqrt(2)), alpha)
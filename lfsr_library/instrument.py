@@ -0,0 +1,202 @@
+"""
+opt-in timers and counters on the hot paths, off by default
+
+enable(sink, ...) makes each instrumented call report an Event to every sink,
+a sink being any callable taking an Event: a Stats, a LogSink or a plain callback
+while no sink is enabled an instrumented call costs one check of an empty list
+
+calls made inside a process pool report to the sinks of the worker process, not to these
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+
+class Event(NamedTuple):
+    name: str # e.g. 'LFSR.generate'
+    seconds: float
+    params: dict # size of the call, e.g. degree and stream_length
+    counts: dict # work done, e.g. bits_generated, empty if the call raised
+    failed: bool # the call raised
+
+_sinks: list = [] # empty while disabled
+_local = threading.local() # quiet is set while a call hides the instrumented calls it makes
+
+def enable(*sinks) -> None:
+    """
+    add sinks, each called with every Event from now on
+    """
+    _sinks.extend(sinks)
+
+def disable() -> None:
+    """
+    remove all sinks
+    """
+    _sinks.clear()
+
+def enabled() -> bool:
+    return bool(_sinks)
+
+@contextmanager
+def recording(**kwargs):
+    """
+    with recording() as stats: collect the events of the block in a Stats
+    kwargs are passed on to Stats
+    """
+    stats: Stats = Stats(**kwargs)
+    enable(stats)
+    try:
+        yield stats
+    finally:
+        _sinks.remove(stats)
+
+def emit(event: Event) -> None:
+    for sink in list(_sinks):
+        sink(event)
+
+def instrumented(name: str, **kwargs):
+    """
+    decorator timing a method and reporting it as an Event named name
+    params and counts, functions of the instance, are read once the method has returned,
+    methods setting attributes rather than returning values
+    pass quiet=True to hide the instrumented calls made by the method, when these are
+    steps of its own work and would count it twice
+    """
+    try:
+        params = kwargs['params']
+    except KeyError:
+        params = lambda self: {}
+    try:
+        counts = kwargs['counts']
+    except KeyError:
+        counts = lambda self: {}
+    try:
+        quiet: bool = kwargs['quiet']
+    except KeyError:
+        quiet: bool = False
+
+    def decorate(method):
+        @wraps(method)
+        def wrapper(self, *args, **kw):
+            if not _sinks or getattr(_local, 'quiet', False):
+                return method(self, *args, **kw)
+
+            if quiet:
+                _local.quiet = True
+            failed: bool = True
+            start: float = time.perf_counter()
+            try:
+                result = method(self, *args, **kw)
+                failed = False
+                return result
+            finally:
+                seconds: float = time.perf_counter() - start
+                if quiet:
+                    _local.quiet = False
+                emit(Event(name, seconds, _read(params, self), {} if failed else _read(counts, self), failed))
+        return wrapper
+    return decorate
+
+def _read(measure, instance) -> dict:
+    """
+    measure(instance), or {} when the attributes it reads are missing
+    """
+    try:
+        return measure(instance)
+    except (AttributeError, TypeError):
+        return {}
+
+class Stats:
+    """
+    in-memory sink aggregating events per name, and per degree where events have one
+    safe to share between threads
+    """
+
+    SLOWEST: int = 10 # slowest events kept
+
+    def __init__(self, **kwargs) -> None:
+        try:
+            self.keep: int = kwargs['slowest']
+        except KeyError:
+            self.keep: int = self.SLOWEST
+        self.lock: threading.Lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.failures: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+        self.max_seconds: dict[str, float] = {}
+        self.counts: dict[str, dict] = {}
+        self.by_degree: dict[tuple, list] = {} # (name, degree) -> [calls, seconds]
+        self.slowest: list[Event] = []
+
+    def __call__(self, event: Event) -> None:
+        name: str = event.name
+        with self.lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self.failures[name] = self.failures.get(name, 0) + event.failed
+            self.seconds[name] = self.seconds.get(name, 0.0) + event.seconds
+            self.max_seconds[name] = max(self.max_seconds.get(name, 0.0), event.seconds)
+            counts: dict = self.counts.setdefault(name, {})
+            for counter, value in event.counts.items():
+                counts[counter] = counts.get(counter, 0) + value
+
+            if 'degree' in event.params:
+                entry: list = self.by_degree.setdefault((name, event.params['degree']), [0, 0.0])
+                entry[0] += 1
+                entry[1] += event.seconds
+
+            if len(self.slowest) < self.keep or event.seconds > self.slowest[-1].seconds:
+                self.slowest = sorted(self.slowest + [event], key=lambda e: -e.seconds)[:self.keep]
+
+    def totals(self) -> dict:
+        """
+        each counter summed over all names
+        """
+        totals: dict = {}
+        for counts in self.counts.values():
+            for counter, value in counts.items():
+                totals[counter] = totals.get(counter, 0) + value
+        return totals
+
+    def summary(self) -> dict:
+        """
+        per name: calls, failures, total, mean and max seconds, and the summed counters
+        """
+        return {
+            name: {
+                'calls': calls,
+                'failures': self.failures[name],
+                'seconds': self.seconds[name],
+                'mean_seconds': self.seconds[name] / calls,
+                'max_seconds': self.max_seconds[name],
+                **self.counts[name]
+            }
+            for name, calls in self.calls.items()
+        }
+
+class LogSink:
+    """
+    sink writing one line per event to a logging logger, 'lfsr_library' by default
+    """
+
+    LEVEL: int = logging.DEBUG
+
+    def __init__(self, **kwargs) -> None:
+        try:
+            self.logger: logging.Logger = kwargs['logger']
+        except KeyError:
+            self.logger: logging.Logger = logging.getLogger('lfsr_library')
+        try:
+            self.level: int = kwargs['level']
+        except KeyError:
+            self.level: int = self.LEVEL
+
+    def __call__(self, event: Event) -> None:
+        self.logger.log(
+            self.level, "%s%s %.6f s %s %s",
+            event.name, ' failed' if event.failed else '', event.seconds, event.params, event.counts
+        )
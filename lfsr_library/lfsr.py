@@ -1,10 +1,29 @@
-import matplotlib.pyplot as plt
+import numpy as np
 from .analyser import Analyser
-from .functions.functions import str_to_sp
-from .functions.functions import count_func
+from .functions.functions import feedback_polynomial, feedback_polynomial_sp
+from .functions.functions import running_prob, stream_bits, taps_to_mask
+from .functions.engine import lfsr_tables, linear_tables, block_tables, run_blocks, iter_blocks, pack_bits, unpack_str
+from .functions.engine import batch_tables, run_batch
+from .functions.gf2 import poly_powmod, mat_vec, mat_mul, mat_pow, lfsr_columns, krylov_minpoly, mat_minpoly, BerlekampMassey
+from .functions.gf2 import galois_columns, reflect_mask, fibonacci_to_galois, galois_to_fibonacci
+from .functions.gf2 import gf2_solve
+from .functions.factor import poly_order, poly_is_primitive
+from .functions.dlog import poly_log
+from .bitstream import BitStream, write_chunks
+from .catalogue import catalogue_taps
+from .instrument import instrumented
 
 class LFSR(Analyser):
 
+    CONFIG: str = 'fibonacci' # or 'galois'
+    CHUNK_BYTES: int = 1 << 16 # iter_chunks default
+
+    SEED_ERROR: str = "Seed does not fit in a register of this degree"
+    STEPS_ERROR: str = "Stepping back needs a tap at position 0"
+    CONFIG_ERROR: str = "Unknown configuration, use 'fibonacci' or 'galois'"
+    GALOIS_ERROR: str = "Galois configuration needs a tap at position 0"
+    FRAGMENT_ERROR: str = "Fragment needs at least degree = {} bits"
+
     def __new__(cls, **kwargs):
         tap_positions: list[int] = kwargs['tap_positions']
         degree: int = kwargs['degree']
@@ -18,20 +37,93 @@ class LFSR(Analyser):
         Binary numbers are ordered according to LSb
         e.g., in 1000, 1 is in position 3 so that 1000 = 1 << 3 = 8
         Generally, m << n = m*(2**n)
+        pass config='galois' for the internal-XOR form of the same feedback polynomial:
+        each step shifts right and, when the bit shifted out is 1, XORs galois_mask into the register
+        seeds, states and log are then Galois register contents, and the output bit is still bit 0
         """
         super().__init__() # inherit from class Analyzer
         self.degree: int = kwargs['degree']
         self.tap_positions: list[int] = kwargs['tap_positions'] 
 
-        polynomial: str = 'X^0'
-        for position in self.tap_positions:
-            if position != 0:
-                polynomial += f' + X^{position}'
-            
-        polynomial += f' + X^{self.degree}'
-        self.feedback_polynomial: str = polynomial
-        self.feedback_polynomial_sp = str_to_sp(self.feedback_polynomial) # class sp.core.add.Add
+        try:
+            self.config: str = kwargs['config']
+        except KeyError:
+            self.config: str = self.CONFIG
+        if self.config == 'galois':
+            mask: int = taps_to_mask(self.tap_positions)
+            if mask & 1 == 0:
+                raise ValueError(self.GALOIS_ERROR)
+            self.galois_mask: int = reflect_mask(mask, self.degree)
+        elif self.config != 'fibonacci':
+            raise ValueError(self.CONFIG_ERROR)
+
+        self.feedback_polynomial: str = feedback_polynomial(self.degree, tuple(self.tap_positions))
+
+    @property
+    def feedback_polynomial_sp(self):
+        """
+        sympy form of feedback_polynomial, built on first access and shared by LFSRs with the same taps
+        """
+        return feedback_polynomial_sp(self.degree, tuple(self.tap_positions)) # class sp.core.add.Add
+
+    @classmethod
+    def from_catalogue(cls, degree: int, **kwargs):
+        """
+        maximal-length LFSR with primitive feedback polynomial read from the catalogue
+        pass weight=3 or weight=5 to choose a trinomial or pentanomial
+        primitivity is proven only for degrees whose 2^degree - 1 factorisation is complete, every
+        degree up to 672 but not 65 degrees from 673 to 1024: those entries pass every other check
+        and give a warning unless allow_uncertified=True
+        """
+        return cls(degree=degree, tap_positions=catalogue_taps(degree, **kwargs))
 
+    def to_galois(self):
+        """
+        Galois configuration of the same feedback polynomial
+        """
+        return LFSR(degree=self.degree, tap_positions=self.tap_positions, config='galois')
+
+    def to_fibonacci(self):
+        """
+        Fibonacci configuration of the same feedback polynomial
+        """
+        return LFSR(degree=self.degree, tap_positions=self.tap_positions, config='fibonacci')
+
+    def to_galois_state(self, state: int) -> int:
+        """
+        Galois register contents giving the same output from now on as the Fibonacci state
+        """
+        return fibonacci_to_galois(state, self.degree, taps_to_mask(self.tap_positions))
+
+    def to_fibonacci_state(self, state: int) -> int:
+        """
+        Fibonacci register contents giving the same output from now on as the Galois state
+        """
+        return galois_to_fibonacci(state, self.degree, taps_to_mask(self.tap_positions))
+
+    def _fibonacci_seed(self, bitseq) -> int:
+        """
+        bitseq as an int, checked to fit, and converted to a Fibonacci state in Galois configuration
+        """
+        if isinstance(bitseq, str):
+            bitseq: int = int(bitseq, 2)
+        if bitseq >> self.degree:
+            raise ValueError(self.SEED_ERROR)
+        return self.to_fibonacci_state(bitseq) if self.config == 'galois' else bitseq
+
+    def step_columns(self) -> list[int]:
+        """
+        columns of the one-step map of the register in its configuration
+        """
+        if self.config == 'galois':
+            return galois_columns(self.degree, self.galois_mask)
+        return lfsr_columns(self.degree, taps_to_mask(self.tap_positions))
+
+    @instrumented(
+        'LFSR.generate',
+        params=lambda self: {'degree': self.degree, 'config': self.config},
+        counts=lambda self: {'bits_generated': len(self.stream)}
+    )
     def generate(self, bitseq: str, iterations: int) -> None:
         if isinstance(bitseq, str):
             bitseq: int = int(bitseq, 2) 
@@ -45,13 +137,17 @@ class LFSR(Analyser):
         log: list[int] = [format(bitseq, f'0{degree}b')]
         stream: str = f'{first_output}'
         state: int = int(bin(bitseq), 2)
+        galois: bool = self.config == 'galois'
         for _ in range(iterations):
-            new_bit = 0
-            for position in tap_positions:
-                bit = (state >> position) & 1
-                new_bit ^= bit 
+            if galois: # one shift and one conditional XOR of the precomputed mask
+                state = (state >> 1) ^ (self.galois_mask if state & 1 else 0)
+            else:
+                new_bit = 0
+                for position in tap_positions:
+                    bit = (state >> position) & 1
+                    new_bit ^= bit 
 
-            state = (state >> 1) | (new_bit << (degree - 1))
+                state = (state >> 1) | (new_bit << (degree - 1))
             output = state & 1
 
             state_bits = format(state, f'0{degree}b')
@@ -72,6 +168,243 @@ class LFSR(Analyser):
         self.log: list[str] = log
         self.stream: str = stream
 
+    @instrumented(
+        'LFSR.generate_packed',
+        params=lambda self: {'degree': self.degree, 'config': self.config},
+        counts=lambda self: {'bits_generated': len(self.bitstream)}
+    )
+    def generate_packed(self, bitseq, iterations: int, **kwargs) -> None:
+        """
+        word-parallel counterpart to generate
+        emits the same iterations+1 output bits as self.bitstream, packed LSb first,
+        i.e. output bit k is bit k % 8 of byte k // 8 of self.packed_stream
+        the string self.stream is unpacked on first use
+        pass log=True to also record self.log as generate does
+        in Galois configuration the engine runs on the equivalent Fibonacci seed
+        """
+        bitseq: int = self._fibonacci_seed(bitseq)
+        degree: int = self.degree
+
+        try:
+            keep_log: bool = kwargs['log']
+        except KeyError:
+            keep_log: bool = False
+
+        nbits: int = iterations + 1
+        total: int = nbits + degree - 1 if keep_log else nbits # log needs the bits of the last state
+        width, tables = lfsr_tables(degree, taps_to_mask(self.tap_positions))
+        buffer, _ = run_blocks(tables, width, bitseq, -(-total // width))
+
+        self.bitstream: BitStream = BitStream(buffer=pack_bits(buffer, nbits), length=nbits)
+
+        if keep_log:
+            # state k, written MSb first, is output bits k ... k+degree-1 reversed
+            sequence: str = unpack_str(buffer, total)
+            self.log: list[str] = [sequence[k:k+degree][::-1] for k in range(nbits)]
+            if self.config == 'galois':
+                self.log = [format(self.to_galois_state(int(state, 2)), f'0{degree}b') for state in self.log]
+
+    def generate_batch(self, seeds, nbits: int) -> np.ndarray:
+        """
+        the first nbits of output of each seed, as a uint8 array of one packed row per seed,
+        LSb first as generate_packed, so row i holds generate_packed(seeds[i], nbits-1)
+        all registers are stepped in lockstep by table lookups over the whole batch,
+        and no attribute of the instance is changed
+        seeds may be ints, '0'/'1' strings or an integer array, as Galois states in Galois configuration
+        """
+        degree: int = self.degree
+        nchunks: int = -(-degree // 8)
+        fibonacci_seeds: list[int] = [self._fibonacci_seed(int(seed) if not isinstance(seed, str) else seed) for seed in seeds]
+        states: np.ndarray = np.frombuffer(
+            b''.join(seed.to_bytes(nchunks, 'little') for seed in fibonacci_seeds), dtype=np.uint8
+        ).reshape(len(fibonacci_seeds), nchunks)
+
+        width, tables = batch_tables(degree, taps_to_mask(self.tap_positions))
+        out, _ = run_batch(tables, width, states, -(-nbits // width))
+
+        nbytes: int = -(-nbits // 8)
+        packed: np.ndarray = out[:, :nbytes]
+        if nbits % 8:
+            packed[:, -1] &= (1 << (nbits % 8)) - 1
+        return packed
+
+    def iter_bits(self, bitseq=None):
+        """
+        endless output bits as ints, one register step each, the same bits as generate
+        self.state is kept at the state of the next bit, so iteration resumes from it when bitseq is None
+        """
+        state: int = self.state if bitseq is None else bitseq
+        if isinstance(state, str):
+            state: int = int(state, 2)
+        self._fibonacci_seed(state) # checks the seed fits
+        degree: int = self.degree
+        mask: int = taps_to_mask(self.tap_positions)
+        galois: bool = self.config == 'galois'
+        self.state: int = state
+        while True:
+            output: int = state & 1
+            if galois:
+                state = (state >> 1) ^ (self.galois_mask if output else 0)
+            else:
+                state = (state >> 1) | (((state & mask).bit_count() & 1) << (degree - 1))
+            self.state = state
+            yield output
+
+    def iter_chunks(self, bitseq=None, chunk_bytes: int = None):
+        """
+        endless output packed into chunks of chunk_bytes bytes, LSb first as generate_packed,
+        in memory independent of how much is read
+        self.state is kept at the state following the last chunk yielded, so iteration resumes from it
+        when bitseq is None
+        """
+        state: int = self.state if bitseq is None else bitseq
+        if isinstance(state, str):
+            state: int = int(state, 2)
+        if chunk_bytes is None:
+            chunk_bytes: int = self.CHUNK_BYTES
+        width, tables = lfsr_tables(self.degree, taps_to_mask(self.tap_positions))
+        jump: list[int] = mat_pow(self.step_columns(), 8*chunk_bytes)
+        self.state: int = state
+        for chunk in iter_blocks(tables, width, self._fibonacci_seed(state), chunk_bytes):
+            state = mat_vec(jump, state)
+            self.state = state
+            yield chunk
+
+    def write_packed(self, path: str, bitseq, nbits: int, **kwargs) -> None:
+        """
+        write nbits of output from bitseq to a file, packed LSb first as generate_packed,
+        through iter_chunks so that memory does not grow with nbits; pass chunk_bytes to size the chunks
+        bitseq None continues from self.state, which is left at the state after the nbits
+        """
+        try:
+            chunk_bytes: int = kwargs['chunk_bytes']
+        except KeyError:
+            chunk_bytes: int = self.CHUNK_BYTES
+        if bitseq is None:
+            bitseq: int = self.state
+        write_chunks(path, self.iter_chunks(bitseq, chunk_bytes), nbits)
+        self.state: int = self.state_at(bitseq, nbits)
+
+    def state_at(self, bitseq, steps: int) -> int:
+        """
+        state reached from bitseq after the given number of steps, in O(degree^2 log steps)
+        with r = X^steps mod the characteristic polynomial, the state after steps
+        is the XOR of the states after j steps over coefficients r_j = 1, j < degree
+        negative steps go back, for a register with a tap at position 0, where X^-1 = (polynomial - 1) / X
+        """
+        bitseq: int = self._fibonacci_seed(bitseq)
+        degree: int = self.degree
+        mask: int = taps_to_mask(self.tap_positions)
+        polynomial: int = mask | (1 << degree)
+        if steps < 0 and mask & 1 == 0:
+            raise ValueError(self.STEPS_ERROR)
+
+        if steps < 0:
+            remainder: int = poly_powmod(polynomial >> 1, -steps, polynomial)
+        else:
+            remainder: int = poly_powmod(0b10, steps, polynomial)
+
+        # output bits 0 ... 2*degree-1, so that state j is bits j ... j+degree-1
+        width, tables = lfsr_tables(degree, mask)
+        buffer, state = run_blocks(tables, width, bitseq, 1)
+        window: int = int.from_bytes(buffer, 'little') | (state << width)
+
+        dmask: int = (1 << degree) - 1
+        state: int = 0
+        j: int = 0
+        while remainder:
+            if remainder & 1:
+                state ^= (window >> j) & dmask
+            remainder >>= 1
+            j += 1
+        return self.to_galois_state(state) if self.config == 'galois' else state
+
+    def find_offset(self, fragment, bitseq) -> int:
+        """
+        first position of fragment in the output from bitseq, -1 if it never occurs, without stepping
+        the first degree bits of fragment are the state t reached after the offset n, and
+        T^n s = t for the seed s means X^n = q modulo the minimal polynomial of the sequence,
+        q being the combination of s, Ts, T^2 s, ... equal to t: n is then a discrete logarithm,
+        by Pohlig-Hellman over the factors of 2^degree - 1, lifted to repeated factors, with the
+        first positions checked directly when the polynomial is divisible by X (functions.dlog)
+        the rest of fragment is then checked against the output from t
+        """
+        fragment: BitStream = fragment if isinstance(fragment, BitStream) else BitStream.from_str(fragment)
+        degree: int = self.degree
+        if len(fragment) < degree:
+            raise ValueError(self.FRAGMENT_ERROR.format(degree))
+        seed: int = self._fibonacci_seed(bitseq)
+        target: int = fragment[:degree].to_int()
+        mask: int = taps_to_mask(self.tap_positions)
+        width, tables = lfsr_tables(degree, mask)
+
+        # q from the states s, Ts, ..., T^(k-1) s, the bits j ... j+degree-1 of the output
+        minimal: int = krylov_minpoly(lfsr_columns(degree, mask), seed)
+        k: int = minimal.bit_length() - 1
+        buffer, state = run_blocks(tables, width, seed, 1)
+        window: int = int.from_bytes(buffer, 'little') | (state << width)
+        dmask: int = (1 << degree) - 1
+        states: list[int] = [(window >> j) & dmask for j in range(k)]
+        rows: list[int] = [
+            sum(((states[j] >> i) & 1) << j for j in range(k)) | (((target >> i) & 1) << k) for i in range(degree)
+        ]
+        solution, _ = gf2_solve(rows, k)
+        if solution is None:
+            return -1
+        combination: int = 0
+        for j, bit in enumerate(solution):
+            if bit:
+                combination ^= states[j]
+        if combination != target: # t is not reached from s
+            return -1
+
+        offset: int = poly_log(sum(bit << j for j, bit in enumerate(solution)), minimal)
+        if offset is None:
+            return -1
+        buffer, _ = run_blocks(tables, width, target, -(-len(fragment) // width))
+        regenerated: BitStream = BitStream(buffer=buffer, length=len(fragment))
+        return offset if regenerated == fragment else -1
+
+    def find_period(self, **kwargs) -> None:
+        """
+        exact period from the multiplicative order of X modulo a polynomial over GF(2), without stepping
+        with bitseq, the steps until the register first returns to bitseq: the order of the minimal
+        polynomial of the sequence it generates, or 'Not found' if X divides it and bitseq never recurs
+        without, the order of the characteristic polynomial stripped of factors X,
+        i.e. the lcm of all cycle lengths
+        also sets primitive, True when every nonzero seed has the maximal period 2^degree - 1
+        orders need the prime factors of 2^n - 1 for each degree n of an irreducible factor, from
+        data/mersenne_factors.txt, complete for n <= 672 but not for 65 degrees from 673 to 1024:
+        a register with such a factor, e.g. LFSR.from_catalogue(673, allow_uncertified=True), raises ValueError naming n
+        """
+        degree: int = self.degree
+        mask: int = taps_to_mask(self.tap_positions)
+        char_poly: int = mask | (1 << degree)
+
+        try:
+            bitseq = kwargs['bitseq']
+        except KeyError:
+            bitseq = None
+
+        if bitseq is None:
+            poly: int = char_poly
+            while poly & 1 == 0:
+                poly >>= 1
+            self.period: int = poly_order(poly)
+        else:
+            bitseq: int = self._fibonacci_seed(bitseq) # Galois states recur exactly when these do
+            width, tables = lfsr_tables(degree, mask)
+            buffer, _ = run_blocks(tables, width, bitseq, 2)
+            bm: BerlekampMassey = BerlekampMassey()
+            bm.update(unpack_str(buffer, 2*degree))
+
+            # minimal polynomial X^L C(1/X) of the connection polynomial C
+            L: int = bm.complexity
+            minimal: int = sum(((bm.connection >> (L - j)) & 1) << j for j in range(L + 1))
+            self.period = poly_order(minimal) if minimal & 1 else 'Not found'
+
+        self.primitive: bool = poly_is_primitive(char_poly)
+
 class MultiLFSR(Analyser):
     """
     input into next state is the output of previous LFSR
@@ -92,9 +425,18 @@ class MultiLFSR(Analyser):
 
         self.lfsr_list: list[LFSR] = kwargs['lfsr_list']
         self.feedback_polynomials: list[str] = [lfsr.feedback_polynomial for lfsr in self.lfsr_list]
-        self.feedback_polynomials_sp: list = [lfsr.feedback_polynomial_sp for lfsr in self.lfsr_list]
         self.degree: int = kwargs['degree']
 
+    @property
+    def feedback_polynomials_sp(self) -> list:
+        return [lfsr.feedback_polynomial_sp for lfsr in self.lfsr_list]
+
+    @instrumented(
+        'MultiLFSR.generate',
+        params=lambda self: {'degree': self.degree, 'lfsrs': len(self.lfsr_list)},
+        counts=lambda self: {'bits_generated': len(self.stream)},
+        quiet=True # one LFSR.generate step per register per bit
+    )
     def generate(self, seed, iterations) -> None:
 
         self.seed: int = seed 
@@ -119,13 +461,156 @@ class MultiLFSR(Analyser):
             stream += curr_output
             count += 1
 
-            if curr_state == seed:
+            if period == 'Not found' and curr_state == log[0]:
                 period = count
 
         self.log = log
         self.stream = stream
         self.period = period
 
+    def step_map(self) -> tuple[int]:
+        """
+        columns of the combined one-step map, the product of the one-step maps in lfsr_list
+        """
+        degree: int = self.degree
+        columns: list[int] = [1 << i for i in range(degree)]
+        for lfsr in self.lfsr_list:
+            columns = mat_mul(lfsr.step_columns(), columns)
+        return tuple(columns)
+
+    @instrumented(
+        'MultiLFSR.generate_packed',
+        params=lambda self: {'degree': self.degree, 'lfsrs': len(self.lfsr_list)},
+        counts=lambda self: {'bits_generated': len(self.bitstream)}
+    )
+    def generate_packed(self, seed, iterations: int, **kwargs) -> None:
+        """
+        block counterpart to generate, stepping the combined map of lfsr_list compiled once
+        emits the same iterations output bits as self.bitstream, packed LSb first
+        pass log=True to also record self.log as generate does
+        """
+        if isinstance(seed, str):
+            seed: int = int(seed, 2)
+        degree: int = self.degree
+        if seed >> degree:
+            raise ValueError(LFSR.SEED_ERROR)
+
+        try:
+            keep_log: bool = kwargs['log']
+        except KeyError:
+            keep_log: bool = False
+
+        self.seed: int = seed
+        self.iterations: int = iterations
+
+        # output k is bit 0 of the state after k+1 steps
+        columns: tuple[int] = self.step_map()
+        width, tables = linear_tables(columns)
+        buffer, _ = run_blocks(tables, width, mat_vec(columns, seed), -(-iterations // width))
+
+        self.bitstream: BitStream = BitStream(buffer=pack_bits(buffer, iterations), length=iterations)
+
+        if keep_log:
+            step_tables: tuple = block_tables(list(columns))
+            nchunks: int = len(step_tables)
+            state: int = seed
+            log: list[str] = [format(seed, f'0{degree}b')]
+            for _ in range(iterations):
+                new_state: int = 0
+                for table, byte in zip(step_tables, state.to_bytes(nchunks, 'little')):
+                    new_state ^= table[byte]
+                state = new_state
+                log += [format(state, f'0{degree}b')]
+            self.log: list[str] = log
+
+    def iter_bits(self, seed=None):
+        """
+        endless output bits as ints, the same bits as generate
+        self.state is kept at the state after the last bit yielded, so iteration resumes from it when seed is None
+        """
+        state: int = self.state if seed is None else seed
+        if isinstance(state, str):
+            state: int = int(state, 2)
+        if state >> self.degree:
+            raise ValueError(LFSR.SEED_ERROR)
+        step_tables: tuple = block_tables(list(self.step_map()))
+        nchunks: int = len(step_tables)
+        self.state: int = state
+        while True:
+            new_state: int = 0
+            for table, byte in zip(step_tables, state.to_bytes(nchunks, 'little')):
+                new_state ^= table[byte]
+            state = new_state
+            self.state = state
+            yield state & 1
+
+    def iter_chunks(self, seed=None, chunk_bytes: int = None):
+        """
+        endless output packed into chunks of chunk_bytes bytes, as generate_packed
+        self.state is kept at the state after the last chunk yielded, so iteration resumes from it when seed is None
+        """
+        state: int = self.state if seed is None else seed
+        if isinstance(state, str):
+            state: int = int(state, 2)
+        if state >> self.degree:
+            raise ValueError(LFSR.SEED_ERROR)
+        if chunk_bytes is None:
+            chunk_bytes: int = LFSR.CHUNK_BYTES
+        columns: tuple[int] = self.step_map()
+        width, tables = linear_tables(columns)
+        jump: list[int] = mat_pow(list(columns), 8*chunk_bytes)
+        self.state: int = state
+        for chunk in iter_blocks(tables, width, mat_vec(columns, state), chunk_bytes):
+            state = mat_vec(jump, state)
+            self.state = state
+            yield chunk
+
+    def write_packed(self, path: str, seed, nbits: int, **kwargs) -> None:
+        """
+        write nbits of output from seed to a file, as LFSR.write_packed
+        seed None continues from self.state
+        """
+        try:
+            chunk_bytes: int = kwargs['chunk_bytes']
+        except KeyError:
+            chunk_bytes: int = LFSR.CHUNK_BYTES
+        if seed is None:
+            seed: int = self.state
+        write_chunks(path, self.iter_chunks(seed, chunk_bytes), nbits)
+        if isinstance(seed, str):
+            seed: int = int(seed, 2)
+        self.state: int = mat_vec(mat_pow(list(self.step_map()), nbits), seed)
+
+    def find_period(self, **kwargs) -> None:
+        """
+        exact period from the multiplicative order of X, as LFSR.find_period,
+        with the minimal polynomial of seed, or of the combined step map, in place of
+        the characteristic polynomial
+        """
+        degree: int = self.degree
+        columns: tuple[int] = self.step_map()
+        minimal: int = mat_minpoly(list(columns))
+
+        try:
+            seed = kwargs['seed']
+        except KeyError:
+            seed = None
+
+        if seed is None:
+            poly: int = minimal
+            while poly & 1 == 0:
+                poly >>= 1
+            self.period: int = poly_order(poly)
+        else:
+            if isinstance(seed, str):
+                seed: int = int(seed, 2)
+            if seed >> degree:
+                raise ValueError(LFSR.SEED_ERROR)
+            poly: int = krylov_minpoly(list(columns), seed)
+            self.period = poly_order(poly) if poly & 1 else 'Not found'
+
+        self.primitive: bool = minimal.bit_length() - 1 == degree and poly_is_primitive(minimal)
+
     def generate_comparison(self, **kwargs) -> None:
         """
         compare randomness of multilfsrs against each factor lfsr
@@ -174,13 +659,13 @@ class MultiLFSR(Analyser):
     def comparisons_plot(self, **kwargs):
         """
         plot randomness comparisons of multilfsr against randomness of each factor lfsr
+        accepts the downsampling kwargs of functions.running_prob
         """
         try:
             sf = kwargs['SIG_FIGS']
         except KeyError:
             sf = self.SIG_FIGS
 
-        multi_stream: str = self.stream 
         try:
             lfsr_data = self.lfsr_data
         except AttributeError:
@@ -192,22 +677,18 @@ class MultiLFSR(Analyser):
                     'tap_positions': lfsr.tap_positions,
                     'stream': lfsr_stream
                 }
+            self.lfsr_data: dict = lfsr_data
             return self.comparisons_plot(**kwargs)
 
-        xdata: list[int] = [0]
-        multi_ydata: list[float] = [100.0 if multi_stream[0]=='1' else 0.0]
-        for i in range(len(multi_stream[1:])):
-            xdata += [i+1]
-            data: str = multi_stream[:i+1]
-            ones_count: int = count_func(data, '1')
-            ones_prob: float = round(100*ones_count / (i+1), sf)
-            multi_ydata += [ones_prob]
+        xdata, multi_ydata = running_prob(self.bit_array(), sf, **kwargs)
 
         try:
             FIGSIZE = kwargs['figsize']
         except KeyError:
             FIGSIZE = (8, 5) # default
 
+        import matplotlib.pyplot as plt
+
         NUM_COLS = 2
         NUM_ROWS = len(lfsr_data)
         fig, axes = plt.subplots(ncols=NUM_COLS, nrows=NUM_ROWS, figsize=FIGSIZE)
@@ -226,17 +707,12 @@ class MultiLFSR(Analyser):
                     curr_index: int = (row_num + i) // 2
                     curr_stream: str = lfsr_data[curr_index]['stream']
                     curr_taps = lfsr_data[curr_index]['tap_positions']
-                    curr_ydata: list[float] = [100.0 if curr_stream[0]=='1' else 0.0]
-                    for i in range(len(curr_stream[1:])):
-                        data: str = curr_stream[:i+1]
-                        ones_count: int = count_func(data, '1')
-                        ones_prob: float = round(100*ones_count / (i+1), sf)
-                        curr_ydata += [ones_prob]
+                    curr_xdata, curr_ydata = running_prob(stream_bits(curr_stream), sf, **kwargs)
 
                     col.set_title(f'LFSR with taps at {curr_taps}')
                     col.set_xlabel('State')
                     col.set_ylabel('Probability bit = 1')
-                    col.plot(xdata, curr_ydata)
+                    col.plot(curr_xdata, curr_ydata)
 
             row_num += NUM_COLS
 
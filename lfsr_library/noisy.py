@@ -0,0 +1,177 @@
+"""
+tap and seed recovery from a capture with bit errors
+
+lin_solve reads only the first 2*degree bits, so one flipped bit there gives wrong taps
+instead, windows of 2*max_degree + MARGIN bits are sampled across the stream and each is solved
+by Berlekamp-Massey: an error-free window gives the register itself, with linear complexity
+at most max_degree, while a window with errors almost never has complexity that low
+the state at the start of an error-free window is stepped back to the seed, and each distinct
+(degree, taps, seed) is regenerated and compared with the whole stream by a Validator,
+stopping once one reaches the target accuracy
+
+at a bit error rate p a window is error-free with probability (1 - p)^(2*max_degree + MARGIN),
+0.24 for max_degree 64 at p = 0.01, so a few dozen windows usually suffice
+"""
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from .lfsr import LFSR
+from .bitstream import BitStream
+from .validate import Validator
+from .functions.gf2 import BerlekampMassey
+from .instrument import instrumented
+
+_worker_stream: BitStream = None # the captured stream, sent once to each worker process
+
+def _init_worker(packed: bytes, length: int) -> None:
+    global _worker_stream
+    _worker_stream = BitStream(buffer=packed, length=length)
+
+def _solve_windows(positions: list[int], window_bits: int, max_degree: int, stream: BitStream = None) -> list[tuple]:
+    """
+    (position, degree, tap_positions, state at position) for each window of stream, or else
+    the stream of this worker process, with a shortest LFSR of degree at most max_degree
+    registers without a tap at position 0 are left out, as they cannot be stepped back
+    """
+    stream: BitStream = stream if stream is not None else _worker_stream
+    solved: list[tuple] = []
+    for position in positions:
+        window: BitStream = stream[position:position + window_bits]
+        bm: BerlekampMassey = BerlekampMassey()
+        bm.update(window.bits().tobytes())
+        degree: int = bm.complexity
+        if 0 < degree <= max_degree and (bm.connection >> degree) & 1:
+            tap_positions: tuple[int] = tuple(i for i, x in enumerate(bm.tap_vector()) if x==1)
+            solved += [(position, degree, tap_positions, window[:degree].to_int())]
+    return solved
+
+class NoisySolver:
+
+    MAX_DEGREE: int = 64
+    MARGIN: int = 16 # window bits beyond 2*max_degree
+    ACCURACY: float = 0.95 # target accuracy, stop once a candidate reaches it
+    WINDOWS: int = 4096 # windows sampled at most
+    BATCH: int = 32 # windows per task
+    WORKERS: int = 1 # solve in this process
+
+    # error messages
+    LENGTH_ERROR: str = "Stream of {} bits is shorter than a window of {} bits"
+
+    def __init__(self, **kwargs) -> None:
+        """
+        stream may be a '0'/'1' string or a BitStream
+        max_degree bounds the degree searched, accuracy is the target fraction of stream bits matched
+        windows bounds the windows sampled, sampling_seed makes the sample reproducible
+        pass workers > 1 to solve batches of windows in a process pool
+        """
+        self.stream = kwargs['stream']
+        self.bitstream: BitStream = self.stream if isinstance(self.stream, BitStream) else BitStream.from_str(self.stream)
+        try:
+            self.max_degree: int = kwargs['max_degree']
+        except KeyError:
+            self.max_degree: int = self.MAX_DEGREE
+        try:
+            self.accuracy: float = kwargs['accuracy']
+        except KeyError:
+            self.accuracy: float = self.ACCURACY
+        try:
+            self.windows: int = kwargs['windows']
+        except KeyError:
+            self.windows: int = self.WINDOWS
+        try:
+            self.batch: int = kwargs['batch']
+        except KeyError:
+            self.batch: int = self.BATCH
+        try:
+            self.workers: int = kwargs['workers']
+        except KeyError:
+            self.workers: int = self.WORKERS
+        try:
+            self.sampling_seed: int = kwargs['sampling_seed']
+        except KeyError:
+            self.sampling_seed: int = None
+
+        self.window_bits: int = 2*self.max_degree + self.MARGIN
+        if len(self.bitstream) < self.window_bits:
+            raise ValueError(self.LENGTH_ERROR.format(len(self.bitstream), self.window_bits))
+
+    @instrumented(
+        'NoisySolver.solve',
+        params=lambda self: {'stream_length': len(self.bitstream), 'max_degree': self.max_degree, 'workers': self.workers},
+        counts=lambda self: {'windows_solved': self.windows_solved, 'candidates_validated': len(self.results)}
+    )
+    def solve(self) -> None:
+        """
+        sets results, a list of dicts ranked by accuracy, with degree, tap_positions, seed (a Fibonacci state),
+        votes, the error-free windows that gave the candidate, and accuracy and hamming_length over
+        the compared_length bits compared, the comparison stopping once the target accuracy is out of reach
+        found is True when results[0] reaches the target, windows_solved counts the windows sampled
+        """
+        length: int = len(self.bitstream)
+        positions: list[int] = random.Random(self.sampling_seed).sample(
+            range(length - self.window_bits + 1), min(self.windows, length - self.window_bits + 1)
+        )
+        batches: list[list[int]] = [positions[i:i + self.batch] for i in range(0, len(positions), self.batch)]
+
+        self.candidates: dict = {}
+        self.windows_solved: int = 0
+        self.found: bool = False
+        if self.workers <= 1:
+            for batch in batches:
+                self._consider(_solve_windows(batch, self.window_bits, self.max_degree, self.bitstream), len(batch))
+                if self.found:
+                    break
+        else:
+            queue = iter(batches)
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.bitstream.packed(), length)
+            ) as pool:
+                pending: dict = {
+                    pool.submit(_solve_windows, batch, self.window_bits, self.max_degree): len(batch)
+                    for batch in islice(queue, 2*self.workers)
+                }
+                while pending and not self.found:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if not self.found:
+                            self._consider(future.result(), pending[future])
+                        del pending[future]
+                    for batch in islice(queue, 0 if self.found else len(done)):
+                        pending[pool.submit(_solve_windows, batch, self.window_bits, self.max_degree)] = len(batch)
+                for future in pending:
+                    future.cancel()
+
+        self.results: list[dict] = sorted(
+            self.candidates.values(), key=lambda result: (-result['accuracy'], -result['votes'])
+        )
+
+    def _consider(self, solved: list[tuple], nwindows: int) -> None:
+        """
+        count the votes of solved windows, validating each new candidate, until one reaches the target
+        """
+        length: int = len(self.bitstream)
+        for position, degree, tap_positions, state in solved:
+            seed: int = LFSR(degree=degree, tap_positions=list(tap_positions)).state_at(state, -position)
+            key: tuple = (degree, tap_positions, seed)
+            if key in self.candidates:
+                self.candidates[key]['votes'] += 1
+                continue
+
+            validator: Validator = Validator(
+                stream=self.bitstream, tap_positions=list(tap_positions), degree=degree, seed=seed,
+                threshold=int((1 - self.accuracy) * length)
+            )
+            validator.validate()
+            self.candidates[key] = {
+                'degree': degree,
+                'tap_positions': list(tap_positions),
+                'seed': seed,
+                'votes': 1,
+                'accuracy': validator.accuracy,
+                'hamming_length': validator.hamming_length,
+                'compared_length': validator.compared_length
+            }
+            if not validator.exceeded and validator.accuracy >= self.accuracy:
+                self.found = True
+                break
+        self.windows_solved += nwindows
@@ -0,0 +1,82 @@
+"""
+incremental analysis of bitstreams received in chunks
+"""
+import numpy as np
+from .functions.functions import poly_str, probability_dicts
+from .functions.engine import unpack_str
+from .functions.gf2 import BerlekampMassey
+from .bitstream import BitStream
+
+class StreamAnalyser:
+    """
+    keeps the linear complexity profile, the current shortest LFSR
+    and the bit counts of everything passed to update so far
+    """
+
+    SIG_FIGS: int = 4
+
+    # error messages
+    STREAM_ERROR: str = "No bits received. Pass chunks to update before calling."
+
+    def __init__(self, **kwargs) -> None:
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+        self.bm: BerlekampMassey = BerlekampMassey()
+        self.stream_length: int = 0
+        self.zeros_count: int = 0
+        self.ones_count: int = 0
+
+    def update(self, chunk, **kwargs) -> None:
+        """
+        chunk is a '0'/'1' string, packed bytes in the LSb first order of LFSR.packed_stream,
+        a BitStream, a numpy array or an iterable of 0/1 values
+        for packed bytes pass nbits to take fewer than 8*len(chunk) bits
+        """
+        if isinstance(chunk, BitStream):
+            chunk: bytes = chunk.bits().tobytes()
+        elif isinstance(chunk, np.ndarray):
+            chunk: bytes = chunk.astype(np.uint8).tobytes()
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            try:
+                nbits: int = kwargs['nbits']
+            except KeyError:
+                nbits: int = 8*len(chunk)
+            chunk: str = unpack_str(bytes(chunk), nbits)
+        elif not isinstance(chunk, str):
+            chunk: bytes = bytes(map(int, chunk))
+
+        ones_count: int = chunk.count('1') if isinstance(chunk, str) else chunk.count(1)
+        self.ones_count += ones_count
+        self.zeros_count += len(chunk) - ones_count
+        self.stream_length += len(chunk)
+
+        bm: BerlekampMassey = self.bm
+        bm.update(chunk)
+
+        degree: int = bm.complexity
+        self.linear_complexity: int = degree
+        self.profile: list[tuple[int]] = bm.profile
+        self.connection_polynomial: str = poly_str(bm.connection)
+        self.solution: list[int] = bm.tap_vector()
+        self.tap_positions: list[int] = [i for i, x in enumerate(self.solution) if x==1]
+
+        lfsr_solutions: dict = {}
+        if degree > 0:
+            lfsr_solutions[degree] = {
+                'taps': self.solution,
+                'tap_positions': self.tap_positions
+            }
+        self.lfsr_solutions: dict = lfsr_solutions
+
+    def randomness(self, **kwargs) -> None:
+        """
+        randomness_dict and LaplaceSuccession of the bits seen so far, as in Analyser.randomness
+        """
+        try:
+            sf: int = kwargs['SIG_FIGS']
+        except KeyError:
+            sf: int = self.SIG_FIGS
+
+        if self.stream_length == 0:
+            raise AttributeError(self.STREAM_ERROR)
+        self.randomness_dict, self.LaplaceSuccession = probability_dicts(self.zeros_count, self.ones_count, sf)
@@ -1,68 +1,202 @@
 """
 validate solution for inverted lfsr
 """
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from .lfsr import LFSR
 from .analyser import Analyser
-from .functions.functions import hamming_len
+from .bitstream import BitStream
+from .cache import SolutionCache, stream_digest
+from .functions.functions import taps_to_mask
+from .functions.engine import lfsr_tables, run_blocks
+from .instrument import instrumented
 
 class Validator:
 
+    CHUNK_BITS: int = 1 << 18 # bits generated and compared per pass
+
     def __init__(self, **kwargs) -> None:
-        
-        self.stream: str = kwargs['stream']
+        """
+        stream may be a '0'/'1' string or a BitStream
+        pass threshold to stop comparing once more than threshold bits mismatch
+        pass seed to regenerate from that state rather than the first degree bits of the stream
+        """
+        self.stream = kwargs['stream']
+        self.bitstream: BitStream = self.stream if isinstance(self.stream, BitStream) else BitStream.from_str(self.stream)
         self.tap_positions: list[int] = kwargs['tap_positions']
         self.degree: int = kwargs['degree']
+        try:
+            self.threshold: int = kwargs['threshold']
+        except KeyError:
+            self.threshold: int = None
+        try:
+            self.seed: int = kwargs['seed']
+        except KeyError:
+            self.seed: int = None
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs):
+        """
+        validate against a packed capture through a memory map, chunk by chunk
+        offset and length select a window in bits, other kwargs as for Validator
+        """
+        window: dict = {k: kwargs.pop(k) for k in ['offset', 'length'] if k in kwargs}
+        return cls(stream=BitStream.from_file(path, **window), **kwargs)
 
+    @instrumented(
+        'Validator.validate',
+        params=lambda self: {'degree': self.degree, 'stream_length': len(self.bitstream)},
+        counts=lambda self: {'bits_compared': self.compared_length}
+    )
     def validate(self) -> None:
-        
+        """
+        regenerate the stream from its first degree bits, or seed, chunk by chunk, comparing each chunk
+        by XOR and popcount as it is generated
+        sets hamming_length and accuracy over the compared_length bits compared,
+        first_divergence (-1 if none) and exceeded, True if stopped early at the threshold
+        """
         deg: int = self.degree
-        taps: list[int] = self.tap_positions
-        stream: str = self.stream
+        bitstream: BitStream = self.bitstream
+        length: int = len(bitstream)
+        threshold: int = self.threshold
 
         # from stream, generate new stream from lfsr
-        lfsr: LFSR = LFSR(degree=deg, tap_positions=taps)
-        SEED: int = int(stream[:deg][::-1], 2)
-        ITERATIONS: int = len(stream)-1
-        lfsr.generate(bitseq=SEED, iterations=ITERATIONS)
-
-        new_stream: str = lfsr.stream
+        lfsr: LFSR = LFSR(degree=deg, tap_positions=self.tap_positions)
+        width, tables = lfsr_tables(deg, taps_to_mask(lfsr.tap_positions))
+        nblocks: int = max(1, self.CHUNK_BITS // width)
+        state: int = bitstream[:deg].to_int() if self.seed is None else self.seed
 
         # validate
-        self.hamming_length: int = hamming_len(stream, new_stream)
-        self.accuracy: float = 1 - self.hamming_length / len(stream)
+        hamming_length: int = 0
+        first_divergence: int = -1
+        compared: int = 0
+        exceeded: bool = False
+        while compared < length and not exceeded:
+            buffer, state = run_blocks(tables, width, state, nblocks)
+            chunk_length: int = min(len(buffer) * 8, length - compared)
+            new_chunk: BitStream = BitStream(buffer=buffer, length=chunk_length)
+            diff: BitStream = bitstream[compared:compared + chunk_length] ^ new_chunk
+            if first_divergence < 0 and diff.find(1) >= 0:
+                first_divergence = compared + diff.find(1)
+            hamming_length += diff.popcount()
+            compared += chunk_length
+            exceeded = threshold is not None and hamming_length > threshold
+
+        self.hamming_length: int = hamming_length
+        self.compared_length: int = compared
+        self.first_divergence: int = first_divergence
+        self.exceeded: bool = exceeded
+        self.accuracy: float = 1 - hamming_length / compared if compared else 1.0
+
+_worker_stream: BitStream = None # the captured stream, sent once to each worker process
+
+def _init_worker(packed: bytes, length: int) -> None:
+    global _worker_stream
+    _worker_stream = BitStream(buffer=packed, length=length)
+
+def _validate_candidate(degree: int, tap_positions: list[int], threshold: int, stream: BitStream = None) -> dict:
+    """
+    one entry of ItValidator.results, against stream or else the stream of this worker process
+    """
+    validator: Validator = Validator(
+        stream=stream if stream is not None else _worker_stream,
+        tap_positions=tap_positions, degree=degree, threshold=threshold
+    )
+    validator.validate()
+    return {
+        'hamming_length': validator.hamming_length,
+        'accuracy': validator.accuracy,
+        'first_divergence': validator.first_divergence
+    }
 
 class ItValidator:
 
+    WORKERS: int = 1 # validate in this process
+    EXECUTOR: str = 'process' # or 'thread'
+
+    # error messages
+    EXECUTOR_ERROR: str = "Unknown executor, use 'process' or 'thread'"
+
     def __init__(self, **kwargs) -> None:
-        
-        self.stream: str = kwargs['stream']
+        """
+        stream may be a '0'/'1' string or a BitStream
+        threshold is passed on to each Validator
+        pass workers > 1 to validate candidates in a pool, of processes by default or threads with executor='thread'
+        pass cache, a SolutionCache, to reuse the results of a stream validated before and the lin_solve systems of its prefixes
+        """
+        self.stream = kwargs['stream']
         self.iterations: int = len(self.stream)-1
+        try:
+            self.threshold: int = kwargs['threshold']
+        except KeyError:
+            self.threshold: int = None
+        try:
+            self.workers: int = kwargs['workers']
+        except KeyError:
+            self.workers: int = self.WORKERS
+        try:
+            self.executor: str = kwargs['executor']
+        except KeyError:
+            self.executor: str = self.EXECUTOR
+        if self.executor not in ('process', 'thread'):
+            raise ValueError(self.EXECUTOR_ERROR)
+        try: # 'iter' solves every degree with lin_solve, 'bm' the minimal one by Berlekamp-Massey
+            self.solver: str = kwargs['solver']
+        except KeyError:
+            self.solver: str = 'iter'
+        try:
+            self.cache: SolutionCache = kwargs['cache']
+        except KeyError:
+            self.cache: SolutionCache = None
 
+    @instrumented(
+        'ItValidator.validate',
+        params=lambda self: {'stream_length': len(self.stream), 'workers': self.workers, 'executor': self.executor},
+        counts=lambda self: {'candidates_validated': len(self.results)}
+    )
     def validate(self):
         
-        analyser: Analyser = Analyser(stream=self.stream)
-        analyser.iter_solve()
+        analyser: Analyser = Analyser(stream=self.stream, cache=self.cache)
+        key: str = None
+        if self.cache is not None: # results depend on every bit of the stream
+            key = f'ItValidator:{self.solver}:{self.threshold}:' + stream_digest(analyser.bitstream)
+            entry: dict = self.cache.get(key)
+            if entry is not None:
+                self.results: dict = {degree: result for degree, result in entry['results']}
+                return
+
+        if self.solver == 'bm':
+            analyser.bm_solve()
+        else:
+            analyser.iter_solve()
+
+        # every candidate stream is generated once, inside its Validator
+        bitstream: BitStream = analyser.bitstream
+        candidates: list[tuple] = [
+            (degree, params['tap_positions']) for degree, params in analyser.lfsr_solutions.items()
+            if params['tap_positions'] is not None # None: no solution found for given bitstream and degree
+        ]
 
-        lfsr_solutions: dict = analyser.lfsr_solutions
         validator_rsults: dict = {}
-        ITERATIONS: int = self.iterations
-        for soln, params in lfsr_solutions.items():
-            degree = soln 
-
-            SEED: int = int(self.stream[:degree][::-1], 2)
-            tap_positions: list[int] = params['tap_positions']
-            if tap_positions == None: # no solution found for given bitstream and degree
-                pass 
+        if self.workers <= 1:
+            for degree, tap_positions in candidates:
+                validator_rsults[degree] = _validate_candidate(degree, tap_positions, self.threshold, bitstream)
+        else:
+            if self.executor == 'process':
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_init_worker, initargs=(bitstream.packed(), len(bitstream))
+                )
+                shared: BitStream = None
             else:
-                lfsr = LFSR(degree=degree, tap_positions=tap_positions)
-                lfsr.generate(bitseq=SEED, iterations=ITERATIONS)
-
-                validator: Validator = Validator(stream=self.stream, tap_positions=tap_positions, degree=degree)
-                validator.validate()
-                validator_rsults[degree] = {
-                    'hamming_length': validator.hamming_length,
-                    'accuracy': validator.accuracy
+                pool = ThreadPoolExecutor(max_workers=self.workers)
+                shared: BitStream = bitstream
+            with pool:
+                futures: dict = {
+                    degree: pool.submit(_validate_candidate, degree, tap_positions, self.threshold, shared)
+                    for degree, tap_positions in candidates
                 }
-        
-        self.results: dict = validator_rsults
+                for degree, future in futures.items():
+                    validator_rsults[degree] = future.result()
 
+        self.results: dict = validator_rsults
+        if self.cache is not None:
+            self.cache.put(key, {'results': list(validator_rsults.items())})
@@ -4,4 +4,4 @@ context module to enable running tests in directory tests/
 import os, sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lfsr_library import Analyser, LFSR, MultiLFSR, Validator, ItValidator
\ No newline at end of file
+from lfsr_library import Analyser, LFSR, MultiLFSR, Validator, ItValidator, StreamAnalyser, BitStream
\ No newline at end of file
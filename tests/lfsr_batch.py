@@ -0,0 +1,25 @@
+import numpy as np
+from context import LFSR, BitStream
+
+DEGREE: int = 31
+NBITS: int = 10**5
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=[0, 3])
+seeds: np.ndarray = np.random.default_rng(1).integers(1, 2**DEGREE, size=1000)
+
+# one packed row per seed, the registers stepped together
+batch: np.ndarray = lfsr.generate_batch(seeds, NBITS)
+
+lfsr.generate_packed(int(seeds[7]), NBITS - 1)
+row: BitStream = BitStream(buffer=batch[7], length=NBITS)
+
+def main():
+    print(f"""
+    batch of {batch.shape[0]} seeds, {batch.shape[1]} packed bytes each\n
+    row 7 matches generate_packed: {row == lfsr.bitstream}\n
+    row 7: {row!r}\n
+    ones per row, first five: {[BitStream(buffer=r, length=NBITS).popcount() for r in batch[:5]]}
+    """)
+
+if __name__ == '__main__':
+    main()
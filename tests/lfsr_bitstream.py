@@ -0,0 +1,33 @@
+from context import LFSR, Analyser, Validator, BitStream
+
+ITERATIONS: int = 10**7
+DEGREE: int = 31
+TAPS: list[int] = [0, 3]
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(0x2545F491, ITERATIONS)
+bitstream: BitStream = lfsr.bitstream
+
+# slices are views on the same buffer
+window: BitStream = bitstream[1000:1064]
+shifted: BitStream = bitstream[1000 + DEGREE:1064 + DEGREE]
+
+analyser: Analyser = Analyser(stream=bitstream)
+analyser.randomness()
+
+validator: Validator = Validator(stream=bitstream, tap_positions=TAPS, degree=DEGREE)
+validator.validate()
+
+def main():
+    print(f"""
+    {len(bitstream)} bits held in {bitstream.buffer.nbytes} bytes, {bitstream.popcount()} ones\n
+    bits 1000 to 1063: {window}\n
+    XOR with the stream {DEGREE} bits on: {window ^ shifted}\n
+    view shares the buffer: {window.buffer.base is not None}\n
+    round trip through the legacy string: {BitStream.from_str(str(window)) == window}\n
+    randomness: {analyser.randomness_dict}\n
+    validator accuracy: {validator.accuracy}
+    """)
+
+if __name__ == '__main__':
+    main()
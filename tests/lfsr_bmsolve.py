@@ -0,0 +1,15 @@
+from context import Analyser
+
+BITSTREAM = '1011101110010101001010001001011010001100111001'
+analyser: Analyser = Analyser(stream=BITSTREAM)
+analyser.bm_solve()
+
+def main():
+    print(f"linear complexity: {analyser.linear_complexity}")
+    print(f"connection polynomial: {analyser.connection_polynomial}")
+    for k, v in analyser.lfsr_solutions.items():
+        for v_key, v_val in v.items():
+            print(f"For degree {k} found: {v_key} = {v_val}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import time
+from context import LFSR, Analyser, ItValidator
+from lfsr_library import SolutionCache
+
+lfsr: LFSR = LFSR(degree=24, tap_positions=[0, 1, 2, 7])
+lfsr.generate_packed(0xBEEF, 4095)
+capture = lfsr.bitstream
+
+def timed(f) -> float:
+    start: float = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+def main():
+    cache: SolutionCache = SolutionCache(max_entries=4096)
+    short: Analyser = Analyser(stream=capture[:1024], cache=cache)
+    longer: Analyser = Analyser(stream=capture[:1536], cache=cache)
+
+    first: float = timed(short.iter_solve)
+    again: float = timed(short.iter_solve)
+    prefix: float = timed(longer.iter_solve) # degrees up to 512 of 768 are found in the cache
+    hits: int = cache.hits
+    reference: Analyser = Analyser(stream=capture[:1024])
+    reference.iter_solve()
+
+    # ItValidator results, kept in an sqlite file across caches
+    path: str = os.path.join(tempfile.mkdtemp(), 'solutions.sqlite')
+    stored: SolutionCache = SolutionCache(path=path)
+    it_validator: ItValidator = ItValidator(stream=capture[:1024], cache=stored)
+    validate_first: float = timed(it_validator.validate)
+    stored.close()
+    reopened: SolutionCache = SolutionCache(path=path, max_entries=16)
+    it_validator_again: ItValidator = ItValidator(stream=capture[:1024], cache=reopened)
+    validate_again: float = timed(it_validator_again.validate)
+    reopened.close()
+
+    print(f"""
+    iter_solve on 1024 bits: {first:.3f} s, repeated {again:.4f} s, same solutions as uncached {short.lfsr_solutions == reference.lfsr_solutions}\n
+    iter_solve on 1536 bits sharing the prefix: {prefix:.3f} s, {hits} cache hits, {cache.misses} misses, {len(cache)} entries\n
+    degree 24 taps {longer.lfsr_solutions[24]['tap_positions']}\n
+    ItValidator: {validate_first:.3f} s, from the sqlite file {validate_again:.4f} s, same results {it_validator.results == it_validator_again.results}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+import warnings
+from context import LFSR
+
+DEGREE: int = 15
+
+lfsr: LFSR = LFSR.from_catalogue(DEGREE)
+lfsr.find_period()
+pentanomial: LFSR = LFSR.from_catalogue(DEGREE, weight=5)
+pentanomial.find_period()
+
+LARGE_DEGREE: int = 1024
+large: LFSR = LFSR.from_catalogue(LARGE_DEGREE)
+large.generate_packed('10'*(LARGE_DEGREE//2), 10**5)
+
+# 2^673 - 1 is not completely factored, so its entry is not proven primitive
+UNCERTIFIED_DEGREE: int = 673
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter('always')
+    LFSR.from_catalogue(UNCERTIFIED_DEGREE)
+uncertified: LFSR = LFSR.from_catalogue(UNCERTIFIED_DEGREE, allow_uncertified=True)
+
+def main():
+    print(f"""
+    degree {DEGREE} minimal weight: {lfsr.feedback_polynomial}, period {lfsr.period}, primitive: {lfsr.primitive}\n
+    degree {DEGREE} pentanomial: {pentanomial.feedback_polynomial}, period {pentanomial.period}, primitive: {pentanomial.primitive}\n
+    degree {LARGE_DEGREE}: {large.feedback_polynomial}\n
+    first 64 of {large.stream_length} bits: {large.packed_stream[:8].hex()}\n
+    degree {UNCERTIFIED_DEGREE}: {[str(warning.message) for warning in caught]}\n
+    with allow_uncertified=True: {uncertified.feedback_polynomial}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+from context import LFSR
+from lfsr_library import GeffeGenerator, CombinationGenerator, FilterGenerator
+from lfsr_library import ShrinkingGenerator, StopAndGoGenerator, AlternatingStepGenerator
+
+NBITS: int = 10**6
+
+# maximal-length registers of coprime periods
+lfsr1: LFSR = LFSR.from_catalogue(29)
+lfsr2: LFSR = LFSR.from_catalogue(31)
+lfsr3: LFSR = LFSR.from_catalogue(33)
+seeds: list[int] = [0x1D2C3B4A, 0x5E6F7081, 0x192A3B4C5]
+
+geffe: GeffeGenerator = GeffeGenerator(lfsr_list=[lfsr1, lfsr2, lfsr3])
+geffe.generate(seeds, NBITS)
+
+# majority function as a truth table, bit v of the int being f(v)
+majority: CombinationGenerator = CombinationGenerator(lfsr_list=[lfsr1, lfsr2, lfsr3], truth_table=0b11101000)
+majority.generate(seeds, NBITS)
+
+# filter of four state bits in algebraic normal form, balanced as linear in x_0
+nonlinear_filter: FilterGenerator = FilterGenerator(
+    lfsr=lfsr2, positions=[0, 5, 17, 30], anf=[(0,), (1, 2), (2, 3), (1, 2, 3)]
+)
+nonlinear_filter.generate(seeds[1:2], NBITS)
+
+shrinking: ShrinkingGenerator = ShrinkingGenerator(lfsr_list=[lfsr1, lfsr2])
+shrinking.generate(seeds[:2], NBITS)
+
+stop_and_go: StopAndGoGenerator = StopAndGoGenerator(lfsr_list=[lfsr1, lfsr2])
+stop_and_go.generate(seeds[:2], NBITS)
+
+alternating: AlternatingStepGenerator = AlternatingStepGenerator(lfsr_list=[lfsr1, lfsr2, lfsr3])
+alternating.generate(seeds, NBITS)
+
+def stuck_selector(selector: LFSR, seed) -> str:
+    """
+    a selector that only outputs zeros raises rather than waiting forever for a bit to output
+    """
+    try:
+        ShrinkingGenerator(lfsr_list=[lfsr1, selector]).generate([seeds[0], seed], 100)
+        return 'no error'
+    except ValueError as error:
+        return f'ValueError: {error}'
+
+def main():
+    print()
+    for name, generator in [
+        ('Geffe', geffe), ('majority', majority), ('filter', nonlinear_filter),
+        ('shrinking', shrinking), ('stop-and-go', stop_and_go), ('alternating step', alternating)
+    ]:
+        generator.randomness()
+        generator.statistical_tests(tests=['frequency', 'runs', 'serial'])
+        passed: int = sum(result.passed for result in generator.test_results.values())
+        print(f"    {name}: {generator.bitstream!r}")
+        print(f"        {generator.randomness_dict}, {passed}/{len(generator.test_results)} tests passed")
+    print(f"""
+    shrinking, selector seed 0: {stuck_selector(LFSR.from_catalogue(7), 0)}\n
+    shrinking, selector without tap 0 falling to zero: {stuck_selector(LFSR(degree=4, tap_positions=[3]), 1)}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+from context import LFSR
+from lfsr_library import GeffeGenerator, CorrelationAttack
+from lfsr_library.functions.boolean import input_correlations
+
+NBITS: int = 3000
+
+# the first and last Geffe registers agree with the output 75% of the time
+lfsr1: LFSR = LFSR.from_catalogue(22)
+lfsr2: LFSR = LFSR.from_catalogue(19)
+lfsr3: LFSR = LFSR.from_catalogue(24)
+seeds: list[int] = [0x2ACE01, 0x5EED1, 0xC0FFEE]
+
+geffe: GeffeGenerator = GeffeGenerator(lfsr_list=[lfsr1, lfsr2, lfsr3])
+geffe.generate(seeds, NBITS)
+
+# every seed of each register scored against the keystream, 2^22 + 2^19 + 2^24 in all
+attack: CorrelationAttack = CorrelationAttack(stream=geffe.bitstream, lfsr_list=[lfsr1, lfsr2, lfsr3], top=2, workers=2)
+
+def main():
+    attack.attack()
+    print(f"""
+    correlation of the Geffe function with each input: {input_correlations([0, 0, 0, 1, 1, 1, 0, 1])}\n
+    true seeds: {[hex(seed) for seed in seeds]}\n
+    ranked candidates:""")
+    for result in attack.results:
+        print(f"    degree {result['degree']} taps {result['tap_positions']}: seed {hex(result['seed'])}, "
+              f"agreement {result['agreement']:.3f}, z {result['z_score']:.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os, tempfile
+from context import LFSR, MultiLFSR, Analyser, Validator
+
+DEGREE: int = 61
+NBITS: int = 10**7
+OFFSET: int = 12345 # bits into the file
+WINDOW: int = 10**6
+
+lfsr: LFSR = LFSR.from_catalogue(DEGREE)
+path: str = os.path.join(tempfile.mkdtemp(), 'keystream.bin')
+lfsr.write_packed(path, 0x5DEECE66D, NBITS) # streamed to disk chunk by chunk
+
+# windows of the file are memory-mapped, never read in whole
+analyser: Analyser = Analyser.from_file(path, length=NBITS)
+analyser.randomness()
+window: Analyser = Analyser.from_file(path, offset=OFFSET, length=WINDOW)
+window.lin_solve(degree=DEGREE)
+
+validator: Validator = Validator.from_file(path, offset=OFFSET, length=WINDOW, tap_positions=lfsr.tap_positions, degree=DEGREE)
+validator.validate()
+
+def continued(register, seed, nbits: int) -> bool:
+    """
+    writing nbits and then nbits more with seed None gives the file of one write of 2*nbits
+    """
+    paths: list[str] = [os.path.join(tempfile.mkdtemp(), name) for name in ('whole.bin', 'first.bin', 'second.bin')]
+    register.write_packed(paths[0], seed, 2*nbits)
+    register.write_packed(paths[1], seed, nbits)
+    register.write_packed(paths[2], None, nbits)
+    contents: list[bytes] = []
+    for name in paths:
+        with open(name, 'rb') as file:
+            contents += [file.read()]
+        os.remove(name)
+    return contents[0] == contents[1] + contents[2]
+
+multilfsr: MultiLFSR = MultiLFSR(degree=16, lfsr_list=[
+    LFSR(degree=16, tap_positions=[0, 2, 3, 5]), LFSR(degree=16, tap_positions=[0, 1, 3, 12])
+])
+
+def main():
+    print(f"""
+    wrote {os.path.getsize(path)} bytes for {NBITS} bits\n
+    randomness: {analyser.randomness_dict}\n
+    taps solved from bits {OFFSET} to {OFFSET + WINDOW}: {window.tap_positions}, catalogue taps: {lfsr.tap_positions}\n
+    validator accuracy over the window: {validator.accuracy}\n
+    writing on from the register state, LFSR: {continued(LFSR.from_catalogue(DEGREE), 0x5DEECE66D, 8*10**5)},
+    MultiLFSR: {continued(multilfsr, 0xACE1, 8*10**5)}
+    """)
+    os.remove(path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+from context import LFSR
+
+SEED = 0b110111001
+DEGREE: int = 9
+TAPS: list[int] = [0, 4]
+ITERATIONS: int = 30
+
+fibonacci: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+fibonacci.generate(bitseq=SEED, iterations=ITERATIONS)
+
+# same feedback polynomial, one shift and one conditional XOR per step
+galois: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS, config='galois')
+GALOIS_SEED: int = galois.to_galois_state(SEED)
+galois.generate(bitseq=GALOIS_SEED, iterations=ITERATIONS)
+
+def main():
+    print(f"""
+    feedback polynomial: {galois.feedback_polynomial}, Galois mask: {format(galois.galois_mask, f'0{DEGREE}b')}\n
+    Fibonacci seed {format(SEED, f'0{DEGREE}b')} -> Galois seed {format(GALOIS_SEED, f'0{DEGREE}b')}
+    and back: {format(galois.to_fibonacci_state(GALOIS_SEED), f'0{DEGREE}b')}\n
+    Fibonacci stream: {fibonacci.stream}\n
+    Galois stream:    {galois.stream}\n
+    equivalent: {fibonacci.stream == galois.stream}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import logging
+from context import LFSR, MultiLFSR, ItValidator
+from lfsr_library import instrument
+
+logging.basicConfig(level=logging.DEBUG, format='    log: %(message)s')
+
+events: list = []
+lfsr: LFSR = LFSR(degree=20, tap_positions=[0, 3])
+
+# off by default: nothing is recorded
+lfsr.generate_packed(0b10110011100011110000, 10**5)
+
+# a stats object and a callback, and a log sink for the multi-LFSR only
+with instrument.recording() as stats:
+    instrument.enable(events.append)
+    lfsr.generate_packed(0b10110011100011110000, 10**6)
+    lfsr.generate_packed(0b10110011100011110000, 255)
+    validator: ItValidator = ItValidator(stream=lfsr.bitstream)
+    validator.validate()
+
+    instrument.enable(instrument.LogSink())
+    multilfsr: MultiLFSR = MultiLFSR(
+        degree=20, lfsr_list=[lfsr, LFSR(degree=20, tap_positions=[0, 17])]
+    )
+    multilfsr.generate(0b10110011100011110000, 1000)
+instrument.disable()
+
+def main():
+    print("\n    per call:")
+    for name, summary in stats.summary().items():
+        print(f"    {name}: {summary}")
+    print(f"\n    totals: {stats.totals()}")
+    lin_solve: dict = {degree: entry for (name, degree), entry in stats.by_degree.items() if name == 'Analyser.lin_solve'}
+    print(f"\n    slowest lin_solve degrees [calls, seconds]: {sorted(lin_solve.items(), key=lambda item: -item[1][1])[:3]}")
+    print(f"\n    events seen by the callback: {len(events)}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+from itertools import islice
+from context import LFSR, MultiLFSR
+
+SEED: int = 0b110111001
+DEGREE: int = 9
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=[0, 4])
+first_bits: list[int] = list(islice(lfsr.iter_bits(SEED), 16))
+state_after: int = lfsr.state
+next_bits: list[int] = list(islice(lfsr.iter_bits(), 16)) # resumes from lfsr.state
+
+# endless keystream in fixed-size chunks, memory independent of the amount read
+large: LFSR = LFSR.from_catalogue(127)
+chunks = large.iter_chunks(1, chunk_bytes=1 << 16)
+total: int = sum(len(chunk) for chunk in islice(chunks, 64))
+
+multi: MultiLFSR = MultiLFSR(lfsr_list=[lfsr, LFSR(degree=DEGREE, tap_positions=[0, 1, 3, 5])], degree=DEGREE)
+multi_bits: list[int] = list(islice(multi.iter_bits(SEED), 16))
+
+def main():
+    print(f"""
+    first 16 bits: {''.join(map(str, first_bits))}, state after them: {format(state_after, f'0{DEGREE}b')}\n
+    next 16 bits: {''.join(map(str, next_bits))}\n
+    {total} bytes of degree 127 keystream read in chunks, register now at state {large.state:#x}\n
+    MultiLFSR bits: {''.join(map(str, multi_bits))}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -7,9 +7,9 @@ itval.validate()
 
 def main():
     for k, v in itval.results.items():
-        hamm, acc = v.items()
         print(f"""
-        for degree {k}, Hamming length is: {hamm[-1]} with Accuracy {100*acc[-1]:.2f} %\n
+        for degree {k}, Hamming length is: {v['hamming_length']} with Accuracy {100*v['accuracy']:.2f} %,
+        first divergence at bit {v['first_divergence']}\n
         """)
 
 if __name__ == '__main__':
@@ -0,0 +1,25 @@
+from context import LFSR, ItValidator
+
+ITERATIONS: int = 399
+DEGREE: int = 20
+TAPS: list[int] = [0, 3]
+WORKERS: int = 4
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(0xBEEF1, ITERATIONS)
+
+def main():
+    # pools are built inside main so that spawned worker processes can import this script
+    itval: ItValidator = ItValidator(stream=lfsr.bitstream, workers=WORKERS)
+    itval.validate()
+    threaded: ItValidator = ItValidator(stream=lfsr.bitstream, workers=WORKERS, executor='thread')
+    threaded.validate()
+
+    for k, v in itval.results.items():
+        print(f"""
+        for degree {k}, Hamming length is: {v['hamming_length']} with Accuracy {100*v['accuracy']:.2f} %\n
+        thread pool agrees: {threaded.results[k] == v}
+        """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+from context import LFSR
+
+SEED = 0b110111001
+DEGREE: int = len(bin(SEED))-2
+TAPS: list[int] = [1, 4]
+
+OFFSET: int = 2**40 + 12345
+SLICE: int = 64
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+state: int = lfsr.state_at(bitseq=SEED, steps=OFFSET)
+lfsr.generate_packed(bitseq=state, iterations=SLICE-1, log=True)
+
+def main():
+    print(f"""
+    state after {OFFSET} steps: {format(state, f'0{DEGREE}b')}\n
+    next {SLICE} bits: {lfsr.stream}
+    """)
+
+if __name__ == '__main__':
+    main()
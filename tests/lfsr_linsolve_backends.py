@@ -0,0 +1,24 @@
+from context import Analyser
+
+BITSTREAM = '10111011100101010010100010010110100011001110011110001101100001000101110101111011011111000011010011010110110101000001001110110010010011000000111010010001110001000000010110001111010000111111110010000101001111101010101110000011000101011001100101111110111100110111011100101010010100010010110100011001110011110001101100001000101110101111011011111000011010011010110110101000001001110110010010011000000111010'
+DEGREE = 8
+
+results: dict = {}
+for backend in ['gf2', 'sympy']:
+    analyser: Analyser = Analyser(stream=BITSTREAM, degree=DEGREE)
+    analyser.lin_solve(backend=backend)
+    results[backend] = analyser.tap_positions
+
+singular: Analyser = Analyser(stream='0'*2*DEGREE, degree=DEGREE)
+try:
+    singular.lin_solve()
+except ValueError:
+    pass
+
+def main():
+    for backend, taps in results.items():
+        print(f"{backend} tap positions: {taps}")
+    print(f"all-zero stream: rank {singular.rank}, singular {singular.singular}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import numpy as np
+from context import LFSR, Analyser, Validator, BitStream
+from lfsr_library import NoisySolver
+
+NBITS: int = 200000
+BIT_ERROR_RATE: float = 0.01
+SEED: int = 0x0123456789ABCDEF
+
+lfsr: LFSR = LFSR.from_catalogue(64)
+lfsr.generate_packed(SEED, NBITS - 1)
+errors: np.ndarray = np.random.default_rng(1).random(NBITS) < BIT_ERROR_RATE
+capture: BitStream = lfsr.bitstream ^ BitStream.from_bits(errors.astype(np.uint8))
+
+def main():
+    # lin_solve on the first 128 bits, two of which are flipped
+    analyser: Analyser = Analyser(stream=capture)
+    try:
+        analyser.lin_solve(degree=64)
+        lin_solve_taps = analyser.tap_positions
+    except ValueError as error:
+        lin_solve_taps = error
+    validator: Validator = Validator(stream=capture, degree=64, tap_positions=lfsr.tap_positions)
+    validator.validate()
+
+    solver: NoisySolver = NoisySolver(stream=capture, max_degree=64, accuracy=0.95, sampling_seed=0)
+    solver.solve()
+    best: dict = solver.results[0]
+
+    print(f"""
+    {int(errors.sum())} bit errors in {NBITS} bits, {int(errors[:128].sum())} in the first 128\n
+    lin_solve taps: {lin_solve_taps}\n
+    true taps from the first 64 bits: accuracy {validator.accuracy:.4f}\n
+    NoisySolver: found {solver.found} after {solver.windows_solved} windows, {len(solver.results)} candidates\n
+    degree {best['degree']}, taps {best['tap_positions']}, true taps {lfsr.tap_positions}\n
+    seed {best['seed']:#x}, true seed {SEED:#x}, accuracy {best['accuracy']:.4f}, votes {best['votes']}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+from context import LFSR, BitStream
+
+# 2^64 - 1 = 3 * 5 * 17 * 257 * 641 * 65537 * 6700417, so each log is a handful of small searches
+DEGREE: int = 64
+SEED: int = 0x0123456789ABCDEF
+OFFSET: int = 12345678901234567890
+
+lfsr: LFSR = LFSR.from_catalogue(DEGREE)
+
+# a 128-bit capture from far along the sequence, reached by jumping rather than stepping
+lfsr.generate_packed(lfsr.state_at(SEED, OFFSET), 127)
+fragment: BitStream = lfsr.bitstream
+
+# a short register, where the answer can be checked by substring search
+short: LFSR = LFSR(degree=16, tap_positions=[0, 2, 3, 5])
+short.generate_packed(0xACE1, 2**16)
+short_fragment: str = short.stream[40000:40040]
+
+# X^8 + X^6 + X^4 + X^2 + 1 = (X^4 + X^3 + X^2 + X + 1)^2, so the log is lifted from the factor
+repeated: LFSR = LFSR(degree=8, tap_positions=[0, 2, 4, 6])
+repeated.generate(0x5A, 600)
+repeated_fragment: str = repeated.stream[37:50]
+
+# no tap at position 0: bits 0 and 1 never feed back, so only offsets 0 and 1 see them
+pre_period: LFSR = LFSR(degree=8, tap_positions=[2, 5])
+pre_period.generate(0xC3, 600)
+
+def main():
+    print(f"""
+    fragment {fragment!r}\n
+    found at offset {lfsr.find_offset(fragment, SEED)}, generated at {OFFSET}\n
+    a corrupted fragment is not found: {lfsr.find_offset(fragment[:100] ^ BitStream.from_str('1' + '0'*99), SEED)}\n
+    degree 16: offset {short.find_offset(short_fragment, 0xACE1)}, substring search {short.stream.find(short_fragment)}\n
+    repeated factor: offset {repeated.find_offset(repeated_fragment, 0x5A)}, substring search {repeated.stream.find(repeated_fragment)}\n
+    taps without 0: offsets {[pre_period.find_offset(pre_period.stream[n:n+10], 0xC3) for n in (0, 1, 2, 300)]},
+    substring search {[pre_period.stream.find(pre_period.stream[n:n+10]) for n in (0, 1, 2, 300)]}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,23 @@
+from context import LFSR
+
+SEED = 0b110111001
+ITERATIONS = 1000000
+try:
+    DEGREE: int = len(bin(SEED))-2
+except TypeError:
+    DEGREE: int = len(SEED) 
+
+TAPS: list[int] = [1, 4]
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(bitseq=SEED, iterations=ITERATIONS)
+
+def main():
+    print(f"""
+    bits generated: {lfsr.stream_length}\n
+    packed size: {len(lfsr.packed_stream)} bytes\n
+    first bytes: {lfsr.packed_stream[:16].hex()}
+    """)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+from context import LFSR
+
+SEED = 0b110111001
+DEGREE: int = len(bin(SEED))-2
+TAPS: list[int] = [0, 4]
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.find_period(bitseq=SEED)
+seed_period = lfsr.period
+lfsr.find_period()
+
+LARGE_DEGREE: int = 607
+LARGE_TAPS: list[int] = [0, 273]
+large: LFSR = LFSR(degree=LARGE_DEGREE, tap_positions=LARGE_TAPS)
+large.find_period()
+
+def main():
+    print(f"""
+    feedback polynomial: {lfsr.feedback_polynomial}\n
+    period of seed {format(SEED, f'0{DEGREE}b')}: {seed_period}\n
+    lcm of cycle lengths: {lfsr.period}\n
+    primitive: {lfsr.primitive}\n
+    degree {LARGE_DEGREE} with taps {LARGE_TAPS} primitive: {large.primitive}, period 2^{LARGE_DEGREE} - 1: {large.period == 2**LARGE_DEGREE - 1}
+    """)
+
+if __name__ == '__main__':
+    main()
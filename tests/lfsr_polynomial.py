@@ -0,0 +1,24 @@
+import sys
+from context import LFSR, MultiLFSR
+
+DEGREE: int = 31
+
+# sympy is only imported here, on first access to feedback_polynomial_sp
+imported_before: bool = 'sympy' in sys.modules
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=[0, 3, 13])
+same_taps: LFSR = LFSR(degree=DEGREE, tap_positions=[0, 3, 13])
+multilfsr: MultiLFSR = MultiLFSR(
+    degree=DEGREE, lfsr_list=[lfsr, LFSR(degree=DEGREE, tap_positions=[0, 6, 27])]
+)
+
+def main():
+    print(f"""
+    sympy imported with the library: {imported_before}\n
+    feedback polynomial: {lfsr.feedback_polynomial}\n
+    sympy form: {lfsr.feedback_polynomial_sp}\n
+    shared by LFSRs with the same taps: {lfsr.feedback_polynomial_sp is same_taps.feedback_polynomial_sp}\n
+    multi-LFSR polynomials: {multilfsr.feedback_polynomials_sp}
+    """)
+
+if __name__ == '__main__':
+    main()
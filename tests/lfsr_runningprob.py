@@ -0,0 +1,22 @@
+from context import LFSR
+
+SEED = 0b110111001
+ITERATIONS = 1000000
+try:
+    DEGREE: int = len(bin(SEED))-2
+except TypeError:
+    DEGREE: int = len(SEED) 
+
+TAPS: list[int] = [1, 4]
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(bitseq=SEED, iterations=ITERATIONS, log=True)
+lfsr.running_probability(max_points=10)
+
+def main():
+    for x, y in zip(lfsr.running_xdata, lfsr.running_ydata):
+        print(f"state {x}: probability bit = 1 is {y} %")
+    lfsr.randomness_plot(max_points=5000)
+
+if __name__ == '__main__':
+    main()
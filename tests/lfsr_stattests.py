@@ -0,0 +1,22 @@
+from context import LFSR
+
+ITERATIONS: int = 10**6
+
+# maximal length, period 2^31 - 1 well beyond the stream
+lfsr: LFSR = LFSR(degree=31, tap_positions=[0, 3])
+lfsr.generate_packed(0x2545F491, ITERATIONS)
+lfsr.statistical_tests(lags=(1, 31))
+
+# at most 2^9 states, so the stream soon cycles
+short: LFSR = LFSR(degree=9, tap_positions=[1, 4])
+short.generate_packed(0b110111001, ITERATIONS)
+short.statistical_tests(tests=['frequency', 'runs', 'spectral'])
+
+def main():
+    for name, results in [('degree 31 maximal', lfsr.test_results), ('degree 9', short.test_results)]:
+        print(f"\n    {name}:")
+        for test, result in results.items():
+            print(f"    {test}: p = {result.p_value:.4f}, {'pass' if result.passed else 'FAIL'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+from context import LFSR, StreamAnalyser
+
+SEED = 0b110111001
+ITERATIONS = 10000
+try:
+    DEGREE: int = len(bin(SEED))-2
+except TypeError:
+    DEGREE: int = len(SEED) 
+
+TAPS: list[int] = [1, 4]
+CHUNK: int = 1000 # bits per chunk
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(bitseq=SEED, iterations=ITERATIONS)
+
+analyser: StreamAnalyser = StreamAnalyser()
+packed: bytes = lfsr.packed_stream
+for start in range(0, len(packed), CHUNK // 8):
+    chunk: bytes = packed[start:start + CHUNK // 8]
+    nbits: int = min(CHUNK, lfsr.stream_length - 8*start)
+    analyser.update(chunk, nbits=nbits)
+analyser.randomness(SIG_FIGS=2)
+
+def main():
+    print(f"""
+    bits received: {analyser.stream_length}\n
+    linear complexity: {analyser.linear_complexity}\n
+    complexity profile: {analyser.profile}\n
+    tap positions: {analyser.tap_positions}
+    """)
+    for k, v in analyser.randomness_dict.items():
+        print(f"probability of {k} = {v}")
+    for k, v in analyser.LaplaceSuccession.items():
+        print(f"Laplace succession probability of {k} = {v}")
+
+if __name__ == '__main__':
+    main()
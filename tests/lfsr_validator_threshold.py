@@ -0,0 +1,27 @@
+from context import LFSR, Validator
+
+ITERATIONS: int = 10**6
+DEGREE: int = 61
+TAPS: list[int] = [0, 1, 2, 5]
+THRESHOLD: int = 1000
+
+lfsr: LFSR = LFSR(degree=DEGREE, tap_positions=TAPS)
+lfsr.generate_packed(0x5DEECE66D, ITERATIONS)
+
+# one right tap set among dozens of wrong ones, each dropped once THRESHOLD bits mismatch
+candidates: list[list[int]] = [[0, k] for k in range(1, 40)] + [TAPS]
+validators: list[Validator] = []
+for taps in candidates:
+    validator: Validator = Validator(stream=lfsr.bitstream, tap_positions=taps, degree=DEGREE, threshold=THRESHOLD)
+    validator.validate()
+    validators += [validator]
+
+def main():
+    for validator in validators[-3:]:
+        print(f"""
+    taps {validator.tap_positions}: {validator.hamming_length} mismatches in {validator.compared_length} bits compared,
+    first divergence at bit {validator.first_divergence}, stopped early: {validator.exceeded}
+        """)
+
+if __name__ == '__main__':
+    main()